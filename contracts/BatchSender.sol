@@ -0,0 +1,38 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity 0.8.13;
+
+import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import "@openzeppelin/contracts/token/ERC20/utils/SafeERC20.sol";
+
+/**
+ * @title Batch token sender used to airdrop balances to many holders in a handful of transactions.
+ */
+contract BatchSender {
+    using SafeERC20 for IERC20;
+
+    // Event to emit whenever a batch of transfers is sent.
+    event BatchSent(address indexed token, address indexed sender, uint256 recipientCount, uint256 totalAmount);
+
+    /**
+    @dev Function to send tokens from the caller's wallet to many recipients in one transaction. The caller must first approve this
+    * contract to spend at least the sum of the amounts. Tokens move straight from the caller to each recipient (instead of through
+    * this contract) so OBURN sees the owner as the sender, which is exempt from fees and can transfer before trading is enabled.
+    * Transfers go through SafeERC20, so tokens that return false (or nothing) instead of reverting can't fail silently.
+    @param token the token being sent
+    @param recipients the addresses receiving tokens
+    @param amounts the amount of tokens (in wei) each recipient receives
+    */
+    function batchTransfer(IERC20 token, address[] calldata recipients, uint256[] calldata amounts) external {
+        require(recipients.length == amounts.length, "Recipients and amounts must be the same length.");
+        require(recipients.length > 0, "At least one recipient must be supplied.");
+
+        uint256 totalAmount = 0;
+        for (uint256 i; i < recipients.length; i++) {
+            token.safeTransferFrom(msg.sender, recipients[i], amounts[i]);
+            totalAmount += amounts[i];
+        }
+
+        emit BatchSent(address(token), msg.sender, recipients.length, totalAmount);
+    }
+}
@@ -4,10 +4,12 @@ pragma solidity 0.8.13;
 
 
 import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import "@openzeppelin/contracts/token/ERC20/extensions/draft-IERC20Permit.sol";
 import "@openzeppelin/contracts/access/Ownable.sol";
 import "@openzeppelin/contracts/security/Pausable.sol";
 import "./oburn.sol";
 import "../interfaces/IUniswapV2Router02.sol";
+import "../interfaces/IUniswapV2Pair.sol";
 
 contract BurnSwap is Pausable, Ownable {
     // Mapping to determine which addresses are exempt from the BUSD fee taken upon buys and sells in this contract.
@@ -34,6 +36,20 @@ contract BurnSwap is Pausable, Ownable {
     // Address of the OBURN pair.
     address public quickSwapPair;
 
+    // Whether trades swap on the pair directly instead of going through the router. Kept next to the pair address so
+    // both are read with one storage load.
+    bool public directPairSwaps = false;
+
+    // Whether BUSD is token0 of the pair, read from the pair when direct swaps are enabled.
+    bool private _busdIsToken0;
+
+    // Swap fee charged by the pair in basis points (30 is 0.3%), used to compute amounts for direct swaps.
+    uint16 public pairSwapFee = 30;
+
+    // Whether the fees taken from each address are stored in addressToBUSDCollected and addressToOBURNBurnt. When
+    // disabled only the totals are stored, and per-address totals are rebuilt from the fees in the trade events.
+    bool public perUserFeeAccounting = true;
+
     // Address of the dead wallet to send OBURN on sells for burning.
     address public deadWallet = 0x000000000000000000000000000000000000dEaD;
 
@@ -49,11 +65,11 @@ contract BurnSwap is Pausable, Ownable {
     // Event to emit whenever someone is added or removed from the blacklist.
     event AddOrRemoveUserFromBlacklist(address indexed user, bool indexed blacklisted);
 
-    // Event to emit whenever OBURN is bought with BUSD.
-    event oburnBuy(address indexed user, uint256 oburnAmount, uint256 busdAmount);
+    // Event to emit whenever OBURN is bought with BUSD, with the BUSD fee taken from the buyer.
+    event oburnBuy(address indexed user, uint256 oburnAmount, uint256 busdAmount, uint256 busdFee);
 
-    // Event to emit whenever OBURN is sold for BUSD.
-    event oburnSell(address indexed user, uint256 oburnAmount, uint256 busdAmount);
+    // Event to emit whenever OBURN is sold for BUSD, with the OBURN burnt from the seller.
+    event oburnSell(address indexed user, uint256 oburnAmount, uint256 busdAmount, uint256 oburnBurnt);
 
     constructor(address initRouterAddress, address initOBURNPairAddress, address payable initOBURNAddress, address initBUSDAddress) {
         quickSwapRouter = IUniswapV2Router02(initRouterAddress);
@@ -84,21 +100,24 @@ contract BurnSwap is Pausable, Ownable {
         uint256 amountBUSDNeeded = amountBUSD;
         uint256 oburnBuyFee = _oburn.buyFee();
         uint[] memory amounts = new uint[](2);
+        bool directSwap = directPairSwaps;
 
         if (amountBUSD == 0) {
-            amounts = quickSwapRouter.getAmountsIn(amountOBURN, path);
+            amounts = directSwap ? _getPairAmountsIn(amountOBURN, path) : quickSwapRouter.getAmountsIn(amountOBURN, path);
             amountBUSDNeeded = amounts[0] * ((100 + slippage) / 100);
         }
 
         uint256 amountBUSDAfterTax = amountBUSDNeeded;
+        uint256 busdFee = 0;
         if (!_addressesExemptFromFees[msg.sender]) {
-            addressToBUSDCollected[msg.sender] += amountBUSDNeeded * oburnBuyFee / 100;
-            BUSDCollected += amountBUSDNeeded * oburnBuyFee / 100;
+            busdFee = amountBUSDNeeded * oburnBuyFee / 100;
+            if (perUserFeeAccounting) {
+                addressToBUSDCollected[msg.sender] += busdFee;
+            }
+            BUSDCollected += busdFee;
             amountBUSDAfterTax = amountBUSDNeeded * (100 - oburnBuyFee) / 100;
         }
 
-        _busd.transferFrom(msg.sender, address(this), amountBUSDNeeded);
-
         if (amountBUSD > 0) {
             uint256 minimumOBURNNeeded = 0;
 
@@ -111,13 +130,20 @@ contract BurnSwap is Pausable, Ownable {
                 }
             }
 
-            amounts = quickSwapRouter.swapExactTokensForTokens(
-                amountBUSDAfterTax,
-                minimumOBURNNeeded,
-                path,
-                address(this),
-                block.timestamp
-            );
+            if (directSwap) {
+                amounts = _getPairAmountsOut(amountBUSDAfterTax, path);
+                require(amounts[1] >= minimumOBURNNeeded, "Insufficient output amount.");
+            }
+            else {
+                _busd.transferFrom(msg.sender, address(this), amountBUSDNeeded);
+                amounts = quickSwapRouter.swapExactTokensForTokens(
+                    amountBUSDAfterTax,
+                    minimumOBURNNeeded,
+                    path,
+                    address(this),
+                    block.timestamp
+                );
+            }
         }
         else {
             uint256 amountOBURNOut = amountOBURN;
@@ -125,22 +151,38 @@ contract BurnSwap is Pausable, Ownable {
                 amountOBURNOut = amountOBURN * (100 - oburnBuyFee) / 100;
             }
 
-            amounts = quickSwapRouter.swapTokensForExactTokens(
-                amountOBURNOut,
-                amountBUSDAfterTax,
-                path,
-                address(this),
-                block.timestamp
-            );            
+            if (directSwap) {
+                amounts = _getPairAmountsIn(amountOBURNOut, path);
+                require(amounts[0] <= amountBUSDAfterTax, "Excessive input amount.");
+            }
+            else {
+                _busd.transferFrom(msg.sender, address(this), amountBUSDNeeded);
+                amounts = quickSwapRouter.swapTokensForExactTokens(
+                    amountOBURNOut,
+                    amountBUSDAfterTax,
+                    path,
+                    address(this),
+                    block.timestamp
+                );
+            }
         }
 
-        _oburn.transfer(msg.sender, amounts[1]);
-
-        if (amounts[0] < amountBUSDAfterTax) {
+        if (directSwap) {
+            // BUSD goes straight from the buyer to the pair and only the fee comes to this contract, so there is
+            // nothing to refund. OBURN still comes through this contract, as OnlyBurns taxes transfers from the pair.
+            _busd.transferFrom(msg.sender, quickSwapPair, amounts[0]);
+            if (amountBUSDNeeded > amountBUSDAfterTax) {
+                _busd.transferFrom(msg.sender, address(this), amountBUSDNeeded - amountBUSDAfterTax);
+            }
+            _pairSwap(path[0], amounts[1], address(this));
+        }
+        else if (amounts[0] < amountBUSDAfterTax) {
             _busd.transfer(msg.sender, amountBUSDAfterTax - amounts[0]);
         }
 
-        emit oburnBuy(msg.sender, amounts[0], amounts[1]);
+        _oburn.transfer(msg.sender, amounts[1]);
+
+        emit oburnBuy(msg.sender, amounts[1], amounts[0], busdFee);
     }
 
     /**
@@ -150,6 +192,39 @@ contract BurnSwap is Pausable, Ownable {
     @param slippage the slippage for the OBURN sell. 5% is 5, 10% is 10, etc
     */
     function sellOBURN(uint256 amountOBURN, uint256 amountBUSD, uint256 slippage) external whenNotPaused {
+        _sellOBURN(amountOBURN, amountBUSD, slippage);
+    }
+
+    /**
+    @dev Function to sell OBURN with this contract without a separate approve transaction - the OBURN allowance is set with an EIP-2612 permit signed by the seller.
+    * The permit is skipped if it fails (e.g. someone already submitted it), in which case the allowance it set is used.
+    @param amountOBURN the amount of OBURN to sell - if 0, just sell the amount of BUSD supplied
+    @param amountBUSD the amount of BUSD to sell (slippage factored in during sell) - if 0, sell the BUSD necessary to get the OBURN amount specified
+    @param slippage the slippage for the OBURN sell. 5% is 5, 10% is 10, etc
+    @param permitAmount the OBURN allowance signed in the permit
+    @param deadline the deadline signed in the permit
+    @param v the v value of the permit signature
+    @param r the r value of the permit signature
+    @param s the s value of the permit signature
+    */
+    function sellOBURNWithPermit(
+        uint256 amountOBURN,
+        uint256 amountBUSD,
+        uint256 slippage,
+        uint256 permitAmount,
+        uint256 deadline,
+        uint8 v,
+        bytes32 r,
+        bytes32 s
+    ) external whenNotPaused {
+        try IERC20Permit(address(_oburn)).permit(msg.sender, address(this), permitAmount, deadline, v, r, s) {} catch {}
+        _sellOBURN(amountOBURN, amountBUSD, slippage);
+    }
+
+    /**
+    @dev Sells OBURN for the caller, see sellOBURN.
+    */
+    function _sellOBURN(uint256 amountOBURN, uint256 amountBUSD, uint256 slippage) private {
         require(slippage < 100, "Slippage must be less than 100.");
         require(amountOBURN > 0 || amountBUSD > 0, "Either the amount of OBURN to buy or the amount of BUSD to sell must be specified.");
         require(!_blacklistedAddresses[msg.sender], "You have been blacklisted from trading OBURN through this contract.");
@@ -161,20 +236,25 @@ contract BurnSwap is Pausable, Ownable {
         uint256 amountOBURNNeeded = amountOBURN;
         uint256 oburnSellFee = _oburn.sellFee();
         uint[] memory amounts = new uint[](2);
+        bool directSwap = directPairSwaps;
 
         if (amountOBURN == 0) {
-            amounts = quickSwapRouter.getAmountsIn(amountBUSD, path);
+            amounts = directSwap ? _getPairAmountsIn(amountBUSD, path) : quickSwapRouter.getAmountsIn(amountBUSD, path);
             amountOBURNNeeded = amounts[0] * ((100 + slippage) / 100);
         }
 
         _oburn.transferFrom(msg.sender, address(this), amountOBURNNeeded);
 
         uint256 amountOBURNAfterTax = amountOBURNNeeded;
+        uint256 oburnBurnt = 0;
         if (!_addressesExemptFromFees[msg.sender]) {
             amountOBURNAfterTax = amountOBURNNeeded * (100 - oburnSellFee) / 100;
-            addressToOBURNBurnt[msg.sender] += amountOBURNNeeded * oburnSellFee / 100;
-            OBURNBurnt += amountOBURNNeeded * oburnSellFee / 100;
-            _oburn.transfer(deadWallet, amountOBURNNeeded * oburnSellFee / 100);
+            oburnBurnt = amountOBURNNeeded * oburnSellFee / 100;
+            if (perUserFeeAccounting) {
+                addressToOBURNBurnt[msg.sender] += oburnBurnt;
+            }
+            OBURNBurnt += oburnBurnt;
+            _oburn.transfer(deadWallet, oburnBurnt);
         }
 
         if (amountOBURN > 0) {
@@ -189,13 +269,19 @@ contract BurnSwap is Pausable, Ownable {
                 }
             }
 
-            amounts = quickSwapRouter.swapExactTokensForTokens(
-                amountOBURNAfterTax,
-                minimumBUSDNeeded,
-                path,
-                address(this),
-                block.timestamp
-            );
+            if (directSwap) {
+                amounts = _getPairAmountsOut(amountOBURNAfterTax, path);
+                require(amounts[1] >= minimumBUSDNeeded, "Insufficient output amount.");
+            }
+            else {
+                amounts = quickSwapRouter.swapExactTokensForTokens(
+                    amountOBURNAfterTax,
+                    minimumBUSDNeeded,
+                    path,
+                    address(this),
+                    block.timestamp
+                );
+            }
         }
         else {
             uint256 amountBUSDOut = amountBUSD;
@@ -203,22 +289,36 @@ contract BurnSwap is Pausable, Ownable {
                 amountBUSDOut = amountBUSD * (100 - oburnSellFee) / 100;
             }
 
-            amounts = quickSwapRouter.swapTokensForExactTokens(
-                amountBUSDOut,
-                amountOBURNAfterTax,
-                path,
-                address(this),
-                block.timestamp
-            );             
+            if (directSwap) {
+                amounts = _getPairAmountsIn(amountBUSDOut, path);
+                require(amounts[0] <= amountOBURNAfterTax, "Excessive input amount.");
+            }
+            else {
+                amounts = quickSwapRouter.swapTokensForExactTokens(
+                    amountBUSDOut,
+                    amountOBURNAfterTax,
+                    path,
+                    address(this),
+                    block.timestamp
+                );
+            }
         }
 
-        _busd.transfer(msg.sender, amounts[1]);
+        if (directSwap) {
+            // The pair sends BUSD straight to the seller. OBURN still goes through this contract, as OnlyBurns taxes
+            // transfers to the pair.
+            _oburn.transfer(quickSwapPair, amounts[0]);
+            _pairSwap(path[0], amounts[1], msg.sender);
+        }
+        else {
+            _busd.transfer(msg.sender, amounts[1]);
+        }
 
         if (amounts[0] < amountOBURNAfterTax) {
             _oburn.transfer(msg.sender, amountOBURNAfterTax - amounts[0]);
         }        
 
-        emit oburnSell(msg.sender, amounts[1], amounts[0]);
+        emit oburnSell(msg.sender, amounts[0], amounts[1], oburnBurnt);
     }
 
     /**
@@ -238,6 +338,27 @@ contract BurnSwap is Pausable, Ownable {
         quickSwapRouter = IUniswapV2Router02(newQuickSwapRouterAddress);
     }
 
+    /**
+    @dev Only owner function to swap directly on the pair instead of through the router.
+    @param enabled boolean to determine if trades swap directly on the pair
+    @param swapFee the swap fee charged by the pair in basis points (30 is 0.3%)
+    */
+    function setDirectPairSwaps(bool enabled, uint16 swapFee) external onlyOwner {
+        require(swapFee < 10000, "Swap fee must be less than 10000.");
+
+        directPairSwaps = enabled;
+        pairSwapFee = swapFee;
+        _busdIsToken0 = IUniswapV2Pair(quickSwapPair).token0() == address(_busd);
+    }
+
+    /**
+    @dev Only owner function to turn the per-address fee totals on or off. The global totals are always kept.
+    @param enabled boolean to determine if addressToBUSDCollected and addressToOBURNBurnt are updated on each trade
+    */
+    function setPerUserFeeAccounting(bool enabled) external onlyOwner {
+        perUserFeeAccounting = enabled;
+    }
+
     /**
     @dev Only owner function to pause the exchange.
     */
@@ -295,4 +416,51 @@ contract BurnSwap is Pausable, Ownable {
     function getAddressBlacklisted(address blacklistedAddress) public view returns (bool) {
         return _blacklistedAddresses[blacklistedAddress];
     }
-}
\ No newline at end of file
+
+    /**
+    @dev Returns the pair's reserves of the first and second token of a two token path.
+    */
+    function _getPairReserves(address[] memory path) private view returns (uint256 reserveIn, uint256 reserveOut) {
+        (uint112 reserve0, uint112 reserve1, ) = IUniswapV2Pair(quickSwapPair).getReserves();
+        if ((path[0] == address(_busd)) == _busdIsToken0) {
+            return (reserve0, reserve1);
+        }
+        return (reserve1, reserve0);
+    }
+
+    /**
+    @dev Same as the router's getAmountsOut for a two token path, computed from the pair's reserves.
+    */
+    function _getPairAmountsOut(uint256 amountIn, address[] memory path) private view returns (uint[] memory amounts) {
+        (uint256 reserveIn, uint256 reserveOut) = _getPairReserves(path);
+        uint256 amountInWithFee = amountIn * (10000 - pairSwapFee);
+
+        amounts = new uint[](2);
+        amounts[0] = amountIn;
+        amounts[1] = amountInWithFee * reserveOut / (reserveIn * 10000 + amountInWithFee);
+    }
+
+    /**
+    @dev Same as the router's getAmountsIn for a two token path, computed from the pair's reserves.
+    */
+    function _getPairAmountsIn(uint256 amountOut, address[] memory path) private view returns (uint[] memory amounts) {
+        (uint256 reserveIn, uint256 reserveOut) = _getPairReserves(path);
+        require(amountOut < reserveOut, "Insufficient liquidity.");
+
+        amounts = new uint[](2);
+        amounts[0] = reserveIn * amountOut * 10000 / ((reserveOut - amountOut) * (10000 - pairSwapFee)) + 1;
+        amounts[1] = amountOut;
+    }
+
+    /**
+    @dev Swaps on the pair, which must already hold the input, sending the output to the given address.
+    */
+    function _pairSwap(address tokenIn, uint256 amountOut, address to) private {
+        if ((tokenIn == address(_busd)) == _busdIsToken0) {
+            IUniswapV2Pair(quickSwapPair).swap(0, amountOut, to, new bytes(0));
+        }
+        else {
+            IUniswapV2Pair(quickSwapPair).swap(amountOut, 0, to, new bytes(0));
+        }
+    }
+}
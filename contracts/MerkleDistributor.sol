@@ -0,0 +1,108 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity 0.8.13;
+
+import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import "@openzeppelin/contracts/token/ERC20/utils/SafeERC20.sol";
+import "@openzeppelin/contracts/access/Ownable.sol";
+import "@openzeppelin/contracts/security/Pausable.sol";
+import "@openzeppelin/contracts/utils/cryptography/MerkleProof.sol";
+
+/**
+ * @title Merkle claim distributor - holders pull their migrated balance instead of the owner pushing one transfer per holder.
+ * The tree is built off-chain by scripts/merkle.py. Each leaf is keccak256(abi.encodePacked(account, amount)) and pairs
+ * are hashed in sorted order, which is what OpenZeppelin's MerkleProof expects. Leaf amounts are each account's total
+ * entitlement, and claims are tracked per account across roots, so a new root only pays out what an account hasn't
+ * already claimed. Leaves carry no index, since an account appears in a tree only once and claims are keyed by account.
+ */
+contract MerkleDistributor is Pausable, Ownable {
+    using SafeERC20 for IERC20;
+
+    // Token being distributed.
+    IERC20 public token;
+
+    // Root of the Merkle tree of (account, amount) claims.
+    bytes32 public merkleRoot;
+
+    // Amount (in wei) each account has claimed so far, under any Merkle root.
+    mapping(address => uint256) public claimedAmount;
+
+    // Event to emit whenever the Merkle root is updated.
+    event MerkleRootUpdated(bytes32 indexed previousRoot, bytes32 indexed newRoot);
+
+    // Event to emit whenever a holder claims their tokens.
+    event Claimed(address indexed account, uint256 amount);
+
+    // Event to emit whenever tokens are withdrawn from the contract.
+    event tokensWithdraw(address indexed tokenAddress, uint256 tokenAmount);
+
+    constructor(IERC20 initToken, bytes32 initMerkleRoot) {
+        token = initToken;
+        merkleRoot = initMerkleRoot;
+    }
+
+    /**
+    @dev Function to check if an account has already claimed the full amount of a leaf.
+    @param account the address in the leaf
+    @param amount the amount (in wei) in the leaf
+    @return boolean which represents whether or not the claim has been made
+    */
+    function isClaimed(address account, uint256 amount) public view returns (bool) {
+        return claimedAmount[account] >= amount;
+    }
+
+    /**
+    @dev Function for holders to claim their tokens. Anyone can submit a claim on behalf of a holder since the tokens always go to the account in the leaf.
+    * Only the part of the leaf amount the account hasn't claimed yet (under this or any earlier root) is sent.
+    @param account the address receiving the tokens
+    @param amount the account's total entitlement (in wei) in the leaf
+    @param merkleProof the sibling hashes from the leaf up to the root
+    */
+    function claim(address account, uint256 amount, bytes32[] calldata merkleProof) external whenNotPaused {
+        uint256 alreadyClaimed = claimedAmount[account];
+        require(alreadyClaimed < amount, "Tokens have already been claimed for this account.");
+
+        bytes32 leaf = keccak256(abi.encodePacked(account, amount));
+        require(MerkleProof.verify(merkleProof, merkleRoot, leaf), "Invalid Merkle proof.");
+
+        claimedAmount[account] = amount;
+        token.safeTransfer(account, amount - alreadyClaimed);
+
+        emit Claimed(account, amount - alreadyClaimed);
+    }
+
+    /**
+    @dev Only owner function to set a new Merkle root. Claims are tracked per account, so an account that already claimed under an earlier
+    * root only receives the difference if the new root gives it a larger amount.
+    @param newMerkleRoot the root of the new Merkle tree
+    */
+    function setMerkleRoot(bytes32 newMerkleRoot) external onlyOwner {
+        emit MerkleRootUpdated(merkleRoot, newMerkleRoot);
+        merkleRoot = newMerkleRoot;
+    }
+
+    /**
+    @dev Only owner function to pause claims.
+    */
+    function pauseClaims() external onlyOwner {
+        _pause();
+    }
+
+    /**
+    @dev Only owner function to unpause claims.
+    */
+    function unpauseClaims() external onlyOwner {
+        _unpause();
+    }
+
+    /**
+    @dev Only owner function to withdraw unclaimed tokens (or anything sent to the contract by accident).
+    @param tokenAddress the address of the token being withdrawn
+    @param amount the amount of tokens to withdraw
+    */
+    function withdrawTokens(address tokenAddress, uint256 amount) external onlyOwner {
+        require(tokenAddress != address(0), "Token address cannot be the 0 address.");
+        IERC20(tokenAddress).safeTransfer(owner(), amount);
+        emit tokensWithdraw(tokenAddress, amount);
+    }
+}
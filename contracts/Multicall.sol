@@ -0,0 +1,62 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity 0.8.13;
+
+/**
+ * @title Read-only multicall - runs many view calls in a single eth_call so holder balances and flags can be read in bulk.
+ * Every call is made with staticcall, so nothing called through this contract can change state.
+ */
+contract Multicall {
+    struct Call {
+        address target;
+        bytes callData;
+    }
+
+    struct Result {
+        bool success;
+        bytes returnData;
+    }
+
+    /**
+    @dev Function to run a list of view calls, reverting if any of them fails.
+    @param calls the target and encoded call data of each call
+    @return blockNumber the block the calls were made at
+    @return returnData the encoded return data of each call
+    */
+    function aggregate(Call[] calldata calls) external view returns (uint256 blockNumber, bytes[] memory returnData) {
+        blockNumber = block.number;
+        returnData = new bytes[](calls.length);
+
+        for (uint256 i; i < calls.length; i++) {
+            (bool success, bytes memory data) = calls[i].target.staticcall(calls[i].callData);
+            require(success, "Multicall: call failed");
+            returnData[i] = data;
+        }
+    }
+
+    /**
+    @dev Function to run a list of view calls, returning whether each one succeeded along with its return data.
+    @param requireSuccess whether to revert if any call fails
+    @param calls the target and encoded call data of each call
+    @return returnData the success flag and encoded return data of each call
+    */
+    function tryAggregate(bool requireSuccess, Call[] calldata calls) public view returns (Result[] memory returnData) {
+        returnData = new Result[](calls.length);
+
+        for (uint256 i; i < calls.length; i++) {
+            (bool success, bytes memory data) = calls[i].target.staticcall(calls[i].callData);
+            if (requireSuccess) {
+                require(success, "Multicall: call failed");
+            }
+            returnData[i] = Result(success, data);
+        }
+    }
+
+    /**
+    @dev Getter function to return the current block number, so reads can be pinned to the block a batch ran at.
+    @return the current block number
+    */
+    function getBlockNumber() external view returns (uint256) {
+        return block.number;
+    }
+}
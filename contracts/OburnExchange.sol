@@ -3,6 +3,7 @@
 pragma solidity 0.8.13;
 
 import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import "@openzeppelin/contracts/token/ERC20/extensions/draft-IERC20Permit.sol";
 import "@openzeppelin/contracts/access/Ownable.sol";
 import "@openzeppelin/contracts/security/Pausable.sol";
 
@@ -16,9 +17,34 @@ contract OburnExchange is Pausable, Ownable {
     // OBURN token reference - this is the token users will get 1:1 for the TBURN they send in.
     IERC20 public _oburn;
 
+    // Addresses allowed to run batch exchanges for holders who have approved this contract or signed a permit.
+    mapping(address => bool) public operators;
+
+    // Reasons a holder is skipped in a batch exchange.
+    uint8 public constant SKIP_INSUFFICIENT_TBURN = 1;
+    uint8 public constant SKIP_INSUFFICIENT_ALLOWANCE = 2;
+    uint8 public constant SKIP_INSUFFICIENT_OBURN = 3;
+
+    // Permit signed by a holder for a batch exchange - the value signed must be the holder's exchange amount.
+    struct PermitSignature {
+        uint256 deadline;
+        uint8 v;
+        bytes32 r;
+        bytes32 s;
+    }
+
     // Event to emit whenever someone exchanges TBURN for OBURN.
     event TBURNExchanged(address indexed user, uint256 exchangeAmount);
 
+    // Event to emit whenever a holder is skipped in a batch exchange, with one of the SKIP_ reasons.
+    event TBURNExchangeSkipped(address indexed user, uint256 exchangeAmount, uint8 reason);
+
+    // Event to emit whenever an operator runs a batch exchange.
+    event BatchExchanged(address indexed operator, uint256 exchangedCount, uint256 skippedCount, uint256 totalAmount);
+
+    // Event to emit whenever an operator is added or removed.
+    event OperatorUpdated(address indexed operator, bool isOperator);
+
     // Event to emit whenever tokens are withdraw from the contract.
     event tokensWithdraw(address indexed tokenAddress, uint256 tokenAmount);
 
@@ -27,11 +53,129 @@ contract OburnExchange is Pausable, Ownable {
         _oburn = oburn;
     }
 
+    /**
+    @dev Throws if called by an address that isn't an operator or the owner.
+    */
+    modifier onlyOperator() {
+        require(operators[msg.sender] || msg.sender == owner(), "Caller is not an operator.");
+        _;
+    }
+
     /**
     @dev Function for exchanging TBURN for OBURN 1:1. This functionality can be paused.
     @param tburnAmount the amount of TBURN to exchange for OBURN.
     */
     function OBURNExchange(uint256 tburnAmount) external whenNotPaused {
+        _exchange(tburnAmount);
+    }
+
+    /**
+    @dev Function for exchanging TBURN for OBURN 1:1 without a separate approve transaction, for TBURN tokens that support EIP-2612 permits.
+    * The permit is skipped if it fails (e.g. TBURN doesn't support permits or someone already submitted it), in which case an existing allowance is used.
+    @param tburnAmount the amount of TBURN to exchange for OBURN, which is also the allowance signed in the permit
+    @param deadline the deadline signed in the permit
+    @param v the v value of the permit signature
+    @param r the r value of the permit signature
+    @param s the s value of the permit signature
+    */
+    function OBURNExchangeWithPermit(uint256 tburnAmount, uint256 deadline, uint8 v, bytes32 r, bytes32 s) external whenNotPaused {
+        try IERC20Permit(address(_tburn)).permit(msg.sender, address(this), tburnAmount, deadline, v, r, s) {} catch {}
+        _exchange(tburnAmount);
+    }
+
+    /**
+    @dev Operator function for exchanging TBURN for OBURN 1:1 on behalf of many holders who have approved this contract. Holders without enough
+    * TBURN or allowance (or once this contract runs out of OBURN) are skipped with a TBURNExchangeSkipped event instead of reverting the batch.
+    * This functionality can be paused.
+    @param holders the addresses exchanging TBURN, which also receive the OBURN
+    @param amounts the amount of TBURN (in wei) to exchange for each holder
+    */
+    function batchExchange(address[] calldata holders, uint256[] calldata amounts) external whenNotPaused onlyOperator {
+        require(holders.length == amounts.length, "Holders and amounts must be the same length.");
+
+        uint256 oburnAvailable = _oburn.balanceOf(address(this));
+        uint256 exchangedCount;
+        uint256 totalAmount;
+        for (uint256 i; i < holders.length; i++) {
+            if (_tryExchangeFor(holders[i], amounts[i], oburnAvailable - totalAmount)) {
+                exchangedCount++;
+                totalAmount += amounts[i];
+            }
+        }
+
+        emit BatchExchanged(msg.sender, exchangedCount, holders.length - exchangedCount, totalAmount);
+    }
+
+    /**
+    @dev Operator function for exchanging TBURN for OBURN 1:1 on behalf of many holders who have signed EIP-2612 permits for this contract.
+    * Each permit is submitted right before its holder's exchange, and a failing permit is skipped so an existing allowance can still be used.
+    * Holders are skipped the same way as in batchExchange. This functionality can be paused.
+    @param holders the addresses exchanging TBURN, which also receive the OBURN
+    @param amounts the amount of TBURN (in wei) to exchange for each holder, which is also the allowance signed in their permit
+    @param permits the deadline and signature of each holder's permit
+    */
+    function batchExchangeWithPermit(address[] calldata holders, uint256[] calldata amounts, PermitSignature[] calldata permits) external whenNotPaused onlyOperator {
+        require(holders.length == amounts.length && holders.length == permits.length, "Holders, amounts and permits must be the same length.");
+
+        uint256 oburnAvailable = _oburn.balanceOf(address(this));
+        uint256 exchangedCount;
+        uint256 totalAmount;
+        for (uint256 i; i < holders.length; i++) {
+            _tryPermit(holders[i], amounts[i], permits[i]);
+            if (_tryExchangeFor(holders[i], amounts[i], oburnAvailable - totalAmount)) {
+                exchangedCount++;
+                totalAmount += amounts[i];
+            }
+        }
+
+        emit BatchExchanged(msg.sender, exchangedCount, holders.length - exchangedCount, totalAmount);
+    }
+
+    /**
+    @dev Private function for submitting a holder's permit in a batch, ignoring a permit that fails.
+    @param holder the address that signed the permit
+    @param tburnAmount the allowance signed in the permit
+    @param permit the deadline and signature of the permit
+    */
+    function _tryPermit(address holder, uint256 tburnAmount, PermitSignature calldata permit) private {
+        try IERC20Permit(address(_tburn)).permit(holder, address(this), tburnAmount, permit.deadline, permit.v, permit.r, permit.s) {} catch {}
+    }
+
+    /**
+    @dev Private function for exchanging TBURN for OBURN 1:1 for one holder of a batch, skipping the holder instead of reverting if the exchange can't be made.
+    @param holder the address exchanging TBURN
+    @param tburnAmount the amount of TBURN to exchange for OBURN
+    @param oburnAvailable the OBURN this contract has left for the rest of the batch
+    @return whether or not the exchange was made
+    */
+    function _tryExchangeFor(address holder, uint256 tburnAmount, uint256 oburnAvailable) private returns (bool) {
+        uint8 reason;
+        if (oburnAvailable < tburnAmount) {
+            reason = SKIP_INSUFFICIENT_OBURN;
+        } else if (_tburn.balanceOf(holder) < tburnAmount) {
+            reason = SKIP_INSUFFICIENT_TBURN;
+        } else if (_tburn.allowance(holder, address(this)) < tburnAmount) {
+            reason = SKIP_INSUFFICIENT_ALLOWANCE;
+        }
+
+        if (reason != 0) {
+            emit TBURNExchangeSkipped(holder, tburnAmount, reason);
+            return false;
+        }
+
+        _tburn.transferFrom(holder, address(this), tburnAmount);
+        _oburn.transfer(holder, tburnAmount);
+
+        emit TBURNExchanged(holder, tburnAmount);
+
+        return true;
+    }
+
+    /**
+    @dev Private function for exchanging TBURN for OBURN 1:1.
+    @param tburnAmount the amount of TBURN to exchange for OBURN.
+    */
+    function _exchange(uint256 tburnAmount) private {
         require(_tburn.balanceOf(msg.sender) >= tburnAmount, "You don't have enough TBURN to perform this exchange.");
         require(_tburn.allowance(msg.sender, address(this)) >= tburnAmount, "You must first approve this contract to spend your TBURN to exchange it for OBURN.");
         require(_oburn.balanceOf(address(this)) >= tburnAmount, "This contract doesn't have enough OBURN to perform this exchange.");
@@ -42,6 +186,16 @@ contract OburnExchange is Pausable, Ownable {
         emit TBURNExchanged(msg.sender, tburnAmount);
     }
 
+    /**
+    @dev Only owner function to add or remove a batch exchange operator.
+    @param operator the address being updated
+    @param isOperator whether or not the address can run batch exchanges
+    */
+    function setOperator(address operator, bool isOperator) external onlyOwner {
+        operators[operator] = isOperator;
+        emit OperatorUpdated(operator, isOperator);
+    }
+
     /**
     @dev Only owner function to pause the exchange.
     */
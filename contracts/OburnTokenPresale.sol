@@ -14,6 +14,7 @@ import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
 import "@openzeppelin/contracts/utils/Context.sol";
 import "@openzeppelin/contracts/access/Ownable.sol";
 import "@openzeppelin/contracts/security/ReentrancyGuard.sol";
+import "@openzeppelin/contracts/utils/cryptography/MerkleProof.sol";
 
 
 /**
@@ -34,6 +35,8 @@ contract OburnTokenPresale is ReentrancyGuard, Context, Ownable {
     uint256 private _usdcRaised;
 
     mapping(address => bool) private _whitelistedAddresses;
+    // Root of a Merkle tree of whitelisted addresses (built by scripts/merkle.py), checked alongside _whitelistedAddresses
+    bytes32 private _whitelistMerkleRoot;
     mapping(address => uint256) private _whitelistAddressSpend;
     mapping(address => uint256) private _OburnPurchased;
     bool private _saleParametersLocked = false;
@@ -58,6 +61,9 @@ contract OburnTokenPresale is ReentrancyGuard, Context, Ownable {
      */
     event TokensPurchased(address indexed purchaser, address indexed beneficiary, uint256 value, uint256 amount);
 
+    // Event to emit whenever the whitelist Merkle root is updated.
+    event WhitelistMerkleRootUpdated(bytes32 indexed previousRoot, bytes32 indexed newRoot);
+
     /**
      * @param preSaleWallet Address where collected funds will be forwarded to
      * @param preSaleToken Address of the token being sold
@@ -87,8 +93,9 @@ contract OburnTokenPresale is ReentrancyGuard, Context, Ownable {
      @dev Internal function to validate the presale purchase.
      @param beneficiary the address of the user receiving tokens from the presale purchase
      @param usdcAmount the amount of USDC sent in for the presale purchase
+     @param proof Merkle proof of the beneficiary's whitelist leaf (empty if the beneficiary is whitelisted in storage)
      */
-    function _preValidatePurchase(address beneficiary, uint256 usdcAmount) internal view {
+    function _preValidatePurchase(address beneficiary, uint256 usdcAmount, bytes32[] memory proof) internal view {
         require(beneficiary != address(0), "Beneficiary is the zero address");
         require(usdcAmount != 0, "usdcAmount is 0");
         require(_usdc.allowance(_msgSender(), address(this)) >= usdcAmount, "Sender hasn't allowed this contract to spend enough USDC for this presale purchase.");
@@ -97,7 +104,7 @@ contract OburnTokenPresale is ReentrancyGuard, Context, Ownable {
         require(_msgSender() == beneficiary, "Sender address must also be the beneficiary address");
 
         if (_whitelistSaleActive) {
-            _validateWhitelistSale(beneficiary, usdcAmount);
+            _validateWhitelistSale(beneficiary, usdcAmount, proof);
         } else {
             _validatePublicSale(beneficiary, usdcAmount);
         }
@@ -107,9 +114,10 @@ contract OburnTokenPresale is ReentrancyGuard, Context, Ownable {
      * @dev Validation specific to the whitelist portion of the sale
      * @param beneficiary address receiving the OBURN
      * @param usdcAmount Value in USDC involved in the purchase
+     * @param proof Merkle proof of the beneficiary's whitelist leaf (empty if the beneficiary is whitelisted in storage)
      */
-    function _validateWhitelistSale(address beneficiary, uint256 usdcAmount) internal view {
-        require(checkAddressWhitelisted(beneficiary), "Beneficiary address is not whitelisted");
+    function _validateWhitelistSale(address beneficiary, uint256 usdcAmount, bytes32[] memory proof) internal view {
+        require(checkAddressWhitelisted(beneficiary) || checkWhitelistProof(beneficiary, proof), "Beneficiary address is not whitelisted");
 
         uint256 tokens = _getTokenAmount(usdcAmount);
 
@@ -172,7 +180,28 @@ contract OburnTokenPresale is ReentrancyGuard, Context, Ownable {
      * @param beneficiary Recipient of the token purchase
      */
     function buyTokens(address beneficiary, uint256 usdcAmount) external nonReentrant {
-        _preValidatePurchase(beneficiary, usdcAmount);
+        _buyTokens(beneficiary, usdcAmount, new bytes32[](0));
+    }
+
+    /**
+     * @dev Function for purchasing tokens in the whitelist sale with a Merkle proof instead of a stored whitelist entry.
+     * This function has a non-reentrancy guard, so it shouldn't be called by
+     * another `nonReentrant` function.
+     * @param beneficiary Recipient of the token purchase
+     * @param proof Merkle proof of the beneficiary's leaf in the whitelist Merkle tree
+     */
+    function buyTokens(address beneficiary, uint256 usdcAmount, bytes32[] calldata proof) external nonReentrant {
+        _buyTokens(beneficiary, usdcAmount, proof);
+    }
+
+    /**
+     * @dev Validates and executes a presale purchase.
+     * @param beneficiary Recipient of the token purchase
+     * @param usdcAmount the amount of USDC spent on the presale purchase
+     * @param proof Merkle proof of the beneficiary's whitelist leaf (empty if the beneficiary is whitelisted in storage)
+     */
+    function _buyTokens(address beneficiary, uint256 usdcAmount, bytes32[] memory proof) private {
+        _preValidatePurchase(beneficiary, usdcAmount, proof);
 
         // calculate token amount to be sent
         uint256 tokens = _getTokenAmount(usdcAmount);
@@ -390,6 +419,21 @@ contract OburnTokenPresale is ReentrancyGuard, Context, Ownable {
         _whitelistedAddresses[user] = false;
     }
 
+    function getWhitelistMerkleRoot() external view returns (bytes32) {
+        return _whitelistMerkleRoot;
+    }
+
+    /**
+    @dev Only owner function to whitelist every address in a Merkle tree with a single transaction. Leaves are
+    keccak256(abi.encodePacked(address)), and buyers pass their proof to buyTokens. Setting the root to zero turns the
+    Merkle whitelist off, addresses whitelisted in storage are unaffected.
+    @param newMerkleRoot the root of the whitelist Merkle tree
+    */
+    function setWhitelistMerkleRoot(bytes32 newMerkleRoot) external onlyOwner {
+        emit WhitelistMerkleRootUpdated(_whitelistMerkleRoot, newMerkleRoot);
+        _whitelistMerkleRoot = newMerkleRoot;
+    }
+
     /**
     @dev Only owner function to change the token being sold.
     @param newTokenAddress reference to the new token being sold
@@ -417,6 +461,10 @@ contract OburnTokenPresale is ReentrancyGuard, Context, Ownable {
         return _whitelistedAddresses[_msgSender()];
     }
 
+    function singleAddressCheckWhitelistProof(bytes32[] calldata proof) external view returns (bool) {
+        return checkWhitelistProof(_msgSender(), proof);
+    }
+
     function singleAddressCheckOburnAmountPurchased() external view returns (uint256) {
         return _OburnPurchased[_msgSender()];
     }
@@ -428,4 +476,8 @@ contract OburnTokenPresale is ReentrancyGuard, Context, Ownable {
     function checkAddressWhitelisted(address user) private view returns (bool) {
         return _whitelistedAddresses[user];
     }
+
+    function checkWhitelistProof(address user, bytes32[] memory proof) private view returns (bool) {
+        return _whitelistMerkleRoot != bytes32(0) && MerkleProof.verify(proof, _whitelistMerkleRoot, keccak256(abi.encodePacked(user)));
+    }
 }
\ No newline at end of file
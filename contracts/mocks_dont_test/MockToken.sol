@@ -3,13 +3,14 @@
 pragma solidity 0.8.13;
 
 import "@openzeppelin/contracts/token/ERC20/ERC20.sol";
+import "@openzeppelin/contracts/token/ERC20/extensions/draft-ERC20Permit.sol";
 import "@openzeppelin/contracts/access/Ownable.sol";
 
 /**
  * @title Generic token smart contract for testing
  */
-contract MockToken is ERC20, Ownable {
-    constructor() ERC20("GenericToken", "GNRC") {
+contract MockToken is ERC20, ERC20Permit, Ownable {
+    constructor() ERC20("GenericToken", "GNRC") ERC20Permit("GenericToken") {
         _mint(msg.sender, 10 ** 40);
     }
 
@@ -1,16 +1,29 @@
 // SPDX-License-Identifier: MIT
 pragma solidity >=0.8.0 <0.9.0;
 
-import "../../interfaces/Uniswap.sol";
+import "./MockUniswapV2Pair.sol";
 
-contract MockUniswapV2Factory is IUniswapV2Factory {
-    address public _tokenA;
-    address public _tokenB;
+contract MockUniswapV2Factory {
+    mapping(address => mapping(address => address)) public getPair;
+    address[] public allPairs;
+
+    event PairCreated(address indexed token0, address indexed token1, address pair, uint);
+
+    function allPairsLength() external view returns (uint) {
+        return allPairs.length;
+    }
 
     function createPair(address tokenA, address tokenB) external returns (address pair) {
-        _tokenA = tokenA;
-        _tokenB = tokenB;
+        require(tokenA != tokenB, "UniswapV2: IDENTICAL_ADDRESSES");
+        (address token0, address token1) = tokenA < tokenB ? (tokenA, tokenB) : (tokenB, tokenA);
+        require(token0 != address(0), "UniswapV2: ZERO_ADDRESS");
+        require(getPair[token0][token1] == address(0), "UniswapV2: PAIR_EXISTS");
+
+        pair = address(new MockUniswapV2Pair(token0, token1));
+        getPair[token0][token1] = pair;
+        getPair[token1][token0] = pair;
+        allPairs.push(pair);
 
-        return address(this);
+        emit PairCreated(token0, token1, pair, allPairs.length);
     }
-}
\ No newline at end of file
+}
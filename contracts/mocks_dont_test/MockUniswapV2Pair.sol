@@ -0,0 +1,78 @@
+// SPDX-License-Identifier: MIT
+pragma solidity >=0.8.0 <0.9.0;
+
+import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+
+/**
+ * @title Constant product pair for testing - same swap math and 0.3% fee as a UniswapV2 pair, without the LP token.
+ * Liquidity is added by transferring both tokens to the pair and calling sync().
+ */
+contract MockUniswapV2Pair {
+    address public factory;
+    address public token0;
+    address public token1;
+
+    uint112 private _reserve0;
+    uint112 private _reserve1;
+    uint32 private _blockTimestampLast;
+
+    event Swap(
+        address indexed sender,
+        uint amount0In,
+        uint amount1In,
+        uint amount0Out,
+        uint amount1Out,
+        address indexed to
+    );
+    event Sync(uint112 reserve0, uint112 reserve1);
+
+    constructor(address initToken0, address initToken1) {
+        factory = msg.sender;
+        token0 = initToken0;
+        token1 = initToken1;
+    }
+
+    function getReserves() public view returns (uint112 reserve0, uint112 reserve1, uint32 blockTimestampLast) {
+        reserve0 = _reserve0;
+        reserve1 = _reserve1;
+        blockTimestampLast = _blockTimestampLast;
+    }
+
+    function _update(uint balance0, uint balance1) private {
+        require(balance0 <= type(uint112).max && balance1 <= type(uint112).max, "UniswapV2: OVERFLOW");
+        _reserve0 = uint112(balance0);
+        _reserve1 = uint112(balance1);
+        _blockTimestampLast = uint32(block.timestamp);
+        emit Sync(_reserve0, _reserve1);
+    }
+
+    // The input has to be transferred to the pair before calling swap, which is what the router does.
+    function swap(uint amount0Out, uint amount1Out, address to, bytes calldata) external {
+        require(amount0Out > 0 || amount1Out > 0, "UniswapV2: INSUFFICIENT_OUTPUT_AMOUNT");
+        (uint112 reserve0, uint112 reserve1,) = getReserves();
+        require(amount0Out < reserve0 && amount1Out < reserve1, "UniswapV2: INSUFFICIENT_LIQUIDITY");
+        require(to != token0 && to != token1, "UniswapV2: INVALID_TO");
+
+        // Token transfers are called directly so that a revert in the token (e.g. OBURN trading checks) bubbles up.
+        if (amount0Out > 0) IERC20(token0).transfer(to, amount0Out);
+        if (amount1Out > 0) IERC20(token1).transfer(to, amount1Out);
+
+        uint balance0 = IERC20(token0).balanceOf(address(this));
+        uint balance1 = IERC20(token1).balanceOf(address(this));
+
+        uint amount0In = balance0 > reserve0 - amount0Out ? balance0 - (reserve0 - amount0Out) : 0;
+        uint amount1In = balance1 > reserve1 - amount1Out ? balance1 - (reserve1 - amount1Out) : 0;
+        require(amount0In > 0 || amount1In > 0, "UniswapV2: INSUFFICIENT_INPUT_AMOUNT");
+
+        uint balance0Adjusted = balance0 * 1000 - amount0In * 3;
+        uint balance1Adjusted = balance1 * 1000 - amount1In * 3;
+        require(balance0Adjusted * balance1Adjusted >= uint(reserve0) * reserve1 * 1000**2, "UniswapV2: K");
+
+        _update(balance0, balance1);
+        emit Swap(msg.sender, amount0In, amount1In, amount0Out, amount1Out, to);
+    }
+
+    function sync() external {
+        _update(IERC20(token0).balanceOf(address(this)), IERC20(token1).balanceOf(address(this)));
+    }
+}
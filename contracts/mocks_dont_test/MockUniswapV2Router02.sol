@@ -1,11 +1,21 @@
 // SPDX-License-Identifier: MIT
 pragma solidity >=0.8.0 <0.9.0;
 
-import "../../interfaces/Uniswap.sol";
+import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import "./MockUniswapV2Factory.sol";
+import "./MockUniswapV2Pair.sol";
 
+/**
+ * @title Router for testing - the UniswapV2Router02 quote and token-for-token swap functions over the mock pairs.
+ */
 contract MockUniswapV2Router02 {
     address public _factory;
 
+    modifier ensure(uint deadline) {
+        require(deadline >= block.timestamp, "UniswapV2Router: EXPIRED");
+        _;
+    }
+
     constructor(address initFactory) {
         _factory = initFactory;
     }
@@ -13,4 +23,94 @@ contract MockUniswapV2Router02 {
     function factory() external view returns (address) {
         return _factory;
     }
-}
\ No newline at end of file
+
+    // Library functions
+
+    function pairFor(address tokenA, address tokenB) public view returns (address pair) {
+        pair = MockUniswapV2Factory(_factory).getPair(tokenA, tokenB);
+        require(pair != address(0), "UniswapV2Library: PAIR_NOT_FOUND");
+    }
+
+    function getReserves(address tokenA, address tokenB) public view returns (uint reserveA, uint reserveB) {
+        (uint reserve0, uint reserve1,) = MockUniswapV2Pair(pairFor(tokenA, tokenB)).getReserves();
+        (reserveA, reserveB) = tokenA < tokenB ? (reserve0, reserve1) : (reserve1, reserve0);
+    }
+
+    function quote(uint amountA, uint reserveA, uint reserveB) public pure returns (uint amountB) {
+        require(amountA > 0, "UniswapV2Library: INSUFFICIENT_AMOUNT");
+        require(reserveA > 0 && reserveB > 0, "UniswapV2Library: INSUFFICIENT_LIQUIDITY");
+        amountB = amountA * reserveB / reserveA;
+    }
+
+    function getAmountOut(uint amountIn, uint reserveIn, uint reserveOut) public pure returns (uint amountOut) {
+        require(amountIn > 0, "UniswapV2Library: INSUFFICIENT_INPUT_AMOUNT");
+        require(reserveIn > 0 && reserveOut > 0, "UniswapV2Library: INSUFFICIENT_LIQUIDITY");
+        uint amountInWithFee = amountIn * 997;
+        amountOut = amountInWithFee * reserveOut / (reserveIn * 1000 + amountInWithFee);
+    }
+
+    function getAmountIn(uint amountOut, uint reserveIn, uint reserveOut) public pure returns (uint amountIn) {
+        require(amountOut > 0, "UniswapV2Library: INSUFFICIENT_OUTPUT_AMOUNT");
+        require(reserveIn > 0 && reserveOut > 0, "UniswapV2Library: INSUFFICIENT_LIQUIDITY");
+        amountIn = reserveIn * amountOut * 1000 / ((reserveOut - amountOut) * 997) + 1;
+    }
+
+    function getAmountsOut(uint amountIn, address[] memory path) public view returns (uint[] memory amounts) {
+        require(path.length >= 2, "UniswapV2Library: INVALID_PATH");
+        amounts = new uint[](path.length);
+        amounts[0] = amountIn;
+        for (uint i; i < path.length - 1; i++) {
+            (uint reserveIn, uint reserveOut) = getReserves(path[i], path[i + 1]);
+            amounts[i + 1] = getAmountOut(amounts[i], reserveIn, reserveOut);
+        }
+    }
+
+    function getAmountsIn(uint amountOut, address[] memory path) public view returns (uint[] memory amounts) {
+        require(path.length >= 2, "UniswapV2Library: INVALID_PATH");
+        amounts = new uint[](path.length);
+        amounts[amounts.length - 1] = amountOut;
+        for (uint i = path.length - 1; i > 0; i--) {
+            (uint reserveIn, uint reserveOut) = getReserves(path[i - 1], path[i]);
+            amounts[i - 1] = getAmountIn(amounts[i], reserveIn, reserveOut);
+        }
+    }
+
+    // Swaps
+
+    // Requires the initial amount to have already been sent to the first pair.
+    function _swap(uint[] memory amounts, address[] memory path, address to) internal {
+        for (uint i; i < path.length - 1; i++) {
+            (address input, address output) = (path[i], path[i + 1]);
+            uint amountOut = amounts[i + 1];
+            (uint amount0Out, uint amount1Out) = input < output ? (uint(0), amountOut) : (amountOut, uint(0));
+            address recipient = i < path.length - 2 ? pairFor(output, path[i + 2]) : to;
+            MockUniswapV2Pair(pairFor(input, output)).swap(amount0Out, amount1Out, recipient, new bytes(0));
+        }
+    }
+
+    function swapExactTokensForTokens(
+        uint amountIn,
+        uint amountOutMin,
+        address[] calldata path,
+        address to,
+        uint deadline
+    ) external ensure(deadline) returns (uint[] memory amounts) {
+        amounts = getAmountsOut(amountIn, path);
+        require(amounts[amounts.length - 1] >= amountOutMin, "UniswapV2Router: INSUFFICIENT_OUTPUT_AMOUNT");
+        IERC20(path[0]).transferFrom(msg.sender, pairFor(path[0], path[1]), amounts[0]);
+        _swap(amounts, path, to);
+    }
+
+    function swapTokensForExactTokens(
+        uint amountOut,
+        uint amountInMax,
+        address[] calldata path,
+        address to,
+        uint deadline
+    ) external ensure(deadline) returns (uint[] memory amounts) {
+        amounts = getAmountsIn(amountOut, path);
+        require(amounts[0] <= amountInMax, "UniswapV2Router: EXCESSIVE_INPUT_AMOUNT");
+        IERC20(path[0]).transferFrom(msg.sender, pairFor(path[0], path[1]), amounts[0]);
+        _swap(amounts, path, to);
+    }
+}
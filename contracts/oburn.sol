@@ -47,12 +47,13 @@ pragma solidity 0.8.13;
 
 
 import "@openzeppelin/contracts/token/ERC20/ERC20.sol";
+import "@openzeppelin/contracts/token/ERC20/extensions/draft-ERC20Permit.sol";
 import "@openzeppelin/contracts/access/Ownable.sol";
 import "@openzeppelin/contracts/utils/Address.sol";
 import "../interfaces/IUniswapV2Router02.sol";
 import "../interfaces/IUniswapV2Factory.sol";
 
-contract OnlyBurns is ERC20, Ownable {
+contract OnlyBurns is ERC20, ERC20Permit, Ownable {
     using Address for address;
 
     bool private _buyFeePermanentlyDisabled = false;
@@ -61,14 +62,32 @@ contract OnlyBurns is ERC20, Ownable {
     uint8 private _previousBuyFee = _buyFee;
     uint8 private _sellFee = 10;
     uint8 private _previousSellFee = _sellFee;
+    // Kept in the same slot as the fee fields above, so every transfer reads all of them with one storage load.
+    bool private _dexTradingEnabled = false;
+    uint8 private _tradingPhase = TRADING_DISABLED;
+    // A uint32 block number lasts past block 4.29 billion, far beyond the chain's lifetime at 3 second blocks.
+    uint32 private _blockAtEnableTrading;
+    // Buy and sell fees taken since the last sweep, held by this contract until sweepFees sends them to the Service
+    // Wallet and the Dead Wallet. Accruing them in this already loaded slot replaces a cold balance write per trade.
+    uint80 private _pendingServiceFees;
+    uint80 private _pendingBurnFees;
+
+    // Trading starts disabled, enableTrading starts the anti-snipe window, and the first transfer after the window
+    // latches the launched phase, after which transfers skip the trading and anti-snipe checks entirely.
+    uint8 private constant TRADING_DISABLED = 0;
+    uint8 private constant TRADING_ANTI_SNIPE = 1;
+    uint8 private constant TRADING_LAUNCHED = 2;
+    uint8 private constant ANTI_SNIPE_FEE = 99;
     
-    mapping (address => bool) public _dexSwapAddresses;
-    mapping (address => bool) private _addressesExemptFromFees;
-    mapping (address => bool) private _blacklistedAddresses;
+    // Balances and supply are kept here rather than in ERC20, so a taxed transfer can debit the sender once.
+    mapping (address => uint) private _tokenBalances;
+    uint private _tokenSupply;
 
-    bool private _dexTradingEnabled = false;
-    bool private _tradingEnabled = false;
-    uint private _blockAtEnableTrading;
+    // Per-address flags packed into one slot, so a transfer loads each party's flags with a single storage read.
+    mapping (address => uint8) private _addressFlags;
+    uint8 private constant FLAG_DEX_SWAP = 1;
+    uint8 private constant FLAG_EXEMPT_FROM_FEES = 2;
+    uint8 private constant FLAG_BLACKLISTED = 4;
 
     IUniswapV2Router02 public quickSwapRouter;
     address public quickSwapPair;
@@ -88,33 +107,8 @@ contract OnlyBurns is ERC20, Ownable {
     event AddOrRemoveUserFromBlacklist(address indexed user, bool indexed blacklisted);
     event dexTradingEnabledOrDisabled(bool indexed enabled);
 
-    // Modifier
-
-    modifier canTransfer(address sender, address recipient) {        
-        require(sender != address(0), "Transfer from the zero address");
-        require(recipient != address(0), "Transfer to the zero address");
-        require(!_blacklistedAddresses[sender], "Sender is blacklisted from trading.");
-        require(!_blacklistedAddresses[recipient], "Recipient is blacklisted from trading.");
-        require(_tradingEnabled || sender == owner() || getAddressExemptFromFees(sender), "Trading is not enabled");
-        
-        if (!_dexTradingEnabled) {
-            require((!_dexSwapAddresses[sender] || _addressesExemptFromFees[recipient]) && (_addressesExemptFromFees[sender] || !_dexSwapAddresses[recipient]), "DEX Trading is currently disabled. You must trade directly through the Only Burns DApp.");
-        }
-
-        if(block.number > _blockAtEnableTrading + 3 || sender == owner() || getAddressExemptFromFees(sender)) {
-            _;
-        }
-        else {
-            _buyFee = 99;
-            _sellFee = 99;
-            _;
-            _buyFee = _previousBuyFee;
-            _sellFee = _previousSellFee;
-        }
-    }
-
     // Constructor
-    constructor(address initRouterAddress, address initServiceWallet, address initUSDCAddress) ERC20("OnlyBurns", "OBURN") {
+    constructor(address initRouterAddress, address initServiceWallet, address initUSDCAddress) ERC20("OnlyBurns", "OBURN") ERC20Permit("OnlyBurns") {
         _routerAddress = initRouterAddress;
         _serviceWallet = initServiceWallet;
         _usdc = initUSDCAddress;
@@ -134,9 +128,32 @@ contract OnlyBurns is ERC20, Ownable {
 
     // Internal
 
-    function applyFees(address sender, address recipient) private view returns (bool) {
-        bool dexSwapDetected = _dexSwapAddresses[sender] || _dexSwapAddresses[recipient];
-        bool exemptAddressDetected = _addressesExemptFromFees[sender] || _addressesExemptFromFees[recipient];
+    function _mint(address account, uint amount) internal virtual override {
+        require(account != address(0), "ERC20: mint to the zero address");
+
+        _tokenSupply += amount;
+        _tokenBalances[account] += amount;
+
+        emit Transfer(address(0), account, amount);
+    }
+
+    function _burn(address account, uint amount) internal virtual override {
+        require(account != address(0), "ERC20: burn from the zero address");
+
+        uint accountBalance = _tokenBalances[account];
+        require(accountBalance >= amount, "ERC20: burn amount exceeds balance");
+        unchecked {
+            _tokenBalances[account] = accountBalance - amount;
+        }
+        _tokenSupply -= amount;
+
+        emit Transfer(account, address(0), amount);
+    }
+
+    function applyFees(uint8 senderFlags, uint8 recipientFlags) private pure returns (bool) {
+        uint8 flags = senderFlags | recipientFlags;
+        bool dexSwapDetected = (flags & FLAG_DEX_SWAP) != 0;
+        bool exemptAddressDetected = (flags & FLAG_EXEMPT_FROM_FEES) != 0;
 
         if( dexSwapDetected && !exemptAddressDetected ) {
             return true;
@@ -149,15 +166,45 @@ contract OnlyBurns is ERC20, Ownable {
         address sender,
         address recipient,
         uint amount
-    ) internal override canTransfer(sender, recipient) {
+    ) internal override {
+        require(sender != address(0), "Transfer from the zero address");
+        require(recipient != address(0), "Transfer to the zero address");
+
+        uint8 senderFlags = _addressFlags[sender];
+        uint8 recipientFlags = _addressFlags[recipient];
+        require((senderFlags & FLAG_BLACKLISTED) == 0, "Sender is blacklisted from trading.");
+        require((recipientFlags & FLAG_BLACKLISTED) == 0, "Recipient is blacklisted from trading.");
+
+        // The owner and fee exempt senders skip the trading and anti-snipe checks. None of this runs once launched.
+        bool antiSnipe = false;
+        uint8 tradingPhase = _tradingPhase;
+        if (tradingPhase != TRADING_LAUNCHED) {
+            if (tradingPhase == TRADING_ANTI_SNIPE && block.number > _blockAtEnableTrading + 3) {
+                _tradingPhase = TRADING_LAUNCHED;
+            }
+            else {
+                bool senderPrivileged = (senderFlags & FLAG_EXEMPT_FROM_FEES) != 0 || sender == owner();
+                require(tradingPhase != TRADING_DISABLED || senderPrivileged, "Trading is not enabled");
+                antiSnipe = tradingPhase == TRADING_ANTI_SNIPE && !senderPrivileged;
+            }
+        }
+
+        if (!_dexTradingEnabled) {
+            bool senderDex = (senderFlags & FLAG_DEX_SWAP) != 0;
+            bool recipientDex = (recipientFlags & FLAG_DEX_SWAP) != 0;
+            bool senderExempt = (senderFlags & FLAG_EXEMPT_FROM_FEES) != 0;
+            bool recipientExempt = (recipientFlags & FLAG_EXEMPT_FROM_FEES) != 0;
+            require((!senderDex || recipientExempt) && (senderExempt || !recipientDex), "DEX Trading is currently disabled. You must trade directly through the Only Burns DApp.");
+        }
+
         if(_buyFeePermanentlyDisabled && _sellFeePermanentlyDisabled) {
-            super._transfer(sender, recipient, amount);
+            _move(sender, recipient, amount);
         }
-        else if(applyFees(sender, recipient)) {
-            _tokenTransfer(sender, recipient, amount);
+        else if(applyFees(senderFlags, recipientFlags)) {
+            _tokenTransfer(sender, recipient, amount, senderFlags, recipientFlags, antiSnipe);
         }
         else {
-            super._transfer(sender, recipient, amount);
+            _move(sender, recipient, amount);
         }
     }
 
@@ -187,8 +234,8 @@ contract OnlyBurns is ERC20, Ownable {
     // Public
 
     function enableTrading() public onlyOwner {
-        _tradingEnabled = true;
-        _blockAtEnableTrading = block.number;
+        _tradingPhase = TRADING_ANTI_SNIPE;
+        _blockAtEnableTrading = uint32(block.number);
 
         emit EnableTrading();
     }
@@ -200,30 +247,35 @@ contract OnlyBurns is ERC20, Ownable {
     }
 
     function exemptAddressFromFees(address excludedAddress, bool value) public onlyOwner {
-        require(_addressesExemptFromFees[excludedAddress] != value, "Already set to this value");
+        require(getAddressExemptFromFees(excludedAddress) != value, "Already set to this value");
 
-        _addressesExemptFromFees[excludedAddress] = value;
+        _setAddressFlag(excludedAddress, FLAG_EXEMPT_FROM_FEES, value);
 
         emit ExemptAddressFromFees(excludedAddress, value);
     }
 
     function blacklistOrUnblacklistUser(address user, bool blacklist) public onlyOwner {
         require(user != address(0), "Blacklist user cannot be the zero address.");
-        require(_blacklistedAddresses[user] != blacklist, "Already set to this value.");
-        _blacklistedAddresses[user] = blacklist;
+        require(getAddressBlacklisted(user) != blacklist, "Already set to this value.");
+        _setAddressFlag(user, FLAG_BLACKLISTED, blacklist);
         emit AddOrRemoveUserFromBlacklist(user, blacklist);
     }
 
     function getAddressExemptFromFees(address excludedAddress) public view returns (bool) {
-        return _addressesExemptFromFees[excludedAddress];
+        return (_addressFlags[excludedAddress] & FLAG_EXEMPT_FROM_FEES) != 0;
     }
 
     function getAddressBlacklisted(address blacklistedAddress) public view returns (bool) {
-        return _blacklistedAddresses[blacklistedAddress];
+        return (_addressFlags[blacklistedAddress] & FLAG_BLACKLISTED) != 0;
     }
 
     function getDexSwapAddress(address pairAddress) public view onlyOwner returns (bool) {
-        return _dexSwapAddresses[pairAddress];
+        return _dexSwapAddresses(pairAddress);
+    }
+
+    // Same ABI as the getter of the old public _dexSwapAddresses mapping.
+    function _dexSwapAddresses(address pairAddress) public view returns (bool) {
+        return (_addressFlags[pairAddress] & FLAG_DEX_SWAP) != 0;
     }
 
     function removeFees() public onlyOwner {
@@ -259,15 +311,37 @@ contract OnlyBurns is ERC20, Ownable {
     }
 
     function addDexSwapAddress(address pairAddress, bool value) public onlyOwner {
-        require(_dexSwapAddresses[pairAddress] != value, "Address already in-use");
+        require(_dexSwapAddresses(pairAddress) != value, "Address already in-use");
         
-        _dexSwapAddresses[pairAddress] = value;
+        _setAddressFlag(pairAddress, FLAG_DEX_SWAP, value);
         
         emit AddDexSwapAddress(pairAddress, value);
     }
 
     function totalSupply() public view virtual override returns (uint) {
-        return super.totalSupply() - balanceOf(DEAD);
+        return _tokenSupply - balanceOf(DEAD) - _pendingBurnFees;
+    }
+
+    /**
+    @dev Function to get an address's OBURN balance. The balance of this contract includes the buy and sell fees that are
+    * pending until the next sweep (see pendingFees). Every taxed trade emits a Transfer of its fee to this contract, so
+    * wallets and explorers that rebuild balances from events show the same figure. Pending fees can't be spent by this
+    * contract - sweepFees can only send them to the Service Wallet and the Dead Wallet.
+    @param account the address to get the balance of
+    */
+    function balanceOf(address account) public view virtual override returns (uint) {
+        if (account == address(this))
+            return _tokenBalances[account] + _pendingServiceFees + _pendingBurnFees;
+
+        return _tokenBalances[account];
+    }
+
+    function pendingFees() public view returns (uint, uint) {
+        return (_pendingServiceFees, _pendingBurnFees);
+    }
+
+    function sweepFees() public {
+        _sweepFees();
     }
 
     function updateBuyFee(uint8 value) public onlyOwner returns(uint8, uint8) {
@@ -289,8 +363,10 @@ contract OnlyBurns is ERC20, Ownable {
     function updateServiceWallet(address newServiceWallet) public onlyOwner {
         require(_serviceWallet != newServiceWallet, "Address is already in-use");
 
-        _addressesExemptFromFees[_serviceWallet] = false; // Restore fee for old Service Wallet
-        _addressesExemptFromFees[newServiceWallet] = true; // Exclude new Service Wallet
+        _sweepFees(); // Fees taken so far belong to the old Service Wallet
+
+        _setAddressFlag(_serviceWallet, FLAG_EXEMPT_FROM_FEES, false); // Restore fee for old Service Wallet
+        _setAddressFlag(newServiceWallet, FLAG_EXEMPT_FROM_FEES, true); // Exclude new Service Wallet
 
         _serviceWallet = newServiceWallet;
 
@@ -315,59 +391,118 @@ contract OnlyBurns is ERC20, Ownable {
 
     // Private
 
-    function _buyTransfer(
+    function _move(
         address sender,
         address recipient,
         uint amount
     ) private {
-        uint _totalFee = _calculateBuyFee(amount);
-        uint _amountWithFee = amount - _totalFee;
-
-        super._transfer(sender, recipient, _amountWithFee); // Send coin to buyer
-        super._transfer(sender, _serviceWallet, _totalFee); // Send coin to Service Wallet
+        uint senderBalance = _tokenBalances[sender];
+        require(senderBalance >= amount, "ERC20: transfer amount exceeds balance");
+        unchecked {
+            _tokenBalances[sender] = senderBalance - amount;
+        }
+        _tokenBalances[recipient] += amount;
 
         emit Transfer(sender, recipient, amount);
     }
 
-    function _calculateBuyFee(uint amount) private view returns (uint) {
-        if (_buyFee == 0)
-            return 0;
+    // Debits the sender once for the whole amount. The fee stays with this contract until it is swept.
+    function _feeTransfer(
+        address sender,
+        address recipient,
+        uint amount,
+        uint totalFee
+    ) private {
+        uint senderBalance = _tokenBalances[sender];
+        require(senderBalance >= amount, "ERC20: transfer amount exceeds balance");
+        unchecked {
+            _tokenBalances[sender] = senderBalance - amount;
+        }
+        _tokenBalances[recipient] += amount - totalFee;
+
+        emit Transfer(sender, recipient, amount - totalFee);
+        if (totalFee > 0)
+            emit Transfer(sender, address(this), totalFee);
+    }
+
+    function _sweepFees() private {
+        uint serviceFees = _pendingServiceFees;
+        uint burnFees = _pendingBurnFees;
+        _pendingServiceFees = 0;
+        _pendingBurnFees = 0;
+
+        if (serviceFees > 0) {
+            _tokenBalances[_serviceWallet] += serviceFees;
+            emit Transfer(address(this), _serviceWallet, serviceFees);
+        }
+
+        if (burnFees > 0) {
+            _tokenBalances[DEAD] += burnFees;
+            emit Transfer(address(this), DEAD, burnFees);
+        }
+    }
+
+    function _setAddressFlag(address account, uint8 flag, bool value) private {
+        if (value) {
+            _addressFlags[account] |= flag;
+        }
+        else {
+            _addressFlags[account] &= ~flag;
+        }
+    }
 
-        return (amount * _buyFee) / 10**10;
+    function _buyTransfer(
+        address sender,
+        address recipient,
+        uint amount,
+        uint fee
+    ) private {
+        uint _totalFee = _calculateFee(amount, fee);
+
+        if (_totalFee > type(uint80).max - _pendingServiceFees)
+            _sweepFees();
+        _pendingServiceFees += uint80(_totalFee); // Swept to the Service Wallet later
+
+        _feeTransfer(sender, recipient, amount, _totalFee);
     }
 
-    function _calculateSellFee(uint amount) private view returns (uint) {
-        if (_sellFee == 0)
+    // A single fee is at most 99 / 10**10 of the supply, so it always fits in the uint80 fee counters.
+    function _calculateFee(uint amount, uint fee) private pure returns (uint) {
+        if (fee == 0)
             return 0;
 
-        return (amount * _sellFee) / 10**10;
+        return (amount * fee) / 10**10;
     }
 
     function _sellTransfer(
         address sender,
         address recipient,
-        uint amount
+        uint amount,
+        uint fee
     ) private {
-        uint _totalFee = _calculateSellFee(amount);
-        uint _amountWithFee = amount - _totalFee;
+        uint _totalFee = _calculateFee(amount, fee);
 
-        super._transfer(sender, recipient, _amountWithFee); // Send coin to seller
-        super._transfer(sender, DEAD, _totalFee); // Send coin to Dead Wallet
+        if (_totalFee > type(uint80).max - _pendingBurnFees)
+            _sweepFees();
+        _pendingBurnFees += uint80(_totalFee); // Swept to the Dead Wallet later
 
-        emit Transfer(sender, recipient, amount);
+        _feeTransfer(sender, recipient, amount, _totalFee);
     }
 
     function _tokenTransfer(
         address sender,
         address recipient,
-        uint amount
+        uint amount,
+        uint8 senderFlags,
+        uint8 recipientFlags,
+        bool antiSnipe
     ) private {
-        if (_dexSwapAddresses[sender]) {
-            _buyTransfer(sender, recipient, amount);
-        } else if (_dexSwapAddresses[recipient]) {
-            _sellTransfer(sender, recipient, amount);
+        if ((senderFlags & FLAG_DEX_SWAP) != 0) {
+            _buyTransfer(sender, recipient, amount, antiSnipe ? ANTI_SNIPE_FEE : _buyFee);
+        } else if ((recipientFlags & FLAG_DEX_SWAP) != 0) {
+            _sellTransfer(sender, recipient, amount, antiSnipe ? ANTI_SNIPE_FEE : _sellFee);
         } else {
-            super._transfer(sender, recipient, amount);
+            _move(sender, recipient, amount);
         }
     }
 }
\ No newline at end of file
@@ -0,0 +1,136 @@
+#!/usr/bin/python3
+from brownie import OburnExchange, interface
+from pathlib import Path
+from scripts.helpers import get_account, get_batch_size, chunk_list
+from scripts.holders import aggregate_holders
+from scripts.tx_pipeline import TransactionPipeline
+from web3 import Web3
+import json
+
+# OBURN exchange address (see scripts/deploy.py)
+OBURN_EXCHANGE_ADDRESS = ""
+
+# Permits collected from TBURN holders, as {address: {"deadline", "v", "r", "s"}} signed for their CSV balance. Holders
+# listed here are exchanged with batchExchangeWithPermit, everyone else needs to have approved the exchange already.
+PERMITS_FILE = Path(__file__).parent.parent / "data" / "exchange_permits.json"
+
+# Gas per holder assumed when there aren't two exchangeable holders to estimate it from.
+DEFAULT_GAS_PER_HOLDER = 80000
+
+# Reasons a holder is skipped, by the OburnExchange SKIP_ constant
+SKIP_REASONS = {1: "not enough TBURN", 2: "not enough allowance", 3: "exchange is out of OBURN"}
+
+def load_permits(path=PERMITS_FILE):
+    if not Path(path).exists():
+        return {}
+    with open(path, "r") as permitsFile:
+        return {
+            Web3.toChecksumAddress(address): (int(permit["deadline"]), int(permit["v"]), permit["r"], permit["s"])
+            for address, permit in json.load(permitsFile).items()
+        }
+
+# Indexes of the first count holders with enough TBURN (and, when checkAllowance is set, enough allowance) for the
+# exchange to go through rather than skip them.
+def get_exchangeable_indexes(tburn, exchangeAddress, holders, amounts, checkAllowance, count=2):
+    indexes = []
+    for i, (holder, amount) in enumerate(zip(holders, amounts)):
+        if tburn.balanceOf(holder) < amount:
+            continue
+        if checkAllowance and tburn.allowance(holder, exchangeAddress) < amount:
+            continue
+        indexes.append(i)
+        if len(indexes) == count:
+            break
+    return indexes
+
+# Estimates the gas used per holder and the fixed gas per transaction from batches of one and two holders, then sizes
+# the chunks so that each batch transaction fits under the block gas limit. The estimate uses holders that are
+# exchanged (from sampleIndexes), since a skipped holder costs far less gas than one whose TBURN is exchanged.
+def estimate_batch_size(batchFunction, holders, amounts, extraArgs, account, sampleIndexes):
+    if len(sampleIndexes) < 2:
+        return get_batch_size(DEFAULT_GAS_PER_HOLDER)
+
+    oneHolderArgs = [[values[i] for i in sampleIndexes[:1]] for values in [holders, amounts, *extraArgs]]
+    twoHolderArgs = [[values[i] for i in sampleIndexes[:2]] for values in [holders, amounts, *extraArgs]]
+    oneHolderGas = batchFunction.estimate_gas(*oneHolderArgs, {"from": account})
+    twoHolderGas = batchFunction.estimate_gas(*twoHolderArgs, {"from": account})
+
+    gasPerHolder = twoHolderGas - oneHolderGas
+    return get_batch_size(gasPerHolder, oneHolderGas - gasPerHolder)
+
+# Sends the holders to batchFunction in chunks through the pipeline. extraArgs are lists that are chunked alongside the
+# holders (the permits for batchExchangeWithPermit).
+def submit_batches(pipeline, batchFunction, holders, amounts, extraArgs, account, sampleIndexes):
+    if not holders:
+        return
+
+    batchSize = estimate_batch_size(batchFunction, holders, amounts, extraArgs, account, sampleIndexes)
+    holderChunks = chunk_list(holders, batchSize)
+    amountChunks = chunk_list(amounts, batchSize)
+    extraChunks = [chunk_list(arg, batchSize) for arg in extraArgs]
+    print(f"Exchanging TBURN for {len(holders)} holders with {batchFunction.abi['name']} in {len(holderChunks)} batches of up to {batchSize}")
+
+    for i, (holderChunk, amountChunk) in enumerate(zip(holderChunks, amountChunks)):
+        pipeline.submit(batchFunction, holderChunk, amountChunk, *[chunks[i] for chunks in extraChunks], label=f"batch {i + 1} ({len(holderChunk)} holders)")
+
+# Exchanges TBURN for OBURN on behalf of every holder in holderBalances (address to wei). Holders with a permit go
+# through batchExchangeWithPermit. Holders the exchange can't serve are skipped on chain instead of reverting their
+# batch. Returns the amount exchanged per holder and the reason each skipped holder was skipped.
+def batch_exchange(oburnExchange, holderBalances, permits=None, account=None):
+    if account is None:
+        account = get_account()
+    if permits is None:
+        permits = {}
+
+    approvedHolders = [holder for holder in holderBalances if holder not in permits]
+    permitHolders = [holder for holder in holderBalances if holder in permits]
+    approvedAmounts = [holderBalances[holder] for holder in approvedHolders]
+    permitAmounts = [holderBalances[holder] for holder in permitHolders]
+
+    # Permit holders get their allowance from the permit in the same transaction, so only their balance is checked
+    tburn = interface.IERC20(oburnExchange._tburn())
+    approvedSample = get_exchangeable_indexes(tburn, oburnExchange.address, approvedHolders, approvedAmounts, True)
+    permitSample = get_exchangeable_indexes(tburn, oburnExchange.address, permitHolders, permitAmounts, False)
+
+    pipeline = TransactionPipeline(account)
+    submit_batches(
+        pipeline,
+        oburnExchange.batchExchange,
+        approvedHolders,
+        approvedAmounts,
+        [],
+        account,
+        approvedSample,
+    )
+    submit_batches(
+        pipeline,
+        oburnExchange.batchExchangeWithPermit,
+        permitHolders,
+        permitAmounts,
+        [[permits[holder] for holder in permitHolders]],
+        account,
+        permitSample,
+    )
+    receipts = pipeline.flush()
+
+    exchanged = {}
+    skipped = {}
+    for receipt in receipts:
+        if "TBURNExchanged" in receipt.events:
+            for event in receipt.events["TBURNExchanged"]:
+                exchanged[event["user"]] = exchanged.get(event["user"], 0) + event["exchangeAmount"]
+        if "TBURNExchangeSkipped" in receipt.events:
+            for event in receipt.events["TBURNExchangeSkipped"]:
+                skipped[event["user"]] = SKIP_REASONS.get(event["reason"], f"reason {event['reason']}")
+
+    print("\nBatch exchange summary:")
+    print(f"  Holders exchanged: {len(exchanged)} ({sum(exchanged.values())} wei)")
+    print(f"  Holders skipped: {len(skipped)}")
+    for holder, reason in skipped.items():
+        print(f"    {holder}: {reason}")
+
+    return exchanged, skipped
+
+def main():
+    oburnExchange = OburnExchange.at(OBURN_EXCHANGE_ADDRESS)
+    batch_exchange(oburnExchange, aggregate_holders(["TBURN"]), load_permits())
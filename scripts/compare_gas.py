@@ -0,0 +1,24 @@
+#!/usr/bin/python3
+from pathlib import Path
+import json
+
+# Compares two gas baselines written by the benchmarks with UPDATE_GAS_BASELINE=1 (e.g. tests/gas_baseline.json saved
+# on the commits before and after a change) and prints the change of every scenario. Returns {name: (before, after)},
+# with None for a scenario missing from one of the files.
+def compare_gas(beforePath, afterPath):
+    before = json.loads(Path(beforePath).read_text())
+    after = json.loads(Path(afterPath).read_text())
+    changes = {name: (before.get(name), after.get(name)) for name in sorted(set(before) | set(after))}
+
+    print(f"\nGas change from {beforePath} to {afterPath}:")
+    for name, (beforeGas, afterGas) in changes.items():
+        if beforeGas is None or afterGas is None:
+            print(f"  {name}: {beforeGas} -> {afterGas}")
+        else:
+            print(f"  {name}: {beforeGas} -> {afterGas} ({afterGas - beforeGas:+d}, {(afterGas - beforeGas) / beforeGas:+.1%})")
+
+    return changes
+
+# brownie run scripts/compare_gas.py main <before.json> <after.json>
+def main(beforePath, afterPath):
+    compare_gas(beforePath, afterPath)
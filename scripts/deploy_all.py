@@ -0,0 +1,191 @@
+#!/usr/bin/python3
+from brownie import (
+    BatchSender,
+    BurnSwap,
+    MerkleDistributor,
+    MockToken,
+    MockUniswapV2Factory,
+    MockUniswapV2Router02,
+    Multicall,
+    OburnExchange,
+    OburnTokenPresale,
+    OnlyBurns,
+    network,
+    web3,
+)
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from scripts.helpers import get_account, VERIFY_NETWORKS, NON_FORKED_LOCAL_BLOCKCHAIN_ENVIRONMENTS
+from scripts.deploy import TBURN_ADDRESS
+from scripts.deploy_burn_swap import OBURN_ADDRESS, USDC_ADDRESS, PAIR_ADDRESS, ROUTER_ADDRESS
+from scripts.holders import aggregate_holders
+from scripts.merkle import ClaimTree
+from web3 import Web3
+import json
+import os
+
+# Where the per-network deployment manifests are kept
+MANIFEST_DIR = Path(__file__).parent.parent / "deployments"
+
+# Addresses that already exist on a network. These are used as-is instead of being deployed.
+EXISTING_ADDRESSES = {
+    "bsc-main": {
+        "TBURN": TBURN_ADDRESS,
+        "OnlyBurns": OBURN_ADDRESS,
+        "USDC": USDC_ADDRESS,
+        "pair": PAIR_ADDRESS,
+        "router": ROUTER_ADDRESS,
+    },
+}
+
+# Every contract in a full environment. "args" are the names of the constructor arguments, which are either other
+# entries or one of the wallet / Merkle root values. Entries marked localOnly are mocks that are only deployed on
+# local chains, and entries with "resolve" are read from the chain instead of being deployed.
+DEPLOYMENTS = {
+    "TBURN": {"container": MockToken, "args": [], "localOnly": True},
+    "USDC": {"container": MockToken, "args": [], "localOnly": True},
+    "factory": {"container": MockUniswapV2Factory, "args": [], "localOnly": True},
+    "router": {"container": MockUniswapV2Router02, "args": ["factory"], "localOnly": True},
+    "OnlyBurns": {"container": OnlyBurns, "args": ["router", "serviceWallet", "USDC"]},
+    "pair": {"resolve": lambda env: OnlyBurns.at(env["OnlyBurns"]).quickSwapPair(), "args": ["OnlyBurns"]},
+    "OburnTokenPresale": {"container": OburnTokenPresale, "args": ["presaleWallet", "OnlyBurns", "USDC"]},
+    "OburnExchange": {"container": OburnExchange, "args": ["TBURN", "OnlyBurns"]},
+    "BurnSwap": {"container": BurnSwap, "args": ["router", "pair", "OnlyBurns", "USDC"]},
+    "MerkleDistributor": {"container": MerkleDistributor, "args": ["OnlyBurns", "merkleRoot"]},
+    "BatchSender": {"container": BatchSender, "args": []},
+    "Multicall": {"container": Multicall, "args": []},
+}
+
+def get_manifest_path(networkName):
+    return MANIFEST_DIR / f"{networkName}.json"
+
+def load_manifest(path):
+    if not Path(path).exists():
+        return {}
+    with open(path, "r") as manifestFile:
+        return json.load(manifestFile)
+
+# Writes the manifest to a temporary file first, so a crash never leaves a half-written manifest behind.
+def save_manifest(path, manifest):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tempPath = f"{path}.tmp"
+    with open(tempPath, "w") as manifestFile:
+        json.dump(manifest, manifestFile, indent=4)
+        manifestFile.flush()
+        os.fsync(manifestFile.fileno())
+    os.replace(tempPath, path)
+
+# Hash of the creation bytecode with the encoded constructor arguments, so changing either one redeploys.
+def get_code_hash(container, args):
+    return Web3.keccak(hexstr=container.deploy.encode_input(*args)).hex()
+
+# A manifest entry can be reused if the code and arguments haven't changed and the contract is still on chain
+# (local chains are wiped between runs).
+def is_deployed(entry, codeHash):
+    return entry is not None and entry["codeHash"] == codeHash and len(web3.eth.get_code(entry["address"])) > 0
+
+# Sends every deployment of a wave at once with consecutive nonces, then waits for all of them.
+def deploy_wave(account, wave):
+    nonce = account.nonce
+    pending = {}
+    for name, container, args, _ in wave:
+        print(f"Deploying {name} ({container._name})")
+        pending[name] = container.deploy(*args, {"from": account, "nonce": nonce, "required_confs": 0})
+        nonce += 1
+
+    deployed = {}
+    for name, tx in pending.items():
+        tx.wait(1)
+        if tx.status != 1:
+            raise Exception(f"Deployment of {name} failed in {tx.txid}")
+        deployed[name] = tx
+    return deployed
+
+def verify_contracts(manifest, containers):
+    toVerify = [name for name, entry in manifest.items() if name in containers and not entry.get("verified")]
+
+    def verify(name):
+        container = containers[name]
+        return name, container.publish_source(container.at(manifest[name]["address"]))
+
+    with ThreadPoolExecutor(max_workers=max(len(toVerify), 1)) as executor:
+        for name, verified in executor.map(verify, toVerify):
+            manifest[name]["verified"] = bool(verified)
+            print(f"{name} {'verified' if verified else 'could not be verified'}")
+
+# Deploys every contract that isn't already deployed with the same code and arguments, sending independent
+# contracts in the same wave, and records them in the network's manifest. Returns the address of every entry and
+# the names of the contracts deployed by this run.
+def deploy_all(manifestPath=None):
+    account = get_account()
+    networkName = network.show_active()
+    isLocal = networkName in NON_FORKED_LOCAL_BLOCKCHAIN_ENVIRONMENTS
+    print(f"Deploying to {networkName}")
+
+    if manifestPath is None:
+        manifestPath = get_manifest_path(networkName)
+    manifest = load_manifest(manifestPath)
+
+    env = {
+        "serviceWallet": get_account(2).address if isLocal else None,
+        "presaleWallet": account.address,
+        "merkleRoot": "0x" + ClaimTree(aggregate_holders()).root.hex(),
+        **EXISTING_ADDRESSES.get(networkName, {}),
+    }
+    env = {key: value for key, value in env.items() if value}
+
+    pending = [name for name, spec in DEPLOYMENTS.items() if name not in env and (isLocal or not spec.get("localOnly"))]
+    deployedNames = []
+
+    while pending:
+        ready = [name for name in pending if all(arg in env for arg in DEPLOYMENTS[name]["args"])]
+        # Every entry must be deployed, so a dependency that can't be resolved (e.g. an address missing from
+        # EXISTING_ADDRESSES) fails the run instead of silently leaving contracts out.
+        if not ready:
+            missing = [
+                f"{name} (missing {', '.join(arg for arg in DEPLOYMENTS[name]['args'] if arg not in env)})"
+                for name in pending
+            ]
+            raise Exception(f"Can't deploy {', '.join(missing)} on {networkName}")
+
+        wave = []
+        for name in ready:
+            spec = DEPLOYMENTS[name]
+            if "resolve" in spec:
+                env[name] = spec["resolve"](env)
+                continue
+
+            args = [env[arg] for arg in spec["args"]]
+            codeHash = get_code_hash(spec["container"], args)
+            if is_deployed(manifest.get(name), codeHash):
+                print(f"{name} is unchanged at {manifest[name]['address']}")
+                env[name] = manifest[name]["address"]
+            else:
+                wave.append((name, spec["container"], args, codeHash))
+
+        codeHashes = {name: codeHash for name, _, _, codeHash in wave}
+        for name, tx in deploy_wave(account, wave).items():
+            manifest[name] = {
+                "contract": DEPLOYMENTS[name]["container"]._name,
+                "address": tx.contract_address,
+                "codeHash": codeHashes[name],
+                "txHash": tx.txid,
+                "verified": False,
+            }
+            env[name] = tx.contract_address
+            deployedNames.append(name)
+            print(f"{name} deployed to {tx.contract_address}")
+
+        save_manifest(manifestPath, manifest)
+        pending = [name for name in pending if name not in env]
+
+    if networkName in VERIFY_NETWORKS:
+        verify_contracts(manifest, {name: spec["container"] for name, spec in DEPLOYMENTS.items() if "container" in spec})
+        save_manifest(manifestPath, manifest)
+
+    print(f"\nDeployed {len(deployedNames)} contracts, manifest written to {manifestPath}")
+
+    return {name: env[name] for name in DEPLOYMENTS if name in env}, deployedNames
+
+def main():
+    deploy_all()
@@ -0,0 +1,25 @@
+#!/usr/bin/python3
+from brownie import (
+    BatchSender,
+    config,
+    network,
+    Contract,
+)
+from scripts.helpers import get_account, VERIFY_NETWORKS
+
+def deploy_batch_sender():
+    account = get_account()
+    print(f"Deploying to {network.show_active()}")
+
+    # Deploys the batch sender contract used for airdrops and migrations.
+    batchSender = BatchSender.deploy(
+        {"from": account},
+        publish_source=network.show_active() in VERIFY_NETWORKS,
+    )
+
+    print(f"Batch Sender deployed to {batchSender}")
+
+    return batchSender
+
+def main():
+    deploy_batch_sender()
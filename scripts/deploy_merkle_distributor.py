@@ -0,0 +1,39 @@
+#!/usr/bin/python3
+from brownie import (
+    MerkleDistributor,
+    config,
+    network,
+    Contract,
+)
+from scripts.helpers import get_account, VERIFY_NETWORKS
+from scripts.holders import aggregate_holders
+from scripts.merkle import ClaimTree
+
+# OBURN address on BSC
+OBURN_ADDRESS = "0x76E45C89254907bA5dd6558be3Dd78fD0A0320F3"
+
+def deploy_merkle_distributor(oburnAddress=None, merkleRoot=None):
+    account = get_account()
+    print(f"Deploying to {network.show_active()}")
+
+    if not oburnAddress:
+        oburnAddress = OBURN_ADDRESS
+
+    # If no root is supplied, build the tree from the holder files in data/
+    if not merkleRoot:
+        merkleRoot = "0x" + ClaimTree(aggregate_holders()).root.hex()
+
+    # Deploys the Merkle claim distributor.
+    merkleDistributor = MerkleDistributor.deploy(
+        oburnAddress,
+        merkleRoot,
+        {"from": account},
+        publish_source=network.show_active() in VERIFY_NETWORKS,
+    )
+
+    print(f"Merkle Distributor deployed to {merkleDistributor} with root {merkleRoot}")
+
+    return merkleDistributor
+
+def main():
+    deploy_merkle_distributor()
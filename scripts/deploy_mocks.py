@@ -1,5 +1,5 @@
 #!/usr/bin/python3
-from brownie import MockToken, MockUniswapV2Factory, MockUniswapV2Router02, config, network
+from brownie import MockToken, MockUniswapV2Factory, MockUniswapV2Pair, MockUniswapV2Router02, config, network
 from scripts.helpers import get_account, VERIFY_NETWORKS
 
 # Deploys mock tokens and mock Uniswap contracts for testing.
@@ -16,5 +16,21 @@ def deploy_mocks():
 
     return genericToken1, genericToken2, genericToken3, mockUniswapV2Factory, mockUniswapV2Router02
 
+# Creates the mock pair for two tokens (if it doesn't exist yet) and seeds it with liquidity from the owner account.
+def add_mock_liquidity(mockUniswapV2Factory, tokenA, tokenB, amountA, amountB):
+    account = get_account()
+
+    pairAddress = mockUniswapV2Factory.getPair(tokenA.address, tokenB.address)
+    if int(pairAddress, 16) == 0:
+        mockUniswapV2Factory.createPair(tokenA.address, tokenB.address, {"from": account})
+        pairAddress = mockUniswapV2Factory.getPair(tokenA.address, tokenB.address)
+
+    pair = MockUniswapV2Pair.at(pairAddress)
+    tokenA.transfer(pair.address, amountA, {"from": account})
+    tokenB.transfer(pair.address, amountB, {"from": account})
+    pair.sync({"from": account})
+
+    return pair
+
 def main():
     deploy_mocks()
\ No newline at end of file
@@ -0,0 +1,25 @@
+#!/usr/bin/python3
+from brownie import (
+    Multicall,
+    config,
+    network,
+    Contract,
+)
+from scripts.helpers import get_account, VERIFY_NETWORKS
+
+def deploy_multicall():
+    account = get_account()
+    print(f"Deploying to {network.show_active()}")
+
+    # Deploys the multicall contract used for bulk reads of holder balances and flags.
+    multicall = Multicall.deploy(
+        {"from": account},
+        publish_source=network.show_active() in VERIFY_NETWORKS,
+    )
+
+    print(f"Multicall deployed to {multicall}")
+
+    return multicall
+
+def main():
+    deploy_multicall()
@@ -0,0 +1,297 @@
+#!/usr/bin/python3
+from brownie import BurnSwap, network, web3
+from concurrent.futures import ThreadPoolExecutor
+from hexbytes import HexBytes
+from pathlib import Path
+from scripts.deploy_burn_swap import OBURN_ADDRESS_TEST, USDC_ADDRESS_TEST
+from scripts.quote_engine import BURNSWAP_ADDRESS_TEST
+from web3 import Web3
+import sqlite3
+
+# Where the per-network index databases are kept
+INDEX_DIR = Path(__file__).parent.parent / "data" / "index"
+
+# Presale to index alongside Burn Swap - if None, only Burn Swap is indexed.
+PRESALE_ADDRESS = None
+
+# Number of blocks per eth_getLogs request, and how many requests are in flight at the same time.
+LOG_BLOCK_RANGE = 5000
+LOG_WORKERS = 8
+
+# Blocks newer than this many confirmations aren't indexed yet, so a reorg can't leave stale rows behind.
+CONFIRMATIONS = 3
+
+TRANSFER_TOPIC = Web3.keccak(text="Transfer(address,address,uint256)").hex()
+# BurnSwap events from older deployments, which have their amount fields swapped - the field named oburnAmount holds
+# the BUSD amount and busdAmount holds the OBURN amount, on both buys and sells.
+OBURN_BUY_TOPIC = Web3.keccak(text="oburnBuy(address,uint256,uint256)").hex()
+OBURN_SELL_TOPIC = Web3.keccak(text="oburnSell(address,uint256,uint256)").hex()
+SWAPPED_AMOUNT_TOPICS = (OBURN_BUY_TOPIC, OBURN_SELL_TOPIC)
+# Current BurnSwap events, which carry the amounts in the right order and the fee taken from the trader.
+OBURN_BUY_FEE_TOPIC = Web3.keccak(text="oburnBuy(address,uint256,uint256,uint256)").hex()
+OBURN_SELL_FEE_TOPIC = Web3.keccak(text="oburnSell(address,uint256,uint256,uint256)").hex()
+BUY_TOPICS = (OBURN_BUY_TOPIC, OBURN_BUY_FEE_TOPIC)
+SELL_TOPICS = (OBURN_SELL_TOPIC, OBURN_SELL_FEE_TOPIC)
+TOKENS_PURCHASED_TOPIC = Web3.keccak(text="TokensPurchased(address,address,uint256,uint256)").hex()
+
+# Amounts are stored as decimal strings because token amounts in wei don't fit in SQLite's 64-bit integers.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cursors (
+    contract TEXT PRIMARY KEY,
+    lastBlock INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS trades (
+    txHash TEXT NOT NULL,
+    logIndex INTEGER NOT NULL,
+    blockNumber INTEGER NOT NULL,
+    user TEXT NOT NULL,
+    side TEXT NOT NULL,
+    oburnAmount TEXT NOT NULL,
+    busdAmount TEXT NOT NULL,
+    fee TEXT,
+    PRIMARY KEY (txHash, logIndex)
+);
+CREATE INDEX IF NOT EXISTS tradesByUser ON trades (user, blockNumber);
+CREATE TABLE IF NOT EXISTS transfers (
+    txHash TEXT NOT NULL,
+    logIndex INTEGER NOT NULL,
+    blockNumber INTEGER NOT NULL,
+    token TEXT NOT NULL,
+    sender TEXT NOT NULL,
+    recipient TEXT NOT NULL,
+    amount TEXT NOT NULL,
+    PRIMARY KEY (txHash, logIndex)
+);
+CREATE INDEX IF NOT EXISTS transfersByTx ON transfers (txHash);
+CREATE TABLE IF NOT EXISTS purchases (
+    txHash TEXT NOT NULL,
+    logIndex INTEGER NOT NULL,
+    blockNumber INTEGER NOT NULL,
+    purchaser TEXT NOT NULL,
+    beneficiary TEXT NOT NULL,
+    usdcAmount TEXT NOT NULL,
+    oburnAmount TEXT NOT NULL,
+    PRIMARY KEY (txHash, logIndex)
+);
+CREATE INDEX IF NOT EXISTS purchasesByBeneficiary ON purchases (beneficiary, blockNumber);
+"""
+
+def _address_topic(address):
+    return "0x" + "0" * 24 + address[2:].lower()
+
+def _topic_address(topic):
+    return Web3.toChecksumAddress("0x" + HexBytes(topic).hex()[-40:])
+
+def _data_words(data):
+    data = HexBytes(data)
+    return [int.from_bytes(data[i:i + 32], "big") for i in range(0, len(data), 32)]
+
+def _log_key(log):
+    return HexBytes(log["transactionHash"]).hex(), log["logIndex"], log["blockNumber"]
+
+
+class EventIndexer:
+    """
+    Incremental SQLite index of BurnSwap trades and presale purchases.
+
+    Each run fetches only the blocks after the stored cursor of each contract, in fixed block ranges fetched
+    concurrently, and writes every range together with its cursor in one transaction, so an interrupted run resumes
+    where it stopped. BUSD and OBURN transfers to and from BurnSwap are indexed alongside the trades, since the
+    trade events don't carry the fee: buy fees are the BUSD kept by BurnSwap and sell fees are the OBURN it sends
+    to the dead wallet.
+
+    Current BurnSwap events carry the fee, which is stored as-is. Events from older deployments don't, so the fee is
+    derived from the transfers, and they have their amount fields swapped (oburnAmount holds the BUSD amount and
+    busdAmount the OBURN amount), which the index stores the right way round.
+    """
+
+    def __init__(self, path, burnSwapAddress=None, presaleAddress=None, oburnAddress=None, busdAddress=None, deadWallet=None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(self.path))
+        self.db.executescript(SCHEMA)
+        # Indexes created before trade events carried the fee don't have the column yet.
+        if "fee" not in [column[1] for column in self.db.execute("PRAGMA table_info(trades)")]:
+            self.db.execute("ALTER TABLE trades ADD COLUMN fee TEXT")
+
+        self.burnSwapAddress = burnSwapAddress
+        self.presaleAddress = presaleAddress
+        self.oburnAddress = oburnAddress
+        self.busdAddress = busdAddress
+        self.deadWallet = deadWallet
+
+    @classmethod
+    def for_network(cls, networkName, **addresses):
+        return cls(INDEX_DIR / f"{networkName}.sqlite", **addresses)
+
+    def close(self):
+        self.db.close()
+
+    def get_cursor(self, contract):
+        row = self.db.execute("SELECT lastBlock FROM cursors WHERE contract = ?", (contract,)).fetchone()
+        return row[0] if row else None
+
+    # Log filters for everything indexed for a contract.
+    def _filters(self, contract):
+        if contract == "burnSwap":
+            burnSwapTopic = _address_topic(self.burnSwapAddress)
+            return [
+                {"address": self.burnSwapAddress, "topics": [list(BUY_TOPICS + SELL_TOPICS)]},
+                {"address": [self.busdAddress, self.oburnAddress], "topics": [TRANSFER_TOPIC, burnSwapTopic]},
+                {"address": self.busdAddress, "topics": [TRANSFER_TOPIC, None, burnSwapTopic]},
+            ]
+        return [{"address": self.presaleAddress, "topics": [TOKENS_PURCHASED_TOPIC]}]
+
+    def _fetch_range(self, contract, fromBlock, toBlock):
+        logs = []
+        for logFilter in self._filters(contract):
+            logs.extend(web3.eth.get_logs({**logFilter, "fromBlock": fromBlock, "toBlock": toBlock}))
+        return fromBlock, toBlock, logs
+
+    def _store_logs(self, contract, logs):
+        for log in logs:
+            txHash, logIndex, blockNumber = _log_key(log)
+            topic = HexBytes(log["topics"][0]).hex()
+            words = _data_words(log["data"])
+
+            if topic in BUY_TOPICS + SELL_TOPICS:
+                oburnAmount, busdAmount = (words[1], words[0]) if topic in SWAPPED_AMOUNT_TOPICS else (words[0], words[1])
+                self.db.execute(
+                    "INSERT OR IGNORE INTO trades VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (txHash, logIndex, blockNumber, _topic_address(log["topics"][1]),
+                     "buy" if topic in BUY_TOPICS else "sell", str(oburnAmount), str(busdAmount),
+                     str(words[2]) if len(words) > 2 else None),
+                )
+            elif topic == TRANSFER_TOPIC:
+                self.db.execute(
+                    "INSERT OR IGNORE INTO transfers VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (txHash, logIndex, blockNumber, Web3.toChecksumAddress(log["address"]),
+                     _topic_address(log["topics"][1]), _topic_address(log["topics"][2]), str(words[0])),
+                )
+            elif topic == TOKENS_PURCHASED_TOPIC:
+                self.db.execute(
+                    "INSERT OR IGNORE INTO purchases VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (txHash, logIndex, blockNumber, _topic_address(log["topics"][1]),
+                     _topic_address(log["topics"][2]), str(words[0]), str(words[1])),
+                )
+
+    # Indexes a contract from the block after its cursor (or startBlock on the first run) up to toBlock.
+    def index_contract(self, contract, startBlock, toBlock, blockRange=LOG_BLOCK_RANGE, workers=LOG_WORKERS):
+        cursor = self.get_cursor(contract)
+        fromBlock = startBlock if cursor is None else cursor + 1
+        ranges = [(start, min(start + blockRange - 1, toBlock)) for start in range(fromBlock, toBlock + 1, blockRange)]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map keeps the ranges in order, so the cursor only ever moves past fully stored blocks
+            for _, rangeEnd, logs in executor.map(lambda blockRange: self._fetch_range(contract, *blockRange), ranges):
+                with self.db:
+                    self._store_logs(contract, logs)
+                    self.db.execute("INSERT OR REPLACE INTO cursors VALUES (?, ?)", (contract, rangeEnd))
+
+        return len(ranges)
+
+    def index(self, startBlock=0, toBlock=None, confirmations=CONFIRMATIONS):
+        if toBlock is None:
+            toBlock = web3.eth.block_number - confirmations
+
+        if self.burnSwapAddress:
+            self.index_contract("burnSwap", startBlock, toBlock)
+        if self.presaleAddress:
+            self.index_contract("presale", startBlock, toBlock)
+
+    def _transfer_total(self, txHash, token, sender=None, recipient=None):
+        query = "SELECT amount FROM transfers WHERE txHash = ? AND token = ?"
+        params = [txHash, token]
+        if sender is not None:
+            query += " AND sender = ?"
+            params.append(sender)
+        if recipient is not None:
+            query += " AND recipient = ?"
+            params.append(recipient)
+        return sum(int(amount) for (amount,) in self.db.execute(query, params))
+
+    # Fee taken by BurnSwap for a trade whose event doesn't carry it: the BUSD it kept on a buy, or the OBURN it burnt
+    # on a sell. The BUSD kept is what came in minus what went out, which covers both router trades (everything comes
+    # in, the swap and any refund go out) and direct pair trades (only the fee comes in). It can be a wei above the
+    # fee BurnSwap records, which rounds the fee and the amount swapped down separately.
+    def trade_fee(self, txHash, side):
+        if side == "buy":
+            busdIn = self._transfer_total(txHash, self.busdAddress, recipient=self.burnSwapAddress)
+            busdOut = self._transfer_total(txHash, self.busdAddress, sender=self.burnSwapAddress)
+            return busdIn - busdOut
+        return self._transfer_total(txHash, self.oburnAddress, self.burnSwapAddress, self.deadWallet)
+
+    def _get_fee(self, txHash, side, fee):
+        return int(fee) if fee is not None else self.trade_fee(txHash, side)
+
+    def get_trades(self, user):
+        rows = self.db.execute(
+            "SELECT txHash, blockNumber, side, oburnAmount, busdAmount, fee FROM trades WHERE user = ? ORDER BY blockNumber, logIndex",
+            (user,),
+        )
+        return [
+            {
+                "txHash": txHash,
+                "blockNumber": blockNumber,
+                "side": side,
+                "oburnAmount": int(oburnAmount),
+                "busdAmount": int(busdAmount),
+                "fee": self._get_fee(txHash, side, fee),
+            }
+            for txHash, blockNumber, side, oburnAmount, busdAmount, fee in rows
+        ]
+
+    # Per-address totals - volume and fees for BurnSwap trades, and amounts bought in the presale.
+    def get_address_summary(self, user):
+        trades = self.get_trades(user)
+        buys = [trade for trade in trades if trade["side"] == "buy"]
+        sells = [trade for trade in trades if trade["side"] == "sell"]
+        purchases = self.db.execute(
+            "SELECT usdcAmount, oburnAmount FROM purchases WHERE beneficiary = ?", (user,)
+        ).fetchall()
+
+        return {
+            "buys": len(buys),
+            "sells": len(sells),
+            "busdSpent": sum(trade["busdAmount"] + trade["fee"] for trade in buys),
+            "oburnBought": sum(trade["oburnAmount"] for trade in buys),
+            "busdFees": sum(trade["fee"] for trade in buys),
+            "oburnSold": sum(trade["oburnAmount"] + trade["fee"] for trade in sells),
+            "busdReceived": sum(trade["busdAmount"] for trade in sells),
+            "oburnBurnt": sum(trade["fee"] for trade in sells),
+            "presaleUSDC": sum(int(usdcAmount) for usdcAmount, _ in purchases),
+            "presaleOBURN": sum(int(oburnAmount) for _, oburnAmount in purchases),
+        }
+
+    # BUSD fees collected from and OBURN burnt for every trader, in one pass over the trades - the same totals as
+    # BurnSwap's addressToBUSDCollected and addressToOBURNBurnt, which aren't kept with per-user accounting turned off.
+    def get_fee_totals(self):
+        totals = {}
+        for user, side, txHash, fee in self.db.execute("SELECT user, side, txHash, fee FROM trades"):
+            userTotals = totals.setdefault(user, {"busdCollected": 0, "oburnBurnt": 0})
+            userTotals["busdCollected" if side == "buy" else "oburnBurnt"] += self._get_fee(txHash, side, fee)
+        return totals
+
+    def get_traders(self):
+        return [user for (user,) in self.db.execute("SELECT DISTINCT user FROM trades ORDER BY user")]
+
+
+# Indexer for the Burn Swap (and presale, if set) on the active network.
+def get_indexer(burnSwap):
+    return EventIndexer.for_network(
+        network.show_active(),
+        burnSwapAddress=burnSwap.address,
+        presaleAddress=PRESALE_ADDRESS,
+        oburnAddress=OBURN_ADDRESS_TEST,
+        busdAddress=USDC_ADDRESS_TEST,
+        deadWallet=burnSwap.deadWallet(),
+    )
+
+def main():
+    indexer = get_indexer(BurnSwap.at(BURNSWAP_ADDRESS_TEST))
+    indexer.index()
+
+    print(f"\nIndexed up to block {indexer.get_cursor('burnSwap')}")
+    for user in indexer.get_traders():
+        print(f"  {user}: {indexer.get_address_summary(user)}")
+    indexer.close()
@@ -1,4 +1,6 @@
-from brownie import network, accounts, config
+from brownie import network, accounts, config, chain, web3
+from eth_account import Account
+from eth_account.messages import encode_structured_data
 import eth_utils
 
 NON_FORKED_LOCAL_BLOCKCHAIN_ENVIRONMENTS = ["hardhat", "development", "ganache"]
@@ -20,9 +22,59 @@ VERIFY_NETWORKS = [
 ]
 
 
+# Local chains (including each parallel test worker's own chain) use their unlocked, deterministic accounts. Every
+# other network uses the private keys from the config.
 def get_account(accountNum=1):
-    if network.show_active() == "development":
+    if network.show_active() in NON_FORKED_LOCAL_BLOCKCHAIN_ENVIRONMENTS:
         return accounts[accountNum - 1]
     else:
         fromKeyNum = f"_{accountNum}" if accountNum != 1 else ""
-        return accounts.add(config["wallets"][f"from_key{fromKeyNum}"])
\ No newline at end of file
+        return accounts.add(config["wallets"][f"from_key{fromKeyNum}"])
+
+# Fraction of the block gas limit that a single batched transaction is allowed to use.
+BATCH_GAS_LIMIT_FRACTION = 0.5
+
+
+# Returns how many items fit in one batched transaction given the gas used per item and the fixed gas
+# used by the transaction itself, leaving headroom under the current block gas limit.
+def get_batch_size(gasPerItem, baseGas=0, gasLimitFraction=BATCH_GAS_LIMIT_FRACTION):
+    blockGasLimit = web3.eth.get_block("latest")["gasLimit"]
+    return max(1, int((blockGasLimit * gasLimitFraction - baseGas) // max(gasPerItem, 1)))
+
+
+# Splits a list into consecutive chunks of at most chunkSize items.
+def chunk_list(items, chunkSize):
+    return [items[i:i + chunkSize] for i in range(0, len(items), chunkSize)]
+
+
+# Signs an EIP-2612 permit letting spender move value of the owner's tokens until deadline. The owner must be an
+# account with a private key. Returns (v, r, s) as taken by permit and the WithPermit entry points.
+def sign_permit(token, owner, spender, value, deadline):
+    permit = {
+        "types": {
+            "EIP712Domain": [
+                {"name": "name", "type": "string"},
+                {"name": "version", "type": "string"},
+                {"name": "chainId", "type": "uint256"},
+                {"name": "verifyingContract", "type": "address"},
+            ],
+            "Permit": [
+                {"name": "owner", "type": "address"},
+                {"name": "spender", "type": "address"},
+                {"name": "value", "type": "uint256"},
+                {"name": "nonce", "type": "uint256"},
+                {"name": "deadline", "type": "uint256"},
+            ],
+        },
+        "primaryType": "Permit",
+        "domain": {"name": token.name(), "version": "1", "chainId": chain.id, "verifyingContract": token.address},
+        "message": {
+            "owner": owner.address,
+            "spender": spender,
+            "value": value,
+            "nonce": token.nonces(owner.address),
+            "deadline": deadline,
+        },
+    }
+    signed = Account.sign_message(encode_structured_data(permit), owner.private_key)
+    return signed.v, "0x" + signed.r.to_bytes(32, "big").hex(), "0x" + signed.s.to_bytes(32, "big").hex()
@@ -0,0 +1,190 @@
+from decimal import Decimal, InvalidOperation, localcontext
+from pathlib import Path
+from web3 import Web3
+import csv
+import mmap
+import struct
+
+# Holder snapshots under data/ that are migrated to OBURN on BSC
+HOLDER_FILE_TOKENS = ["TBURN", "OBURN"]
+HOLDER_FILE_DIR = Path(__file__).parent.parent / "data"
+
+# Where binary holder snapshots are written
+SNAPSHOT_DIR = Path(__file__).parent.parent / "data" / "snapshots"
+
+# Binary holder snapshot layout:
+#   header: magic (4 bytes) | version (uint32) | holder count (uint64) | total amount (32 bytes)
+#   records: holder count address records (see pack_address_record) of the amount in wei, sorted by address
+SNAPSHOT_MAGIC = b"OBHS"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct(">4sIQ32s")
+
+# Address record shared by holder snapshots and Merkle tree files: address (20 bytes) | amount (32 bytes, big endian)
+ADDRESS_RECORD_SIZE = 52
+
+def get_holder_file_path(token, directory=HOLDER_FILE_DIR):
+    return Path(directory) / f"{token}Holders.csv"
+
+# Converts a decimal token amount (e.g. "384622930.8") to wei exactly, without going through a float.
+def parse_wei(amount, decimals=18):
+    amount = amount.strip()
+    whole, _, fraction = amount.partition(".")
+
+    if (whole or fraction) and (not whole or whole.isdigit()) and (not fraction or fraction.isdigit()):
+        if len(fraction) > decimals:
+            raise ValueError(f"{amount} has more than {decimals} decimal places")
+        return int(whole or "0") * 10**decimals + int(fraction.ljust(decimals, "0"))
+
+    # Anything else (e.g. "1.5e-05") goes through Decimal with enough precision to stay exact
+    with localcontext() as context:
+        context.prec = 100
+        try:
+            wei = Decimal(amount) * 10**decimals
+        except InvalidOperation:
+            raise ValueError(f"{amount} is not a valid token amount")
+    if not wei.is_finite() or wei != wei.to_integral_value() or wei < 0:
+        raise ValueError(f"{amount} is not a valid token amount")
+    return int(wei)
+
+# Streams (address, balance) rows from a holder file one at a time, skipping the header row.
+def read_holder_rows(token, directory=HOLDER_FILE_DIR):
+    with open(get_holder_file_path(token, directory), "r") as holderDataFile:
+        for holder in csv.reader(holderDataFile, delimiter=","):
+            if holder and holder[0] != "HolderAddress":
+                yield holder[0], holder[1]
+
+# Streams (address, wei) rows from a holder file, converting each balance to wei exactly.
+def read_holder_balances(token, directory=HOLDER_FILE_DIR):
+    for address, balance in read_holder_rows(token, directory):
+        try:
+            yield address, parse_wei(balance)
+        except ValueError as ex:
+            raise ValueError(f"Invalid balance for {address} in {get_holder_file_path(token, directory).name}: {ex}")
+
+# Streams every holder file and sums the balances (in wei) per checksummed address, so an address listed
+# in several files (or several times in one file) only gets a single transfer.
+def aggregate_holders(tokens=HOLDER_FILE_TOKENS, directory=HOLDER_FILE_DIR):
+    balances = {}
+    rowCounts = {}
+    tokenRowCounts = {}
+
+    for token in tokens:
+        tokenRowCounts[token] = 0
+
+        for address, wei in read_holder_balances(token, directory):
+            checksumAddress = Web3.toChecksumAddress(address)
+            balances[checksumAddress] = balances.get(checksumAddress, 0) + wei
+            rowCounts[checksumAddress] = rowCounts.get(checksumAddress, 0) + 1
+            tokenRowCounts[token] += 1
+
+    mergedAddresses = [address for address, rowCount in rowCounts.items() if rowCount > 1]
+    totalRows = sum(tokenRowCounts.values())
+
+    print("\nHolder aggregation summary:")
+    for token, rowCount in tokenRowCounts.items():
+        print(f"  {token} rows: {rowCount}")
+    print(f"  Total rows: {totalRows}")
+    print(f"  Unique holders: {len(balances)}")
+    print(f"  Duplicate rows merged: {totalRows - len(balances)} (across {len(mergedAddresses)} addresses)")
+    for address in mergedAddresses:
+        print(f"    {address}: {rowCounts[address]} rows, {Web3.fromWei(balances[address], 'ether')} total")
+
+    return balances
+
+
+# Writes holder balances (address to wei) as a binary snapshot, sorted by address.
+def write_holder_snapshot(path, balances):
+    records = {}
+    for address, amount in balances.items():
+        records[to_address_bytes(address)] = amount
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as snapshotFile:
+        snapshotFile.write(
+            SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(records), sum(records.values()).to_bytes(32, "big"))
+        )
+        for address in sorted(records):
+            snapshotFile.write(pack_address_record(address, records[address]))
+
+
+class HolderSnapshot:
+    """
+    Read-only, memory-mapped view of a binary holder snapshot written by write_holder_snapshot. Opening it doesn't
+    read the records, iterating it keeps one record in memory at a time and looking up a holder is a binary search,
+    so snapshots with millions of holders load instantly.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.holderCount, totalAmount = SNAPSHOT_HEADER.unpack_from(self._map, 0)
+        assert magic == SNAPSHOT_MAGIC and version == SNAPSHOT_VERSION, f"{path} is not a holder snapshot"
+        self.totalAmount = int.from_bytes(totalAmount, "big")
+
+    def __len__(self):
+        return self.holderCount
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def _address_at(self, index):
+        return unpack_address_record(self._map, SNAPSHOT_HEADER.size + index * ADDRESS_RECORD_SIZE)[0]
+
+    # Yields (address bytes, wei) records in address order.
+    def items(self):
+        for offset in range(SNAPSHOT_HEADER.size, SNAPSHOT_HEADER.size + self.holderCount * ADDRESS_RECORD_SIZE, ADDRESS_RECORD_SIZE):
+            yield unpack_address_record(self._map, offset)
+
+    # Yields (checksummed address, wei) records in address order.
+    def __iter__(self):
+        for address, amount in self.items():
+            yield Web3.toChecksumAddress(address), amount
+
+    def get_balance(self, address):
+        index = find_address(self._address_at, self.holderCount, to_address_bytes(address))
+        if index is None:
+            return 0
+
+        return unpack_address_record(self._map, SNAPSHOT_HEADER.size + index * ADDRESS_RECORD_SIZE)[1]
+
+
+def to_address_bytes(address):
+    if isinstance(address, bytes):
+        return address
+    return bytes.fromhex(address[2:] if address.startswith("0x") else address)
+
+
+# Packs an address and an amount into an ADDRESS_RECORD_SIZE record.
+def pack_address_record(address, amount):
+    return to_address_bytes(address) + amount.to_bytes(32, "big")
+
+
+# Reads the (address bytes, amount) record at offset in buffer (e.g. a memory-mapped file).
+def unpack_address_record(buffer, offset):
+    return buffer[offset:offset + 20], int.from_bytes(buffer[offset + 20:offset + ADDRESS_RECORD_SIZE], "big")
+
+
+# Binary search over addresses sorted as raw bytes, returning the index of the address or None.
+def find_address(addressAt, count, address):
+    low, high = 0, count
+    while low < high:
+        middle = (low + high) // 2
+        if addressAt(middle) < address:
+            low = middle + 1
+        else:
+            high = middle
+
+    if low < count and addressAt(low) == address:
+        return low
+    return None
+
+
+def main():
+    path = SNAPSHOT_DIR / "holders.bin"
+    write_holder_snapshot(path, aggregate_holders())
+
+    snapshot = HolderSnapshot(path)
+    print(f"Wrote {len(snapshot)} holders ({snapshot.totalAmount} wei) to {path}")
+    snapshot.close()
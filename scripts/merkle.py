@@ -0,0 +1,244 @@
+#!/usr/bin/python3
+from eth_utils import to_checksum_address
+from pathlib import Path
+from scripts.holders import ADDRESS_RECORD_SIZE, aggregate_holders, find_address, pack_address_record, to_address_bytes, unpack_address_record
+import json
+import mmap
+import struct
+
+# pysha3 hashes several times faster than the pure fallback, which matters for trees with millions of leaves
+try:
+    from sha3 import keccak_256
+except ImportError:
+    from Crypto.Hash import keccak as _keccak
+
+    def keccak_256(data):
+        return _keccak.new(digest_bits=256, data=data)
+
+# Where the claims JSON and the binary tree file are written
+MERKLE_OUTPUT_DIR = Path(__file__).parent.parent / "data" / "merkle"
+
+# Binary tree file layout:
+#   header: magic (4 bytes) | version (uint32) | leaf count (uint64) | layer count (uint32) | root (32 bytes)
+#   claims: leaf count address records (see pack_address_record), sorted by address (record i is leaf i)
+#   layers: every tree layer from the leaves up to the root, 32 bytes per node
+TREE_FILE_MAGIC = b"OBMT"
+TREE_FILE_VERSION = 2
+TREE_FILE_HEADER = struct.Struct(">4sIQI32s")
+
+
+def keccak(data):
+    return keccak_256(data).digest()
+
+
+# Leaf hash for the MerkleDistributor contract: keccak256(abi.encodePacked(address account, uint256 amount))
+def claim_leaf(address, amount):
+    return keccak(address + amount.to_bytes(32, "big"))
+
+
+# Builds every layer of a sorted-pair Merkle tree (OpenZeppelin MerkleProof layout). A node without a sibling is
+# carried up to the next layer unchanged.
+def build_layers(leaves):
+    layers = [list(leaves)]
+
+    while len(layers[-1]) > 1:
+        layer = layers[-1]
+        pairs = iter(layer)
+        nextLayer = [
+            keccak_256(left + right).digest() if left < right else keccak_256(right + left).digest()
+            for left, right in zip(pairs, pairs)
+        ]
+        if len(layer) % 2:
+            nextLayer.append(layer[-1])
+        layers.append(nextLayer)
+
+    return layers
+
+
+# Returns the sibling hashes needed to prove the leaf at index against the root of the given layers.
+def get_proof(layers, index):
+    proof = []
+
+    for layer in layers[:-1]:
+        siblingIndex = index ^ 1
+        if siblingIndex < len(layer):
+            proof.append(layer[siblingIndex])
+        index //= 2
+
+    return proof
+
+
+def verify_proof(proof, root, leaf):
+    node = leaf
+    for sibling in proof:
+        node = keccak(node + sibling) if node < sibling else keccak(sibling + node)
+    return node == root
+
+
+# Leaf hash for the presale whitelist: keccak256(abi.encodePacked(address account))
+def whitelist_leaf(address):
+    return keccak(address)
+
+
+class ClaimTree:
+    """
+    Merkle tree of (account, amount) claims for the MerkleDistributor contract.
+
+    Claims are sorted by address so that the leaf index of an address can be found with a binary search, both in
+    memory and in the memory-mapped tree file written by write_tree_file.
+    """
+
+    def __init__(self, balances):
+        # balances maps an address (hex string or 20 raw bytes) to an amount in wei
+        claims = {}
+        for address, amount in balances.items():
+            address = to_address_bytes(address)
+            claims[address] = claims.get(address, 0) + amount
+
+        self.addresses = sorted(claims)
+        self.amounts = [claims[address] for address in self.addresses]
+        self.layers = build_layers(
+            claim_leaf(address, amount) for address, amount in zip(self.addresses, self.amounts)
+        )
+
+    @property
+    def root(self):
+        return self.layers[-1][0] if self.layers[-1] else bytes(32)
+
+    def __len__(self):
+        return len(self.addresses)
+
+    def get_claim(self, address):
+        index = find_address(self.addresses.__getitem__, len(self.addresses), to_address_bytes(address))
+        if index is None:
+            return None
+
+        return {
+            "amount": self.amounts[index],
+            "proof": ["0x" + node.hex() for node in get_proof(self.layers, index)],
+        }
+
+    def write_claims_json(self, path):
+        claims = {}
+        for index, (address, amount) in enumerate(zip(self.addresses, self.amounts)):
+            claims[to_checksum_address(address)] = {
+                "amount": str(amount),
+                "proof": ["0x" + node.hex() for node in get_proof(self.layers, index)],
+            }
+
+        with open(path, "w") as claimsFile:
+            json.dump(
+                {"merkleRoot": "0x" + self.root.hex(), "tokenTotal": str(sum(self.amounts)), "claims": claims},
+                claimsFile,
+            )
+
+    def write_tree_file(self, path):
+        with open(path, "wb") as treeFile:
+            treeFile.write(
+                TREE_FILE_HEADER.pack(TREE_FILE_MAGIC, TREE_FILE_VERSION, len(self.addresses), len(self.layers), self.root)
+            )
+            for address, amount in zip(self.addresses, self.amounts):
+                treeFile.write(pack_address_record(address, amount))
+            for layer in self.layers:
+                treeFile.write(b"".join(layer))
+
+
+class ClaimTreeFile:
+    """
+    Read-only, memory-mapped view of a tree file written by ClaimTree.write_tree_file. Looking up a claim and its
+    proof only touches the pages it needs, so proofs can be served for millions of holders without loading the tree.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.leafCount, layerCount, self.root = TREE_FILE_HEADER.unpack_from(self._map, 0)
+        assert magic == TREE_FILE_MAGIC and version == TREE_FILE_VERSION, f"{path} is not a Merkle tree file"
+
+        self._claimsOffset = TREE_FILE_HEADER.size
+        self._layerOffsets = []
+        self._layerSizes = []
+
+        offset = self._claimsOffset + self.leafCount * ADDRESS_RECORD_SIZE
+        layerSize = self.leafCount
+        for _ in range(layerCount):
+            self._layerOffsets.append(offset)
+            self._layerSizes.append(layerSize)
+            offset += layerSize * 32
+            layerSize = (layerSize + 1) // 2
+
+    def __len__(self):
+        return self.leafCount
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def _address_at(self, index):
+        return unpack_address_record(self._map, self._claimsOffset + index * ADDRESS_RECORD_SIZE)[0]
+
+    def get_claim(self, address):
+        index = find_address(self._address_at, self.leafCount, to_address_bytes(address))
+        if index is None:
+            return None
+
+        _, amount = unpack_address_record(self._map, self._claimsOffset + index * ADDRESS_RECORD_SIZE)
+
+        proof = []
+        nodeIndex = index
+        for layerOffset, layerSize in zip(self._layerOffsets[:-1], self._layerSizes[:-1]):
+            siblingIndex = nodeIndex ^ 1
+            if siblingIndex < layerSize:
+                siblingOffset = layerOffset + siblingIndex * 32
+                proof.append("0x" + self._map[siblingOffset:siblingOffset + 32].hex())
+            nodeIndex //= 2
+
+        return {"amount": amount, "proof": proof}
+
+
+class WhitelistTree:
+    """
+    Merkle tree of whitelisted addresses for OburnTokenPresale. Addresses are sorted like ClaimTree's, so the proof
+    for an address is found with the same binary search.
+    """
+
+    def __init__(self, addresses):
+        self.addresses = sorted({to_address_bytes(address) for address in addresses})
+        self.layers = build_layers(whitelist_leaf(address) for address in self.addresses)
+
+    @property
+    def root(self):
+        return self.layers[-1][0] if self.layers[-1] else bytes(32)
+
+    def __len__(self):
+        return len(self.addresses)
+
+    # Returns the proof to pass to buyTokens, or None if the address isn't whitelisted.
+    def get_proof(self, address):
+        index = find_address(self.addresses.__getitem__, len(self.addresses), to_address_bytes(address))
+        if index is None:
+            return None
+
+        return ["0x" + node.hex() for node in get_proof(self.layers, index)]
+
+    def write_proofs_json(self, path):
+        proofs = {
+            to_checksum_address(address): ["0x" + node.hex() for node in get_proof(self.layers, index)]
+            for index, address in enumerate(self.addresses)
+        }
+
+        with open(path, "w") as proofsFile:
+            json.dump({"merkleRoot": "0x" + self.root.hex(), "proofs": proofs}, proofsFile)
+
+
+def main():
+    tree = ClaimTree(aggregate_holders())
+
+    MERKLE_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    tree.write_claims_json(MERKLE_OUTPUT_DIR / "claims.json")
+    tree.write_tree_file(MERKLE_OUTPUT_DIR / "tree.bin")
+
+    print(f"Merkle root for {len(tree)} claims: 0x{tree.root.hex()}")
+    print(f"Total tokens to distribute: {sum(tree.amounts)}")
+    print(f"Claims and proofs written to {MERKLE_OUTPUT_DIR}")
@@ -0,0 +1,200 @@
+#!/usr/bin/python3
+from brownie import web3
+from pathlib import Path
+from web3.exceptions import TransactionNotFound
+import json
+import os
+import time
+
+# Where the per-network migration journals are kept
+JOURNAL_DIR = Path(__file__).parent.parent / "data" / "journals"
+
+# Row states, in the order a row moves through them
+PLANNED = "planned"
+SUBMITTED = "submitted"
+CONFIRMED = "confirmed"
+FAILED = "failed"
+UNKNOWN = "unknown"
+
+
+# Every nonce a submitted row was sent under. Journals written before rows kept their nonce history only have the
+# latest nonce.
+def _get_nonces(record):
+    return list(record.get("nonces", [record["nonce"]] if "nonce" in record else []))
+
+
+class MigrationJournal:
+    """
+    Append-only, fsync'd journal of every migration row (one recipient and amount).
+
+    A row is recorded as planned before anything is sent, as submitted (with the nonce) right before its transaction
+    is broadcast, as submitted again with its tx hashes once they are known, and as confirmed or failed once its
+    receipt is collected. The last record of a row is its state, and a submitted row keeps every nonce and hash it was
+    ever sent under, since a resend can land after the original was dropped. On restart, reconcile() checks each
+    submitted row against the chain by its tx hashes and nonces (never by scanning blocks) and returns only the rows
+    that still have to be sent. A row is only resent when every one of its nonces is either unused or taken by one of
+    its own failed transactions. Rows that can't be proven either way are marked unknown and left out, so a rerun
+    never double-pays a holder.
+    """
+
+    def __init__(self, path, sender):
+        self.path = Path(path)
+        self.sender = sender
+        self.rows = {}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            self._load()
+
+        self._file = open(self.path, "a")
+
+    @classmethod
+    def for_network(cls, networkName, sender, name="migration"):
+        return cls(JOURNAL_DIR / f"{networkName}-{name}.jsonl", sender)
+
+    def _load(self):
+        with open(self.path, "r") as journalFile:
+            for line in journalFile:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave the last line half-written - nothing after it was ever acted on.
+                    continue
+                self.rows[record["recipient"]] = record
+
+    def _append(self, records):
+        for record in records:
+            record["time"] = int(time.time())
+            self._file.write(json.dumps(record) + "\n")
+            self.rows[record["recipient"]] = record
+
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        self._file.close()
+
+    def _set_state(self, recipients, state, **fields):
+        self._append([
+            {"recipient": recipient, "amount": self.rows[recipient]["amount"], "state": state, **fields}
+            for recipient in recipients
+        ])
+
+    def planned(self, holderBalances):
+        self._append([
+            {"recipient": recipient, "amount": str(amount), "state": PLANNED}
+            for recipient, amount in holderBalances.items()
+        ])
+
+    # The callbacks below match the TransactionPipeline hooks, with the label being the list of recipients in the tx.
+    def submitting(self, recipients, nonce):
+        # The nonce is journaled before the broadcast, so a crash before the hash is known still leaves a trace of it.
+        self._set_state(
+            recipients,
+            SUBMITTED,
+            nonce=nonce,
+            nonces=self._with_nonce(recipients[0], nonce),
+            txHashes=self._tx_hashes(recipients[0]),
+        )
+
+    def submitted(self, recipients, nonce, txHash):
+        # Every hash a row was ever sent under is kept, since a dropped and resent transaction can still be the one
+        # that lands.
+        self._set_state(
+            recipients,
+            SUBMITTED,
+            nonce=nonce,
+            nonces=self._with_nonce(recipients[0], nonce),
+            txHashes=self._tx_hashes(recipients[0]) + [txHash],
+        )
+
+    def confirmed(self, recipients, receipt):
+        self._set_state(recipients, CONFIRMED, txHashes=[receipt.txid])
+
+    def failed(self, recipients, receipt):
+        self._set_state(recipients, FAILED, txHashes=[receipt.txid])
+
+    def _tx_hashes(self, recipient):
+        record = self.rows[recipient]
+        return list(record.get("txHashes", [])) if record["state"] == SUBMITTED else []
+
+    def _with_nonce(self, recipient, nonce):
+        record = self.rows[recipient]
+        nonces = _get_nonces(record) if record["state"] == SUBMITTED else []
+        return nonces if nonce in nonces else nonces + [nonce]
+
+    # A transaction belongs to a row if it was sent by the migration sender and its calldata contains the recipient.
+    def _matches_row(self, tx, record):
+        txInput = tx["input"] if isinstance(tx["input"], str) else tx["input"].hex()
+        return tx["from"].lower() == self.sender.lower() and record["recipient"][2:].lower() in txInput.lower()
+
+    def _resolve_submitted(self, record):
+        minedNonce = web3.eth.get_transaction_count(self.sender)
+        pendingNonce = web3.eth.get_transaction_count(self.sender, "pending")
+        failedNonces = set()
+
+        for txHash in record.get("txHashes", []):
+            try:
+                tx = web3.eth.get_transaction(txHash)
+            except TransactionNotFound:
+                continue
+            if not self._matches_row(tx, record):
+                continue
+
+            if tx["blockNumber"] is None:
+                print(f"Waiting for pending transaction {txHash}")
+            receipt = web3.eth.wait_for_transaction_receipt(txHash)
+            if receipt["status"] == 1:
+                return CONFIRMED
+            failedNonces.add(tx["nonce"])
+
+        # None of the known hashes paid the row. Every other nonce the row was sent under has to be unused - a nonce
+        # that was taken (or is pending) under a hash we never recorded may be a resend that paid this row.
+        for nonce in _get_nonces(record):
+            if nonce not in failedNonces and nonce < pendingNonce:
+                if nonce < minedNonce:
+                    print(f"Nonce {nonce} of {record['recipient']} was used by a transaction that isn't in the journal")
+                return UNKNOWN
+
+        return FAILED
+
+    def reconcile(self, holderBalances):
+        submittedRows = [record for record in self.rows.values() if record["state"] == SUBMITTED]
+        resolved = {}
+
+        # Rows sent in the same transaction share a hash, so each transaction is only looked up once.
+        for record in submittedRows:
+            key = (tuple(_get_nonces(record)), tuple(record.get("txHashes", [])))
+            if key not in resolved:
+                resolved[key] = self._resolve_submitted(record)
+            self._set_state(
+                [record["recipient"]],
+                resolved[key],
+                nonce=record["nonce"],
+                nonces=list(key[0]),
+                txHashes=list(key[1]),
+            )
+
+        pendingBalances = {}
+        for recipient, amount in holderBalances.items():
+            record = self.rows.get(recipient)
+
+            if record is not None and int(record["amount"]) != amount:
+                raise ValueError(
+                    f"Journal amount for {recipient} ({record['amount']}) doesn't match the planned amount ({amount})"
+                )
+
+            if record is None or record["state"] in (PLANNED, FAILED):
+                pendingBalances[recipient] = amount
+
+        states = [record["state"] for record in self.rows.values()]
+        print("\nMigration journal:")
+        print(f"  Confirmed rows: {states.count(CONFIRMED)}")
+        print(f"  Rows to send: {len(pendingBalances)}")
+        unknownRows = [record["recipient"] for record in self.rows.values() if record["state"] == UNKNOWN]
+        if unknownRows:
+            print(f"  Rows that need a manual check before resending ({len(unknownRows)}):")
+            for recipient in unknownRows:
+                print(f"    {recipient}")
+
+        return pendingBalances
@@ -1,17 +1,59 @@
-from brownie import network, config, interface
+from brownie import network, config, interface, BatchSender
 from brownie.network.contract import Contract
-from scripts.helpers import get_account
-from pathlib import Path
+from scripts.helpers import get_account, get_batch_size, chunk_list
+from scripts.tx_pipeline import TransactionPipeline
+from scripts.holders import aggregate_holders
+from scripts.plan_migration import estimate_batch_transfer_gas, plan_migration
+from scripts.migration_journal import MigrationJournal
 from web3 import Web3
 import math
-import csv
 
 # OBURN address on BSC
 OBURN_ADDRESS = "0x76E45C89254907bA5dd6558be3Dd78fD0A0320F3"
 
+# Batch sender address on BSC (see scripts/deploy_batch_sender.py)
+BATCH_SENDER_ADDRESS = ""
+
+# Set to False to only plan the migration (simulate every transfer, estimate gas and cost) without sending anything
 SET_BALANCES = True
 
-def move_tokens_to_bsc(oburnAddress=None):
+# Set to True to send balances in chunks through the batch sender contract instead of one transfer per holder
+BATCH_MODE = False
+
+# Estimates the gas used per recipient and the fixed gas per transaction for BatchSender.batchTransfer, then
+# sizes the chunks so that each batch transaction fits under the block gas limit.
+def estimate_batch_size(batchSender, OBURN, accounts, balances, account):
+    if len(accounts) < 2:
+        return len(accounts)
+
+    gasPerRecipient, baseGas = estimate_batch_transfer_gas(batchSender, OBURN, accounts, balances, account)
+    return get_batch_size(gasPerRecipient, baseGas)
+
+# Builds a pipeline that records every row's progress in the migration journal.
+def journaled_pipeline(account, journal):
+    return TransactionPipeline(
+        account,
+        onSending=journal.submitting,
+        onSent=journal.submitted,
+        onConfirmed=journal.confirmed,
+        onReverted=journal.failed,
+    )
+
+def batch_transfer(batchSender, OBURN, accounts, balances, account, journal):
+    OBURN.approve(batchSender.address, sum(balances), {"from": account})
+    batchSize = estimate_batch_size(batchSender, OBURN, accounts, balances, account)
+
+    accountChunks = chunk_list(accounts, batchSize)
+    balanceChunks = chunk_list(balances, batchSize)
+    print(f"Sending OBURN to {len(accounts)} holders in {len(accountChunks)} batches of up to {batchSize}")
+
+    pipeline = journaled_pipeline(account, journal)
+    for accountChunk, balanceChunk in zip(accountChunks, balanceChunks):
+        print(f"Sending {sum(balanceChunk)} OBURN to {len(accountChunk)} holders")
+        pipeline.submit(batchSender.batchTransfer, OBURN.address, accountChunk, balanceChunk, label=accountChunk)
+    pipeline.flush()
+
+def move_tokens_to_bsc(oburnAddress=None, batchSenderAddress=None):
     account = get_account()
 
     currNetwork = network.show_active()
@@ -19,43 +61,44 @@ def move_tokens_to_bsc(oburnAddress=None):
     if not oburnAddress:
         oburnAddress = OBURN_ADDRESS
 
+    if not batchSenderAddress:
+        batchSenderAddress = BATCH_SENDER_ADDRESS
+
+    if SET_BALANCES and BATCH_MODE and not batchSenderAddress:
+        raise Exception("BATCH_MODE needs a batch sender - set BATCH_SENDER_ADDRESS (see scripts/deploy_batch_sender.py)")
+
     OBURN = interface.IERC20(oburnAddress)
 
     print(f"Account BNB balance is currently: {account.balance()}")
 
-    totalBalance = 0
-
-    for token in ["TBURN", "OBURN"]:
-        accounts = []
-        balances = []
-        tokenBalance = 0
-
-        filePath = Path(__file__).parent.parent
-        with open(f'{filePath}/data/{token}Holders.csv', 'r') as holderDataFile:
-            holderData = csv.reader(holderDataFile, delimiter=',')
-
-            for holder in holderData:
-                if holder[0] != "HolderAddress":
-                    accounts.append(holder[0])
-                    balances.append(float(holder[1]))
-                    tokenBalance += float(holder[1])
-
-        assert len(accounts) == len(balances)
-        
-        if SET_BALANCES:
-            for i in range(len(accounts)):
-                print(f"Sending {Web3.toWei(balances[i], 'ether')} OBURN to {accounts[i]}")
-                OBURN.transfer(accounts[i], Web3.toWei(balances[i], "ether"), {"from": account})
-        else:
-            print(f"\nHolder information for {token}:\n")
-            # print(accounts)
-            # print(balances)
-            print(f"Number of holders: {len(accounts)}")
-            print(f"Sum of all account balances for {token} is: {sum(balances)}")
-            totalBalance += sum(balances)
-
-    if not SET_BALANCES:
-        print(f"Final total balance is: {totalBalance}")
+    # Balances (in wei) summed per address across the TBURN and OBURN holder files
+    holderBalances = aggregate_holders()
+
+    if SET_BALANCES:
+        # Rows already confirmed by a previous (possibly crashed) run are skipped
+        journal = MigrationJournal.for_network(currNetwork, account.address)
+        pendingBalances = journal.reconcile(holderBalances)
+        journal.planned(pendingBalances)
+
+        accounts = list(pendingBalances.keys())
+        balances = list(pendingBalances.values())
+
+    if SET_BALANCES and not accounts:
+        print("Every holder has already been sent their balance")
+    elif SET_BALANCES and BATCH_MODE:
+        batchSender = Contract.from_abi("BatchSender", batchSenderAddress, BatchSender.abi)
+        batch_transfer(batchSender, OBURN, accounts, balances, account, journal)
+    elif SET_BALANCES:
+        pipeline = journaled_pipeline(account, journal)
+        for i in range(len(accounts)):
+            print(f"Sending {balances[i]} OBURN to {accounts[i]}")
+            pipeline.submit(OBURN.transfer, accounts[i], balances[i], label=[accounts[i]])
+        pipeline.flush()
+    else:
+        print(f"\nNumber of holders: {len(holderBalances)}")
+        print(f"Final total balance is: {Web3.fromWei(sum(holderBalances.values()), 'ether')}")
+        batchSender = Contract.from_abi("BatchSender", batchSenderAddress, BatchSender.abi) if batchSenderAddress else None
+        plan_migration(OBURN, account, holderBalances, batchSender=batchSender)
 
     print(f"\nAccount BNB balance is currently: {account.balance()}")
 
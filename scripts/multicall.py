@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+from brownie import Multicall, OnlyBurns, web3
+from scripts.holders import aggregate_holders
+from scripts.plan_migration import OBURN_ADDRESS
+
+# Multicall3 is deployed at the same address on every major chain (BSC included) and has the same aggregate and
+# tryAggregate ABI as contracts/Multicall.sol, so either can be used.
+MULTICALL_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Number of calls packed into one eth_call to start with. Halved whenever a batch fails (usually the node's gas
+# cap for eth_call) and kept at the smaller size for the rest of the reader's lifetime.
+MULTICALL_BATCH_SIZE = 1000
+
+
+class MulticallReader:
+    """
+    Reads many contract view calls in a few eth_calls through a Multicall contract.
+
+    Calls are given as (contractCall, args) pairs, e.g. (OBURN.balanceOf, [holder]). A call that reverts on chain comes
+    back as None without affecting the rest of its batch. A batch whose eth_call fails (usually the node's gas cap) is
+    split in half and retried, and the reader keeps the smaller batch size from then on, so it settles on whatever
+    the node allows.
+    """
+
+    def __init__(self, multicall, batchSize=MULTICALL_BATCH_SIZE):
+        self.multicall = multicall
+        self.batchSize = batchSize
+        self.callCount = 0
+
+    def read(self, calls, block_identifier=None):
+        # Pin every batch to the same block, so the results are one consistent snapshot.
+        if block_identifier is None:
+            block_identifier = web3.eth.block_number
+
+        encodedCalls = [(contractCall._address, contractCall.encode_input(*args)) for contractCall, args in calls]
+        returnData = []
+        start = 0
+        while start < len(encodedCalls):
+            batch = encodedCalls[start:start + self.batchSize]
+            returnData.extend(self._read_batch(batch, block_identifier))
+            start += len(batch)
+
+        return [
+            contractCall.decode_output(data) if data is not None else None
+            for (contractCall, _), data in zip(calls, returnData)
+        ]
+
+    def _read_batch(self, batch, block_identifier):
+        # Without requireSuccess a reverting call doesn't fail the eth_call, it just comes back unsuccessful. Any
+        # exception is an RPC error (usually the node's gas cap), which a smaller batch can get around.
+        try:
+            self.callCount += 1
+            results = self.multicall.tryAggregate(False, batch, block_identifier=block_identifier)
+            return [data if success else None for success, data in results]
+        except Exception:
+            if len(batch) == 1:
+                raise
+
+        self.batchSize = min(self.batchSize, max(len(batch) // 2, 1))
+        middle = len(batch) // 2
+        return self._read_batch(batch[:middle], block_identifier) + self._read_batch(batch[middle:], block_identifier)
+
+
+# Reads each holder's OBURN balance and OBURN blacklist and fee exemption flags, plus the Burn Swap flags when a
+# Burn Swap contract is given. Returns a dict of address to a dict of values.
+def read_holder_states(reader, OBURN, holders, burnSwap=None, block_identifier=None):
+    fields = [
+        ("balance", OBURN.balanceOf),
+        ("oburnBlacklisted", OBURN.getAddressBlacklisted),
+        ("oburnExempt", OBURN.getAddressExemptFromFees),
+    ]
+    if burnSwap is not None:
+        fields += [
+            ("burnSwapBlacklisted", burnSwap.getAddressBlacklisted),
+            ("burnSwapExempt", burnSwap.getAddressExemptFromFees),
+        ]
+
+    results = reader.read(
+        [(contractCall, [holder]) for holder in holders for _, contractCall in fields],
+        block_identifier=block_identifier,
+    )
+
+    return {
+        holder: {name: results[i * len(fields) + j] for j, (name, _) in enumerate(fields)}
+        for i, holder in enumerate(holders)
+    }
+
+
+def main():
+    reader = MulticallReader(Multicall.at(MULTICALL_ADDRESS))
+    holders = list(aggregate_holders().keys())
+    states = read_holder_states(reader, OnlyBurns.at(OBURN_ADDRESS), holders)
+
+    print(f"\nRead {len(states)} holders in {reader.callCount} eth_calls (batch size {reader.batchSize})")
+    print(f"  Total OBURN held: {sum(state['balance'] or 0 for state in states.values())}")
+    print(f"  Blacklisted holders: {sum(1 for state in states.values() if state['oburnBlacklisted'])}")
+    print(f"  Fee exempt holders: {sum(1 for state in states.values() if state['oburnExempt'])}")
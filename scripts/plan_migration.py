@@ -0,0 +1,128 @@
+#!/usr/bin/python3
+from brownie import network, interface, web3
+from concurrent.futures import ThreadPoolExecutor
+from scripts.helpers import get_account, get_batch_size
+from scripts.holders import aggregate_holders
+from web3 import Web3
+import math
+
+# OBURN address on BSC
+OBURN_ADDRESS = "0x76E45C89254907bA5dd6558be3Dd78fD0A0320F3"
+
+# Number of eth_call / eth_estimateGas requests in flight at the same time.
+PLANNER_WORKERS = 16
+
+# Gas price (in gwei) used for the cost estimate - if None, the node's current gas price is used.
+GAS_PRICE_GWEI = None
+
+# Intrinsic gas paid once per transaction. Only used for the rough batch estimate from transfer gas, when there is no
+# batch sender to estimate batches with.
+BASE_TX_GAS = 21000
+
+# Simulates a single OBURN transfer with eth_call and estimates its gas. Rows that would revert come back with
+# the revert reason (e.g. "Recipient is blacklisted from trading.") instead of a gas estimate.
+def simulate_transfer(OBURN, sender, recipient, amount):
+    result = {"recipient": recipient, "amount": amount, "gas": 0, "error": None}
+
+    if int(recipient, 16) == 0:
+        result["error"] = "Transfer to the zero address"
+        return result
+
+    tx = {"from": sender, "to": OBURN.address, "data": OBURN.transfer.encode_input(recipient, amount)}
+    try:
+        web3.eth.call(tx)
+        result["gas"] = web3.eth.estimate_gas(tx)
+    except Exception as ex:
+        result["error"] = str(ex)
+
+    return result
+
+# Estimates the gas used per recipient and the fixed gas per transaction for BatchSender.batchTransfer from batches
+# of one and two recipients. The sender must have approved the batch sender for the first two amounts.
+def estimate_batch_transfer_gas(batchSender, OBURN, recipients, amounts, account):
+    oneRecipientGas = batchSender.batchTransfer.estimate_gas(OBURN, recipients[:1], amounts[:1], {"from": account})
+    twoRecipientGas = batchSender.batchTransfer.estimate_gas(OBURN, recipients[:2], amounts[:2], {"from": account})
+
+    gasPerRecipient = twoRecipientGas - oneRecipientGas
+    return gasPerRecipient, oneRecipientGas - gasPerRecipient
+
+# Batch size and total gas for sending the rows in BatchSender batches. They are sized from batchTransfer estimates when
+# a batch sender is given and already approved (the planner doesn't send the approval), otherwise they are only a rough
+# estimate from the transfer gas that leaves out BatchSender's own overhead. Returns the batch size, the batch count, the
+# total gas and what the numbers are based on ("batchTransfer" or "transfer").
+def plan_batches(OBURN, account, okRows, totalGas, batchSender=None):
+    recipients = [result["recipient"] for result in okRows]
+    amounts = [result["amount"] for result in okRows]
+
+    if batchSender is not None and len(okRows) >= 2 and OBURN.allowance(account.address, batchSender.address) >= sum(amounts[:2]):
+        gasPerRecipient, baseGas = estimate_batch_transfer_gas(batchSender, OBURN, recipients, amounts, account)
+        batchSize = min(get_batch_size(gasPerRecipient, baseGas), len(okRows))
+        batchCount = math.ceil(len(okRows) / batchSize)
+        return batchSize, batchCount, batchCount * baseGas + len(okRows) * gasPerRecipient, "batchTransfer"
+
+    gasPerRecipient = max(totalGas // len(okRows) - BASE_TX_GAS, 1)
+    batchSize = min(get_batch_size(gasPerRecipient, BASE_TX_GAS), len(okRows))
+    batchCount = math.ceil(len(okRows) / batchSize)
+    return batchSize, batchCount, totalGas - (len(okRows) - batchCount) * BASE_TX_GAS, "transfer"
+
+def plan_migration(OBURN, account, holderBalances, gasPriceGwei=GAS_PRICE_GWEI, workers=PLANNER_WORKERS, batchSender=None):
+    recipients = list(holderBalances.keys())
+    amounts = list(holderBalances.values())
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(
+            lambda row: simulate_transfer(OBURN, account.address, *row),
+            zip(recipients, amounts),
+        ))
+
+    failedRows = [result for result in results if result["error"]]
+    okRows = [result for result in results if not result["error"]]
+
+    totalGas = sum(result["gas"] for result in okRows)
+    totalAmount = sum(result["amount"] for result in okRows)
+    gasPrice = Web3.toWei(gasPriceGwei, "gwei") if gasPriceGwei is not None else web3.eth.gas_price
+
+    # Each row is simulated against the current state, so the sender balance has to cover all of them together.
+    senderBalance = OBURN.balanceOf(account.address)
+
+    batchSize, batchCount, batchedGas, batchEstimate = 0, 0, 0, None
+    if okRows:
+        batchSize, batchCount, batchedGas, batchEstimate = plan_batches(OBURN, account, okRows, totalGas, batchSender)
+
+    print(f"\nMigration plan on {network.show_active()}:")
+    print(f"  Planned transfers: {len(results)}")
+    print(f"  Transfers that would succeed: {len(okRows)}")
+    print(f"  Transfers that would revert: {len(failedRows)}")
+    for result in failedRows:
+        print(f"    {result['recipient']} ({result['amount']} wei): {result['error']}")
+    print(f"  Total OBURN to send: {Web3.fromWei(totalAmount, 'ether')}")
+    print(f"  Sender OBURN balance: {Web3.fromWei(senderBalance, 'ether')}")
+    if senderBalance < totalAmount:
+        print(f"  WARNING: sender is short {Web3.fromWei(totalAmount - senderBalance, 'ether')} OBURN")
+    print(f"  Total gas (one transfer per holder): {totalGas}")
+    print(f"  Total cost at {Web3.fromWei(gasPrice, 'gwei')} gwei: {Web3.fromWei(totalGas * gasPrice, 'ether')}")
+    if batchEstimate == "batchTransfer":
+        print(f"  Batch size from BatchSender.batchTransfer estimates: {batchSize} ({batchCount} batches)")
+        print(f"  Batched gas: {batchedGas} (cost {Web3.fromWei(batchedGas * gasPrice, 'ether')})")
+    else:
+        print(f"  Rough batch size from transfer gas, without BatchSender overhead: {batchSize} ({batchCount} batches)")
+        print(f"  Rough batched gas from transfer gas: {batchedGas} (cost {Web3.fromWei(batchedGas * gasPrice, 'ether')})")
+
+    return {
+        "results": results,
+        "failedRows": failedRows,
+        "totalGas": totalGas,
+        "totalAmount": totalAmount,
+        "gasPrice": gasPrice,
+        "totalCost": totalGas * gasPrice,
+        "senderBalance": senderBalance,
+        "batchSize": batchSize,
+        "batchCount": batchCount,
+        "batchedGas": batchedGas,
+        "batchEstimate": batchEstimate,
+    }
+
+def main():
+    account = get_account()
+    OBURN = interface.IERC20(OBURN_ADDRESS)
+    plan_migration(OBURN, account, aggregate_holders())
@@ -0,0 +1,216 @@
+#!/usr/bin/python3
+from brownie import BurnSwap, OnlyBurns, interface, web3
+from scripts.deploy_burn_swap import OBURN_ADDRESS_TEST, USDC_ADDRESS_TEST
+import time
+
+# Burn Swap address on BSC testnet
+BURNSWAP_ADDRESS_TEST = "0xb14ebE9405B76509cF0b67B6340f5287f7d53F4E"
+
+# Number of quotes timed by main()
+BENCHMARK_QUOTES = 10000
+
+# Pair swap fees are in basis points, as BurnSwap.pairSwapFee. The router always charges the UniswapV2 0.3%.
+PAIR_FEE_DENOMINATOR = 10000
+ROUTER_SWAP_FEE = 30
+
+# UniswapV2Library.getAmountOut - output for an exact input with a swapFee basis point pair fee (0.3% by default).
+def get_amount_out(amountIn, reserveIn, reserveOut, swapFee=ROUTER_SWAP_FEE):
+    if amountIn <= 0:
+        raise ValueError("UniswapV2Library: INSUFFICIENT_INPUT_AMOUNT")
+    if reserveIn <= 0 or reserveOut <= 0:
+        raise ValueError("UniswapV2Library: INSUFFICIENT_LIQUIDITY")
+
+    amountInWithFee = amountIn * (PAIR_FEE_DENOMINATOR - swapFee)
+    return amountInWithFee * reserveOut // (reserveIn * PAIR_FEE_DENOMINATOR + amountInWithFee)
+
+# UniswapV2Library.getAmountIn - input needed for an exact output with a swapFee basis point pair fee.
+def get_amount_in(amountOut, reserveIn, reserveOut, swapFee=ROUTER_SWAP_FEE):
+    if amountOut <= 0:
+        raise ValueError("UniswapV2Library: INSUFFICIENT_OUTPUT_AMOUNT")
+    if reserveIn <= 0 or reserveOut <= 0:
+        raise ValueError("UniswapV2Library: INSUFFICIENT_LIQUIDITY")
+    if amountOut >= reserveOut:
+        # The contract reverts here on the subtraction underflow (or divides by zero)
+        raise ValueError("UniswapV2Library: INSUFFICIENT_LIQUIDITY")
+
+    return reserveIn * amountOut * PAIR_FEE_DENOMINATOR // ((reserveOut - amountOut) * (PAIR_FEE_DENOMINATOR - swapFee)) + 1
+
+# Solidity 0.8 reverts on underflow, so fee and slippage factors below zero have to fail the quote too.
+def _checked_sub(a, b):
+    if b > a:
+        raise ValueError("Arithmetic underflow")
+    return a - b
+
+# Pair fee BurnSwap swaps with at blockNumber: its own pairSwapFee in direct pair mode, the router's otherwise.
+def get_swap_fee(burnSwap, blockNumber="latest"):
+    if burnSwap.directPairSwaps(block_identifier=blockNumber):
+        return burnSwap.pairSwapFee(block_identifier=blockNumber)
+    return ROUTER_SWAP_FEE
+
+
+class BurnSwapQuoter:
+    """
+    Quotes BurnSwap.purchaseOBURN and sellOBURN without any RPC calls, reproducing the contract's integer math
+    step by step: the fee split, the slippage minimums, the ((100 + slippage) / 100) factor (which is 1 under integer
+    division) and the router's getAmountsIn/Out (or BurnSwap's own pair math in direct mode).
+
+    Pair reserves, the OBURN buy and sell fees and the swap fee (BurnSwap.pairSwapFee when it swaps directly on the
+    pair, the router's 0.3% otherwise) are cached and only reloaded by sync_to_block() when a new block is seen. Fee
+    exemptions are cached per address until the next block. Quotes assume BurnSwap is exempt from the OBURN transfer
+    fees, which the contract needs to work at all.
+    """
+
+    def __init__(self, burnSwap, oburnAddress, busdAddress):
+        self.burnSwap = burnSwap
+        self.oburnAddress = oburnAddress
+        self.busdAddress = busdAddress
+
+        self._oburn = OnlyBurns.at(oburnAddress)
+        # The pair BurnSwap trades against in direct mode, which the router's factory might map to a different pair
+        self._pair = interface.IUniswapV2Pair(burnSwap.quickSwapPair())
+        self._oburnIsToken0 = self._pair.token0().lower() == oburnAddress.lower()
+
+        self.blockNumber = None
+        self.reserveOBURN = 0
+        self.reserveBUSD = 0
+        self.buyFee = 0
+        self.sellFee = 0
+        self.swapFee = ROUTER_SWAP_FEE
+        self._exempt = {}
+
+    # Reloads reserves and fees if blockNumber (the latest block when None) hasn't been loaded yet. Returns True
+    # when anything was reloaded.
+    def sync_to_block(self, blockNumber=None):
+        if blockNumber is None:
+            blockNumber = web3.eth.block_number
+        if blockNumber == self.blockNumber:
+            return False
+
+        reserve0, reserve1, _ = self._pair.getReserves(block_identifier=blockNumber)
+        self.reserveOBURN, self.reserveBUSD = (reserve0, reserve1) if self._oburnIsToken0 else (reserve1, reserve0)
+        self.buyFee = self._oburn.buyFee(block_identifier=blockNumber)
+        self.sellFee = self._oburn.sellFee(block_identifier=blockNumber)
+        self.swapFee = get_swap_fee(self.burnSwap, blockNumber)
+        self._exempt = {}
+        self.blockNumber = blockNumber
+        return True
+
+    def is_exempt(self, user):
+        if user not in self._exempt:
+            self._exempt[user] = self.burnSwap.getAddressExemptFromFees(user, block_identifier=self.blockNumber)
+        return self._exempt[user]
+
+    # Mirrors BurnSwap.purchaseOBURN. Raises ValueError with the revert reason when the call would revert.
+    def quote_buy(self, amountOBURN, amountBUSD, slippage, exempt=False):
+        if slippage >= 100:
+            raise ValueError("Slippage must be less than 100.")
+        if amountOBURN == 0 and amountBUSD == 0:
+            raise ValueError("Either the amount of OBURN to buy or the amount of BUSD to sell must be specified.")
+
+        reserveIn, reserveOut = self.reserveBUSD, self.reserveOBURN
+        buyFee = self.buyFee
+
+        amountBUSDNeeded = amountBUSD
+        if amountBUSD == 0:
+            amountBUSDNeeded = get_amount_in(amountOBURN, reserveIn, reserveOut, self.swapFee) * ((100 + slippage) // 100)
+
+        busdFee = 0
+        amountBUSDAfterTax = amountBUSDNeeded
+        if not exempt:
+            busdFee = amountBUSDNeeded * buyFee // 100
+            amountBUSDAfterTax = amountBUSDNeeded * _checked_sub(100, buyFee) // 100
+
+        if amountBUSD > 0:
+            minimumOBURNNeeded = 0
+            if amountOBURN > 100:
+                if exempt:
+                    minimumOBURNNeeded = amountOBURN * _checked_sub(100, slippage) // 100
+                else:
+                    minimumOBURNNeeded = amountOBURN * _checked_sub(_checked_sub(100, slippage), buyFee) // 100
+
+            busdSwapped = amountBUSDAfterTax
+            oburnOut = get_amount_out(amountBUSDAfterTax, reserveIn, reserveOut, self.swapFee)
+            if oburnOut < minimumOBURNNeeded:
+                raise ValueError("UniswapV2Router: INSUFFICIENT_OUTPUT_AMOUNT")
+        else:
+            oburnOut = amountOBURN if exempt else amountOBURN * _checked_sub(100, buyFee) // 100
+            busdSwapped = get_amount_in(oburnOut, reserveIn, reserveOut, self.swapFee)
+            if busdSwapped > amountBUSDAfterTax:
+                raise ValueError("UniswapV2Router: EXCESSIVE_INPUT_AMOUNT")
+
+        return {
+            "busdIn": amountBUSDNeeded,
+            "busdFee": busdFee,
+            "busdSwapped": busdSwapped,
+            "busdRefund": amountBUSDAfterTax - busdSwapped,
+            "oburnOut": oburnOut,
+        }
+
+    # Mirrors BurnSwap.sellOBURN. Raises ValueError with the revert reason when the call would revert.
+    def quote_sell(self, amountOBURN, amountBUSD, slippage, exempt=False):
+        if slippage >= 100:
+            raise ValueError("Slippage must be less than 100.")
+        if amountOBURN == 0 and amountBUSD == 0:
+            raise ValueError("Either the amount of OBURN to buy or the amount of BUSD to sell must be specified.")
+
+        reserveIn, reserveOut = self.reserveOBURN, self.reserveBUSD
+        sellFee = self.sellFee
+
+        amountOBURNNeeded = amountOBURN
+        if amountOBURN == 0:
+            amountOBURNNeeded = get_amount_in(amountBUSD, reserveIn, reserveOut, self.swapFee) * ((100 + slippage) // 100)
+
+        oburnBurnt = 0
+        amountOBURNAfterTax = amountOBURNNeeded
+        if not exempt:
+            amountOBURNAfterTax = amountOBURNNeeded * _checked_sub(100, sellFee) // 100
+            oburnBurnt = amountOBURNNeeded * sellFee // 100
+
+        if amountOBURN > 0:
+            minimumBUSDNeeded = 0
+            if amountBUSD > 100:
+                if exempt:
+                    minimumBUSDNeeded = amountBUSD * _checked_sub(100, slippage) // 100
+                else:
+                    minimumBUSDNeeded = amountBUSD * _checked_sub(_checked_sub(100, slippage), sellFee) // 100
+
+            oburnSwapped = amountOBURNAfterTax
+            busdOut = get_amount_out(amountOBURNAfterTax, reserveIn, reserveOut, self.swapFee)
+            if busdOut < minimumBUSDNeeded:
+                raise ValueError("UniswapV2Router: INSUFFICIENT_OUTPUT_AMOUNT")
+        else:
+            busdOut = amountBUSD if exempt else amountBUSD * _checked_sub(100, sellFee) // 100
+            oburnSwapped = get_amount_in(busdOut, reserveIn, reserveOut, self.swapFee)
+            if oburnSwapped > amountOBURNAfterTax:
+                raise ValueError("UniswapV2Router: EXCESSIVE_INPUT_AMOUNT")
+
+        return {
+            "oburnIn": amountOBURNNeeded,
+            "oburnBurnt": oburnBurnt,
+            "oburnSwapped": oburnSwapped,
+            "oburnRefund": amountOBURNAfterTax - oburnSwapped,
+            "busdOut": busdOut,
+        }
+
+    # Quotes for a given user, looking up (and caching) their fee exemption.
+    def quote_buy_for(self, user, amountOBURN, amountBUSD, slippage):
+        return self.quote_buy(amountOBURN, amountBUSD, slippage, self.is_exempt(user))
+
+    def quote_sell_for(self, user, amountOBURN, amountBUSD, slippage):
+        return self.quote_sell(amountOBURN, amountBUSD, slippage, self.is_exempt(user))
+
+
+def main():
+    quoter = BurnSwapQuoter(BurnSwap.at(BURNSWAP_ADDRESS_TEST), OBURN_ADDRESS_TEST, USDC_ADDRESS_TEST)
+    quoter.sync_to_block()
+
+    amount = 100 * 10**18
+    print(f"Block {quoter.blockNumber}: {quoter.reserveOBURN} OBURN / {quoter.reserveBUSD} BUSD")
+    print(f"Buy with 100 BUSD: {quoter.quote_buy(0, amount, 5)}")
+    print(f"Sell 100 OBURN: {quoter.quote_sell(amount, 0, 5)}")
+
+    startTime = time.perf_counter()
+    for i in range(BENCHMARK_QUOTES):
+        quoter.quote_buy(0, amount + i, 5)
+    elapsed = time.perf_counter() - startTime
+    print(f"{BENCHMARK_QUOTES} quotes in {elapsed:.3f}s ({BENCHMARK_QUOTES / elapsed:.0f} quotes per second)")
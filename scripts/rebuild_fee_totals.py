@@ -0,0 +1,50 @@
+#!/usr/bin/python3
+from brownie import BurnSwap, network
+from pathlib import Path
+from scripts.event_indexer import CONFIRMATIONS, get_indexer
+from scripts.quote_engine import BURNSWAP_ADDRESS_TEST
+import json
+
+# Where the rebuilt per-address totals are written
+FEE_TOTALS_DIR = Path(__file__).parent.parent / "data" / "fee_totals"
+
+# First block to index from when the network's index is empty - set to the Burn Swap deployment block, so the
+# rebuilt totals can be checked against the on-chain totals.
+BURNSWAP_START_BLOCK = 0
+
+# Rebuilds every address's BUSD fees and OBURN burnt from the Burn Swap trade events, bringing the index up to date
+# first. Compares the sums with BurnSwap's global totals, which are kept whatever the accounting mode. Returns the
+# per-address totals and the differences from the on-chain totals (zero when the index covers every trade).
+def rebuild_fee_totals(burnSwap, indexer, startBlock=BURNSWAP_START_BLOCK, confirmations=CONFIRMATIONS):
+    indexer.index(startBlock=startBlock, confirmations=confirmations)
+
+    block = indexer.get_cursor("burnSwap")
+    totals = indexer.get_fee_totals()
+    busdCollected = sum(userTotals["busdCollected"] for userTotals in totals.values())
+    oburnBurnt = sum(userTotals["oburnBurnt"] for userTotals in totals.values())
+
+    drift = {
+        "busdCollected": busdCollected - burnSwap.BUSDCollected(block_identifier=block),
+        "oburnBurnt": oburnBurnt - burnSwap.OBURNBurnt(block_identifier=block),
+    }
+
+    print(f"\nRebuilt fee totals for {len(totals)} addresses up to block {block}")
+    print(f"  BUSD collected: {busdCollected} wei (drift from BUSDCollected {drift['busdCollected']:+d} wei)")
+    print(f"  OBURN burnt: {oburnBurnt} wei (drift from OBURNBurnt {drift['oburnBurnt']:+d} wei)")
+
+    return totals, drift
+
+def save_fee_totals(path, totals):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as totalsFile:
+        json.dump({user: {key: str(value) for key, value in userTotals.items()} for user, userTotals in totals.items()}, totalsFile, indent=4)
+
+def main():
+    burnSwap = BurnSwap.at(BURNSWAP_ADDRESS_TEST)
+    indexer = get_indexer(burnSwap)
+    totals, _ = rebuild_fee_totals(burnSwap, indexer)
+    indexer.close()
+
+    path = FEE_TOTALS_DIR / f"{network.show_active()}.json"
+    save_fee_totals(path, totals)
+    print(f"  Written to {path}")
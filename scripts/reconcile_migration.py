@@ -0,0 +1,123 @@
+#!/usr/bin/python3
+from brownie import Multicall, OnlyBurns, network, web3
+from scripts.helpers import get_account
+from scripts.holders import aggregate_holders
+from scripts.multicall import MULTICALL_ADDRESS, MulticallReader
+from scripts.plan_migration import OBURN_ADDRESS
+from web3 import Web3
+from hexbytes import HexBytes
+
+# Block to reconcile at - if None, the latest block is used.
+RECONCILE_BLOCK = None
+
+# First block of the migration. Transfers from the migration sender are scanned from here to find recipients that
+# aren't in the holder files. It has to be set before reconciling.
+MIGRATION_START_BLOCK = None
+
+# Number of blocks per eth_getLogs request when scanning the migration transfers.
+LOG_BLOCK_RANGE = 5000
+
+TRANSFER_TOPIC = Web3.keccak(text="Transfer(address,address,uint256)").hex()
+
+# Sums the OBURN sent by the migration sender to each recipient between fromBlock and toBlock.
+def get_migration_transfers(oburnAddress, sender, fromBlock, toBlock, blockRange=LOG_BLOCK_RANGE):
+    senderTopic = "0x" + "0" * 24 + sender[2:].lower()
+    received = {}
+
+    for start in range(fromBlock, toBlock + 1, blockRange):
+        logs = web3.eth.get_logs({
+            "address": oburnAddress,
+            "topics": [TRANSFER_TOPIC, senderTopic],
+            "fromBlock": start,
+            "toBlock": min(start + blockRange - 1, toBlock),
+        })
+        for log in logs:
+            recipient = Web3.toChecksumAddress("0x" + log["topics"][2].hex()[-40:])
+            amount = int.from_bytes(HexBytes(log["data"]), "big")
+            received[recipient] = received.get(recipient, 0) + amount
+
+    return received
+
+# Compares every holder's expected balance (exact wei from the holder files) with their OBURN balance at a block.
+# Balances that couldn't be read are reported as unreadable and left out of the totals.
+def reconcile_migration(OBURN, sender, reader, holderBalances, block=RECONCILE_BLOCK, fromBlock=MIGRATION_START_BLOCK):
+    if fromBlock is None:
+        raise Exception("Can't check for extra recipients without the migration start block - set MIGRATION_START_BLOCK")
+    if block is None:
+        block = web3.eth.block_number
+
+    holders = list(holderBalances.keys())
+    calls = [(OBURN.balanceOf, [holder]) for holder in holders]
+    calls += [(OBURN.totalSupply, []), (OBURN.balanceOf, [sender])]
+    results = reader.read(calls, block_identifier=block)
+
+    onChainBalances = dict(zip(holders, results[:len(holders)]))
+    totalSupply, senderBalance = results[len(holders):]
+    if totalSupply is None or senderBalance is None:
+        raise Exception(f"Couldn't read the OBURN total supply or the sender's balance at block {block}")
+
+    mismatches = []
+    missing = []
+    unreadable = []
+    for holder, expected in holderBalances.items():
+        actual = onChainBalances[holder]
+        if actual is None:
+            unreadable.append({"address": holder, "expected": expected})
+        elif actual == 0 and expected > 0:
+            missing.append({"address": holder, "expected": expected, "actual": 0})
+        elif actual != expected:
+            mismatches.append({"address": holder, "expected": expected, "actual": actual})
+
+    received = get_migration_transfers(OBURN.address, sender, fromBlock, block)
+    extra = [
+        {"address": recipient, "received": amount}
+        for recipient, amount in received.items() if recipient not in holderBalances
+    ]
+
+    # Totals only cover the holders whose balance could be read
+    readHolders = [holder for holder in holders if onChainBalances[holder] is not None]
+    totalExpected = sum(holderBalances[holder] for holder in readHolders)
+    totalHeld = sum(onChainBalances[holder] for holder in readHolders)
+
+    report = {
+        "block": block,
+        "holders": len(holders),
+        "matching": len(readHolders) - len(mismatches) - len(missing),
+        "mismatches": mismatches,
+        "missing": missing,
+        "unreadable": unreadable,
+        "extra": extra,
+        "totalExpected": totalExpected,
+        "totalHeld": totalHeld,
+        "holderDrift": totalHeld - totalExpected,
+        "totalSupply": totalSupply,
+        "senderBalance": senderBalance,
+        # Supply that is neither with the sender nor with a listed holder (pairs, burns, extra recipients, ...)
+        "supplyDrift": totalSupply - senderBalance - totalHeld,
+    }
+
+    print(f"\nMigration reconciliation on {network.show_active()} at block {block}:")
+    print(f"  Holders checked: {report['holders']} ({report['matching']} match)")
+    print(f"  Mismatched balances: {len(mismatches)}")
+    for row in mismatches:
+        print(f"    {row['address']}: expected {row['expected']} wei, holds {row['actual']} wei")
+    print(f"  Missing recipients: {len(missing)}")
+    for row in missing:
+        print(f"    {row['address']}: expected {row['expected']} wei")
+    print(f"  Unreadable balances: {len(unreadable)}")
+    for row in unreadable:
+        print(f"    {row['address']}: balanceOf reverted, expected {row['expected']} wei")
+    print(f"  Extra recipients: {len(extra)}")
+    for row in extra:
+        print(f"    {row['address']}: received {row['received']} wei")
+    print(f"  Total expected (readable holders): {totalExpected} wei")
+    print(f"  Total held by listed holders: {totalHeld} wei (drift {report['holderDrift']:+d} wei)")
+    print(f"  Total supply: {totalSupply} wei, sender holds {senderBalance} wei")
+    print(f"  Supply not held by the sender or listed holders: {report['supplyDrift']} wei")
+
+    return report
+
+def main():
+    account = get_account()
+    reader = MulticallReader(Multicall.at(MULTICALL_ADDRESS))
+    reconcile_migration(OnlyBurns.at(OBURN_ADDRESS), account.address, reader, aggregate_holders())
@@ -0,0 +1,270 @@
+#!/usr/bin/python3
+from brownie import BurnSwap, OnlyBurns, interface
+from scripts.deploy_burn_swap import OBURN_ADDRESS_TEST
+from scripts.quote_engine import BURNSWAP_ADDRESS_TEST, PAIR_FEE_DENOMINATOR, ROUTER_SWAP_FEE, get_amount_out, get_swap_fee
+import math
+import numpy as np
+import time
+
+# OnlyBurns._calculateFee takes amount * fee / 10**10 on transfers to and from the pair, while BurnSwap takes the
+# same fee values as a percentage of the trade.
+ONLYBURNS_FEE_DENOMINATOR = 10**10
+BURNSWAP_FEE_DENOMINATOR = 100
+
+# Order flow used by main(): number of independent paths simulated side by side and trades per path
+SIMULATION_PATHS = 100000
+SIMULATION_STEPS = 100
+
+# Slippage passed to BurnSwap when replaying orders on chain. Orders are exact-input, so it never changes the result.
+REPLAY_SLIPPAGE = 5
+
+# Fee BurnSwap takes from a trade, as in purchaseOBURN (busdFee) and sellOBURN (oburnBurnt).
+def burnswap_fee(amount, fee):
+    return amount * fee // BURNSWAP_FEE_DENOMINATOR
+
+# Fee OnlyBurns takes from a taxed transfer, as in _calculateFee.
+def onlyburns_fee(amount, fee):
+    return amount * fee // ONLYBURNS_FEE_DENOMINATOR
+
+# Random order flow of shape (steps, paths). Every order is an exact-input trade sized in BUSD (lognormal around
+# medianTradeBUSD wei) - sells are converted to OBURN at the pool's spot price when they execute. viaBurnSwap orders
+# go through BurnSwap and pay its percentage fees, the rest trade on the pair directly and pay OnlyBurns' transfer
+# fees. exempt orders come from fee exempt addresses.
+def generate_order_flow(steps, paths, seed=0, buyShare=0.5, medianTradeBUSD=100 * 10**18, sigma=1.0, burnSwapShare=0.8, exemptShare=0.0):
+    rng = np.random.default_rng(seed)
+    shape = (steps, paths)
+
+    return {
+        "isBuy": rng.random(shape) < buyShare,
+        "busdValue": np.floor(rng.lognormal(math.log(medianTradeBUSD), sigma, shape)),
+        "viaBurnSwap": rng.random(shape) < burnSwapShare,
+        "exempt": rng.random(shape) < exemptShare,
+    }
+
+# Returns the orders of a single path as a list of dicts with integer BUSD values, for ExactSimulator.
+def get_path_orders(orders, path=0):
+    return [
+        {
+            "isBuy": bool(orders["isBuy"][step, path]),
+            "busdValue": int(orders["busdValue"][step, path]),
+            "viaBurnSwap": bool(orders["viaBurnSwap"][step, path]),
+            "exempt": bool(orders["exempt"][step, path]),
+        }
+        for step in range(orders["isBuy"].shape[0])
+    ]
+
+
+class ExactSimulator:
+    """
+    Integer reference for one OBURN/BUSD pool, reproducing the contracts' math wei for wei.
+
+    BurnSwap orders take buyFee% of the BUSD in (kept by BurnSwap) or sellFee% of the OBURN in (burnt) before the
+    swap, and BurnSwap is exempt from the OBURN transfer fees. Direct orders pay OnlyBurns' fees instead: buys lose
+    buyFee / 10**10 of the OBURN coming out of the pair (to the Service Wallet) and sells lose sellFee / 10**10 of the
+    OBURN going in (burnt), so the pair only swaps what it receives, as a fee-on-transfer router swap does. Every
+    swap pays swapFee basis points to the pool (BurnSwap.pairSwapFee when BurnSwap swaps directly on the pair).
+    """
+
+    def __init__(self, reserveOBURN, reserveBUSD, buyFee, sellFee, swapFee=ROUTER_SWAP_FEE):
+        self.reserveOBURN = reserveOBURN
+        self.reserveBUSD = reserveBUSD
+        self.buyFee = buyFee
+        self.sellFee = sellFee
+        self.swapFee = swapFee
+        self.serviceBUSD = 0
+        self.serviceOBURN = 0
+        self.burntOBURN = 0
+        self.volumeBUSD = 0
+
+    def totals(self):
+        return {
+            "reserveOBURN": self.reserveOBURN,
+            "reserveBUSD": self.reserveBUSD,
+            "serviceBUSD": self.serviceBUSD,
+            "serviceOBURN": self.serviceOBURN,
+            "burntOBURN": self.burntOBURN,
+            "volumeBUSD": self.volumeBUSD,
+        }
+
+    # Applies one order and returns the trade: the amount in, the fee BurnSwap or OnlyBurns took, the amount the pair
+    # swapped and the amount out (before the OnlyBurns buy fee for direct buys).
+    def apply(self, isBuy, busdValue, viaBurnSwap, exempt):
+        amountIn = busdValue if isBuy else busdValue * self.reserveOBURN // self.reserveBUSD
+        fee = 0
+        swapIn = amountIn
+
+        if viaBurnSwap and not exempt:
+            feePercent = self.buyFee if isBuy else self.sellFee
+            fee = burnswap_fee(amountIn, feePercent)
+            swapIn = amountIn * (BURNSWAP_FEE_DENOMINATOR - feePercent) // BURNSWAP_FEE_DENOMINATOR
+        elif not isBuy and not exempt:
+            fee = onlyburns_fee(amountIn, self.sellFee)
+            swapIn = amountIn - fee
+
+        if isBuy:
+            amountOut = get_amount_out(swapIn, self.reserveBUSD, self.reserveOBURN, self.swapFee)
+            self.reserveBUSD += swapIn
+            self.reserveOBURN -= amountOut
+            self.volumeBUSD += amountIn
+            if viaBurnSwap:
+                self.serviceBUSD += fee
+            elif not exempt:
+                fee = onlyburns_fee(amountOut, self.buyFee)
+                self.serviceOBURN += fee
+        else:
+            amountOut = get_amount_out(swapIn, self.reserveOBURN, self.reserveBUSD, self.swapFee)
+            self.reserveOBURN += swapIn
+            self.reserveBUSD -= amountOut
+            self.volumeBUSD += amountOut
+            self.burntOBURN += fee
+
+        return {"amountIn": amountIn, "fee": fee, "swapIn": swapIn, "amountOut": amountOut}
+
+    def run(self, pathOrders):
+        return [
+            self.apply(order["isBuy"], order["busdValue"], order["viaBurnSwap"], order["exempt"])
+            for order in pathOrders
+        ]
+
+
+# Runs every path of the order flow at once, one step at a time. Follows ExactSimulator step for step (including
+# every integer division's rounding) but in float64, so the results match the exact simulator to within float
+# precision rather than to the wei. Reserves can be scalars or one value per path. Returns the per-path totals.
+def simulate_vectorized(orders, reserveOBURN, reserveBUSD, buyFee, sellFee, swapFee=ROUTER_SWAP_FEE):
+    steps, paths = orders["isBuy"].shape
+    reserveOBURN = np.full(paths, reserveOBURN, dtype=np.float64)
+    reserveBUSD = np.full(paths, reserveBUSD, dtype=np.float64)
+    serviceBUSD = np.zeros(paths)
+    serviceOBURN = np.zeros(paths)
+    burntOBURN = np.zeros(paths)
+    volumeBUSD = np.zeros(paths)
+
+    for step in range(steps):
+        isBuy = orders["isBuy"][step]
+        viaBurnSwap = orders["viaBurnSwap"][step]
+        charged = ~orders["exempt"][step]
+        value = orders["busdValue"][step]
+
+        amountIn = np.where(isBuy, value, np.floor(value * reserveOBURN / reserveBUSD))
+
+        feePercent = np.where(viaBurnSwap & charged, np.where(isBuy, buyFee, sellFee), 0)
+        burnSwapFee = np.floor(amountIn * feePercent / BURNSWAP_FEE_DENOMINATOR)
+        sellTax = np.where(~isBuy & ~viaBurnSwap & charged, np.floor(amountIn * sellFee / ONLYBURNS_FEE_DENOMINATOR), 0)
+        swapIn = np.floor(amountIn * (BURNSWAP_FEE_DENOMINATOR - feePercent) / BURNSWAP_FEE_DENOMINATOR) - sellTax
+
+        reserveIn = np.where(isBuy, reserveBUSD, reserveOBURN)
+        reserveOut = np.where(isBuy, reserveOBURN, reserveBUSD)
+        amountInWithFee = swapIn * (PAIR_FEE_DENOMINATOR - swapFee)
+        amountOut = np.floor(amountInWithFee * reserveOut / (reserveIn * PAIR_FEE_DENOMINATOR + amountInWithFee))
+        buyTax = np.where(isBuy & ~viaBurnSwap & charged, np.floor(amountOut * buyFee / ONLYBURNS_FEE_DENOMINATOR), 0)
+
+        reserveBUSD = np.where(isBuy, reserveBUSD + swapIn, reserveBUSD - amountOut)
+        reserveOBURN = np.where(isBuy, reserveOBURN - amountOut, reserveOBURN + swapIn)
+        serviceBUSD += np.where(isBuy, burnSwapFee, 0)
+        serviceOBURN += buyTax
+        burntOBURN += np.where(isBuy, 0, burnSwapFee) + sellTax
+        volumeBUSD += np.where(isBuy, amountIn, amountOut)
+
+    return {
+        "reserveOBURN": reserveOBURN,
+        "reserveBUSD": reserveBUSD,
+        "serviceBUSD": serviceBUSD,
+        "serviceOBURN": serviceOBURN,
+        "burntOBURN": burntOBURN,
+        "volumeBUSD": volumeBUSD,
+    }
+
+# Largest relative difference between the vectorized totals of one path and the exact simulator's totals.
+def get_max_relative_error(vectorizedTotals, exactTotals, path=0):
+    return max(
+        abs(float(vectorizedTotals[key][path]) - value) / max(abs(value), 1)
+        for key, value in exactTotals.items()
+    )
+
+def _get_pair_reserves(pair, oburnAddress):
+    reserve0, reserve1, _ = pair.getReserves()
+    return (reserve0, reserve1) if pair.token0().lower() == oburnAddress.lower() else (reserve1, reserve0)
+
+# Replays the BurnSwap orders of one path on chain from trader (which must hold and have approved enough OBURN and
+# BUSD) and checks the pair reserves, BurnSwap's fee totals and the trader's balances against ExactSimulator after
+# every trade. Direct orders are left out, since they need OnlyBurns' taxed transfers and a fee-on-transfer router
+# (see replay_onlyburns_fees). Returns the mismatches, which is empty when the simulator matches the chain.
+def replay_burn_swap_orders(burnSwap, pair, OBURN, BUSD, trader, pathOrders):
+    exempt = burnSwap.getAddressExemptFromFees(trader.address)
+    reserveOBURN, reserveBUSD = _get_pair_reserves(pair, OBURN.address)
+    simulator = ExactSimulator(reserveOBURN, reserveBUSD, OBURN.buyFee(), OBURN.sellFee(), get_swap_fee(burnSwap))
+    mismatches = []
+
+    for step, order in enumerate(order for order in pathOrders if order["viaBurnSwap"]):
+        busdCollected, oburnBurnt = burnSwap.BUSDCollected(), burnSwap.OBURNBurnt()
+        oburnBalance, busdBalance = OBURN.balanceOf(trader.address), BUSD.balanceOf(trader.address)
+
+        trade = simulator.apply(order["isBuy"], order["busdValue"], True, exempt)
+        if order["isBuy"]:
+            burnSwap.purchaseOBURN(0, trade["amountIn"], REPLAY_SLIPPAGE, {"from": trader})
+            expected = {"oburnChange": trade["amountOut"], "busdChange": -trade["amountIn"], "busdCollected": trade["fee"], "oburnBurnt": 0}
+        else:
+            burnSwap.sellOBURN(trade["amountIn"], 0, REPLAY_SLIPPAGE, {"from": trader})
+            expected = {"oburnChange": -trade["amountIn"], "busdChange": trade["amountOut"], "busdCollected": 0, "oburnBurnt": trade["fee"]}
+
+        reserveOBURN, reserveBUSD = _get_pair_reserves(pair, OBURN.address)
+        actual = {
+            "oburnChange": OBURN.balanceOf(trader.address) - oburnBalance,
+            "busdChange": BUSD.balanceOf(trader.address) - busdBalance,
+            "busdCollected": burnSwap.BUSDCollected() - busdCollected,
+            "oburnBurnt": burnSwap.OBURNBurnt() - oburnBurnt,
+        }
+        expected.update({"reserveOBURN": simulator.reserveOBURN, "reserveBUSD": simulator.reserveBUSD})
+        actual.update({"reserveOBURN": reserveOBURN, "reserveBUSD": reserveBUSD})
+
+        for key, value in expected.items():
+            if actual[key] != value:
+                mismatches.append({"step": step, "key": key, "expected": value, "actual": actual[key]})
+
+    return mismatches
+
+# Replays taxed transfers between trader and dexAccount (an OnlyBurns DEX swap address standing in for the pair)
+# and checks the fees OnlyBurns holds for the Service Wallet and the Dead Wallet against onlyburns_fee after every
+# transfer. Returns the mismatches, which is empty when the simulator's fees match the chain.
+def replay_onlyburns_fees(oburn, dexAccount, trader, amounts, isBuy):
+    buyFee, sellFee = oburn.buyFee(), oburn.sellFee()
+    mismatches = []
+
+    for step, (amount, buy) in enumerate(zip(amounts, isBuy)):
+        serviceFees, burnFees = oburn.pendingFees()
+        if buy:
+            oburn.transfer(trader.address, amount, {"from": dexAccount})
+            expected = (serviceFees + onlyburns_fee(amount, buyFee), burnFees)
+        else:
+            oburn.transfer(dexAccount.address, amount, {"from": trader})
+            expected = (serviceFees, burnFees + onlyburns_fee(amount, sellFee))
+
+        actual = tuple(oburn.pendingFees())
+        if actual != expected:
+            mismatches.append({"step": step, "expected": expected, "actual": actual})
+
+    return mismatches
+
+def main():
+    burnSwap = BurnSwap.at(BURNSWAP_ADDRESS_TEST)
+    OBURN = OnlyBurns.at(OBURN_ADDRESS_TEST)
+    pair = interface.IUniswapV2Pair(burnSwap.quickSwapPair())
+    reserveOBURN, reserveBUSD = _get_pair_reserves(pair, OBURN_ADDRESS_TEST)
+    buyFee, sellFee, swapFee = OBURN.buyFee(), OBURN.sellFee(), get_swap_fee(burnSwap)
+    print(f"Pool: {reserveOBURN} OBURN / {reserveBUSD} BUSD, buy fee {buyFee}, sell fee {sellFee}, swap fee {swapFee}")
+
+    orders = generate_order_flow(SIMULATION_STEPS, SIMULATION_PATHS)
+    startTime = time.perf_counter()
+    totals = simulate_vectorized(orders, reserveOBURN, reserveBUSD, buyFee, sellFee, swapFee)
+    elapsed = time.perf_counter() - startTime
+    trades = SIMULATION_STEPS * SIMULATION_PATHS
+    print(f"{trades} trades in {elapsed:.3f}s ({trades / elapsed:.0f} trades per second)")
+
+    exactTotals = ExactSimulator(reserveOBURN, reserveBUSD, buyFee, sellFee, swapFee)
+    exactTotals.run(get_path_orders(orders))
+    print(f"Largest relative error against the exact simulator (path 0): {get_max_relative_error(totals, exactTotals.totals()):.2e}")
+
+    print(f"\nForecast over {SIMULATION_STEPS} trades ({SIMULATION_PATHS} paths, 5th / 50th / 95th percentile):")
+    for key, label in [("serviceBUSD", "Service BUSD (BurnSwap)"), ("serviceOBURN", "Service OBURN (OnlyBurns)"), ("burntOBURN", "OBURN burnt")]:
+        low, median, high = np.percentile(totals[key], [5, 50, 95]) / 10**18
+        print(f"  {label}: {low:.4f} / {median:.4f} / {high:.4f}")
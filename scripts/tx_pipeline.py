@@ -0,0 +1,198 @@
+#!/usr/bin/python3
+from brownie import web3
+from brownie.network.transaction import Status
+from web3.exceptions import TransactionNotFound
+import time
+
+# Number of transactions allowed to be pending at the same time.
+MAX_IN_FLIGHT = 10
+
+# Seconds a transaction can stay unmined before it is checked for having been dropped from the mempool.
+DROPPED_TX_TIMEOUT = 120
+
+# Number of times a dropped transaction is resent before the pipeline gives up.
+MAX_RETRIES = 3
+
+# Fraction the gas price is raised by when a dropped transaction is resent with the same nonce. geth and bsc nodes
+# reject a replacement that isn't at least 10% more expensive ("replacement transaction underpriced").
+RESEND_GAS_PRICE_BUMP = 0.125
+
+# Seconds to sleep between receipt checks while waiting on in-flight transactions.
+POLL_INTERVAL = 0.5
+
+
+class TransactionReverted(Exception):
+    pass
+
+
+class TransactionPipeline:
+    """
+    Submits many transactions from one account without waiting on each receipt.
+
+    Nonces are handed out locally, up to maxInFlight transactions are kept pending at once and receipts are
+    collected by brownie's confirmation threads in the background. Dropped transactions are resent, and the
+    pipeline stops accepting work on the first revert, waits for whatever is still in flight and raises
+    TransactionReverted.
+
+    The optional callbacks let callers record progress (see scripts/migration_journal.py):
+        onSending(label, nonce) - right before a transaction is broadcast
+        onSent(label, nonce, txHash) - once the transaction hash is known (again after every resend)
+        onConfirmed(label, receipt) / onReverted(label, receipt) - once the receipt is collected
+
+    Usage:
+        pipeline = TransactionPipeline(account)
+        for recipient, amount in transfers:
+            pipeline.submit(OBURN.transfer, recipient, amount)
+        receipts = pipeline.flush()
+    """
+
+    def __init__(
+        self,
+        account,
+        maxInFlight=MAX_IN_FLIGHT,
+        droppedTxTimeout=DROPPED_TX_TIMEOUT,
+        maxRetries=MAX_RETRIES,
+        onSending=None,
+        onSent=None,
+        onConfirmed=None,
+        onReverted=None,
+    ):
+        self.account = account
+        self.maxInFlight = maxInFlight
+        self.droppedTxTimeout = droppedTxTimeout
+        self.maxRetries = maxRetries
+        self.nextNonce = account.nonce
+        self.inFlight = []
+        self.receipts = []
+        self.revertedTx = None
+        self.stopReason = None
+        self.onSending = onSending
+        self.onSent = onSent
+        self.onConfirmed = onConfirmed
+        self.onReverted = onReverted
+
+    def submit(self, contractFunction, *args, label=None):
+        if self.stopReason is not None:
+            raise TransactionReverted(f"Pipeline is stopped: {self.stopReason}")
+
+        while len(self.inFlight) >= self.maxInFlight:
+            self._wait_for_progress()
+
+        entry = {
+            "function": contractFunction,
+            "args": args,
+            "label": label,
+            "nonce": self.nextNonce,
+            "retries": 0,
+        }
+
+        try:
+            self._send(entry)
+        except Exception as ex:
+            # The transaction failed before broadcasting (usually a revert during gas estimation), so the
+            # nonce was never used. Let the transactions already in flight land before stopping.
+            self.stopReason = f"failed to send {label or contractFunction}: {ex}"
+            self._drain()
+            raise TransactionReverted(self.stopReason) from ex
+
+        self.nextNonce += 1
+        self.inFlight.append(entry)
+        self._collect()
+
+        return entry["tx"]
+
+    def flush(self):
+        self._drain()
+
+        if self.stopReason is not None:
+            raise TransactionReverted(self.stopReason)
+
+        return self.receipts
+
+    def _send(self, entry):
+        if self.onSending:
+            self.onSending(entry["label"], entry["nonce"])
+
+        txParams = {"from": self.account, "nonce": entry["nonce"], "required_confs": 0}
+        if entry.get("gasPrice"):
+            txParams["gas_price"] = entry["gasPrice"]
+
+        entry["tx"] = entry["function"](*entry["args"], txParams)
+        entry["sentAt"] = time.time()
+
+        if self.onSent:
+            self.onSent(entry["label"], entry["nonce"], entry["tx"].txid)
+
+    def _resend(self, entry, nonce):
+        entry["retries"] += 1
+        if entry["retries"] > self.maxRetries:
+            # Its nonce is never filled, so nothing sent after it could be mined. Stop accepting work.
+            self.stopReason = f"transaction {entry['tx'].txid} was dropped {self.maxRetries} times"
+            raise TransactionReverted(self.stopReason)
+
+        print(f"Resending dropped transaction {entry['tx'].txid} with nonce {nonce}")
+        if nonce == entry["nonce"] and entry["tx"].gas_price:
+            # A same-nonce resend replaces the original if a node still has it, which needs a higher gas price.
+            entry["gasPrice"] = int(entry["tx"].gas_price * (1 + RESEND_GAS_PRICE_BUMP)) + 1
+        entry["nonce"] = nonce
+
+        try:
+            self._send(entry)
+        except ValueError as ex:
+            # The original transaction is still known to the node or has just been mined, so keep waiting on it.
+            stillPending = ["already known", "nonce too low", "replacement transaction underpriced"]
+            if not any(message in str(ex) for message in stillPending):
+                raise
+            entry["sentAt"] = time.time()
+
+    def _is_dropped_from_mempool(self, entry):
+        if time.time() - entry["sentAt"] < self.droppedTxTimeout:
+            return False
+
+        try:
+            web3.eth.get_transaction(entry["tx"].txid)
+            entry["sentAt"] = time.time()
+            return False
+        except TransactionNotFound:
+            return True
+
+    def _collect(self):
+        for entry in list(self.inFlight):
+            tx = entry["tx"]
+
+            if tx.status == Status.Confirmed:
+                self.inFlight.remove(entry)
+                self.receipts.append(tx)
+                if self.onConfirmed:
+                    self.onConfirmed(entry["label"], tx)
+            elif tx.status == Status.Reverted:
+                self.inFlight.remove(entry)
+                if self.onReverted:
+                    self.onReverted(entry["label"], tx)
+                if self.revertedTx is None:
+                    print(f"Transaction {tx.txid} ({entry['label'] or tx.fn_name}) reverted, stopping the pipeline")
+                    self.revertedTx = tx
+                    self.stopReason = f"transaction {tx.txid} reverted"
+            elif tx.status == Status.Dropped:
+                # Another transaction used this nonce, so the work has to go out under a new one.
+                self._resend(entry, self.nextNonce)
+                self.nextNonce += 1
+            elif self._is_dropped_from_mempool(entry):
+                # The nonce is still free, so the same nonce is reused to keep the sequence gapless.
+                self._resend(entry, entry["nonce"])
+
+    def _wait_for_progress(self):
+        inFlightCount = len(self.inFlight)
+        while self.inFlight and len(self.inFlight) >= inFlightCount:
+            self._collect()
+            if self.stopReason is not None:
+                self._drain()
+                raise TransactionReverted(self.stopReason)
+            if len(self.inFlight) >= inFlightCount:
+                time.sleep(POLL_INTERVAL)
+
+    def _drain(self):
+        while self.inFlight:
+            self._collect()
+            if self.inFlight:
+                time.sleep(POLL_INTERVAL)
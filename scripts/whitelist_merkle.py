@@ -0,0 +1,51 @@
+#!/usr/bin/python3
+from brownie import OburnTokenPresale
+from pathlib import Path
+from scripts.helpers import get_account
+from scripts.merkle import MERKLE_OUTPUT_DIR, WhitelistTree
+from web3 import Web3
+import csv
+
+# CSV of whitelisted addresses, one per row in the first column (an "Address" header row is skipped)
+WHITELIST_FILE = Path(__file__).parent.parent / "data" / "whitelist.csv"
+
+# Presale to set the whitelist root on - if None, the root and proofs are only written to MERKLE_OUTPUT_DIR.
+PRESALE_ADDRESS = None
+
+# Streams the checksummed addresses from a whitelist CSV, raising on anything that isn't an address.
+def read_whitelist(path=WHITELIST_FILE):
+    with open(path, "r") as whitelistFile:
+        for lineNumber, row in enumerate(csv.reader(whitelistFile, delimiter=","), start=1):
+            if not row or not row[0].strip() or row[0].strip() == "Address":
+                continue
+            try:
+                yield Web3.toChecksumAddress(row[0].strip())
+            except ValueError:
+                raise ValueError(f"Invalid address {row[0]!r} on line {lineNumber} of {Path(path).name}")
+
+# Builds the whitelist tree from a CSV and writes the root and every address's proof to proofsPath.
+def build_whitelist_tree(path=WHITELIST_FILE, proofsPath=None):
+    tree = WhitelistTree(read_whitelist(path))
+
+    if proofsPath is None:
+        proofsPath = MERKLE_OUTPUT_DIR / "whitelist.json"
+    Path(proofsPath).parent.mkdir(parents=True, exist_ok=True)
+    tree.write_proofs_json(proofsPath)
+
+    print(f"Whitelist Merkle root for {len(tree)} addresses: 0x{tree.root.hex()}")
+    print(f"Proofs written to {proofsPath}")
+
+    return tree
+
+# Whitelists every address in the tree with a single transaction.
+def set_whitelist_root(oburnTokenPresale, tree):
+    account = get_account()
+    tx = oburnTokenPresale.setWhitelistMerkleRoot("0x" + tree.root.hex(), {"from": account})
+    tx.wait(1)
+    print(f"Whitelist Merkle root set on {oburnTokenPresale.address}")
+    return tx
+
+def main():
+    tree = build_whitelist_tree()
+    if PRESALE_ADDRESS:
+        set_whitelist_root(OburnTokenPresale.at(PRESALE_ADDRESS), tree)
@@ -0,0 +1,48 @@
+from scripts.helpers import get_account
+from scripts.deploy import deploy_presale_and_exchange
+from scripts.deploy_mocks import deploy_mocks, add_mock_liquidity
+from scripts.deploy_token import deploy_oburn_token
+from brownie import BurnSwap
+import pytest
+
+# Amount of each token seeded into the mock OBURN/BUSD pair (a 1:1 price).
+MOCK_PAIR_LIQUIDITY = 10**24
+
+# Deployments are shared by every test in a module. Each test runs against a chain snapshot taken after them
+# (fn_isolation) and the snapshot is reverted afterwards, so one test's transactions never leak into the next.
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    pass
+
+# Mock tokens and Uniswap contracts: (genericToken1, genericToken2, genericToken3, factory, router).
+@pytest.fixture(scope="module")
+def mocks(module_isolation):
+    return deploy_mocks()
+
+# Presale and TBURN to OBURN exchange using the first two mock tokens as TBURN and OBURN and the third as USDC.
+# Presale funds are collected by the owner account.
+@pytest.fixture(scope="module")
+def presale_and_exchange(mocks):
+    TBURN, OBURN, USDC, _, _ = mocks
+    return deploy_presale_and_exchange(TBURN.address, OBURN.address, get_account().address, USDC.address)
+
+# OBURN token wired to the mock router, with the second account as the service wallet.
+@pytest.fixture(scope="module")
+def oburn_token(mocks):
+    _, _, USDC, _, mockUniswapV2Router02 = mocks
+    return deploy_oburn_token(mockUniswapV2Router02.address, get_account(2).address, USDC.address)
+
+# Burn Swap routed through a mock OBURN/BUSD pair, using the first mock token as OBURN (10% buy and sell fee) and the
+# third as BUSD. Returns (burnSwap, pair).
+@pytest.fixture(scope="module")
+def burn_swap(mocks):
+    OBURN, _, BUSD, mockUniswapV2Factory, mockUniswapV2Router02 = mocks
+    pair = add_mock_liquidity(mockUniswapV2Factory, OBURN, BUSD, MOCK_PAIR_LIQUIDITY, MOCK_PAIR_LIQUIDITY)
+    burnSwap = BurnSwap.deploy(
+        mockUniswapV2Router02.address,
+        pair.address,
+        OBURN.address,
+        BUSD.address,
+        {"from": get_account()},
+    )
+    return burnSwap, pair
@@ -0,0 +1,52 @@
+from scripts.helpers import get_account
+from scripts.deploy_batch_sender import deploy_batch_sender
+from brownie import network, accounts, exceptions, chain
+from web3 import Web3
+import pytest
+
+# Tests to make sure the owner can send tokens to many holders in a single batch transaction.
+def test_owner_can_batch_transfer(mocks):
+    # Arrange
+    account = get_account()
+    recipients = [get_account(2).address, get_account(3).address, get_account(4).address]
+    amounts = [Web3.toWei(100, "ether"), Web3.toWei(250, "ether"), 1]
+
+    OBURN, _, _, _, _ = mocks
+    batchSender = deploy_batch_sender()
+
+    initialOBURNBalance = OBURN.balanceOf(account.address)
+
+    # Act
+    OBURN.approve(batchSender.address, sum(amounts), {"from": account})
+    tx = batchSender.batchTransfer(OBURN.address, recipients, amounts, {"from": account})
+
+    # Assert
+    for recipient, amount in zip(recipients, amounts):
+        assert OBURN.balanceOf(recipient) == amount
+    assert OBURN.balanceOf(account.address) == initialOBURNBalance - sum(amounts)
+    assert OBURN.allowance(account.address, batchSender.address) == 0
+    assert tx.events["BatchSent"]["recipientCount"] == len(recipients)
+    assert tx.events["BatchSent"]["totalAmount"] == sum(amounts)
+
+# Tests to make sure a batch reverts as a whole if the inputs are invalid or the allowance is too low.
+def test_batch_transfer_reverts_on_bad_input(mocks):
+    # Arrange
+    account = get_account()
+    recipients = [get_account(2).address, get_account(3).address]
+    amounts = [Web3.toWei(100, "ether"), Web3.toWei(250, "ether")]
+
+    OBURN, _, _, _, _ = mocks
+    batchSender = deploy_batch_sender()
+
+    # Act / Assert
+    with pytest.raises(exceptions.VirtualMachineError) as ex:
+        batchSender.batchTransfer(OBURN.address, recipients, amounts[:1], {"from": account})
+    assert "Recipients and amounts must be the same length." in str(ex.value)
+
+    OBURN.approve(batchSender.address, amounts[0], {"from": account})
+
+    with pytest.raises(exceptions.VirtualMachineError) as ex:
+        batchSender.batchTransfer(OBURN.address, recipients, amounts, {"from": account})
+    assert "ERC20: insufficient allowance" in str(ex.value)
+
+    assert OBURN.balanceOf(recipients[0]) == 0
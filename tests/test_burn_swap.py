@@ -1,14 +1,9 @@
-from scripts.helpers import get_account
-from brownie import network, accounts, exceptions, chain, BurnSwap, MockToken
-from brownie.network.contract import Contract, InterfaceContainer
+from scripts.helpers import get_account, sign_permit
+from brownie import network, accounts, exceptions, chain
 from web3 import Web3
 import pytest
 import time
 
-BURNSWAP_ADDRESS_TEST = "0xb14ebE9405B76509cF0b67B6340f5287f7d53F4E"
-MOCK_USDC_ADDRESS_TEST = "0x7f8754f9cc58a8ffa69c755ae425e84b55bb3a0d"
-MOCK_OBURN_ADDRESS_TEST = "0x90a603fa876980b38cb6415c0328aeec6c33c3f4"
-ROUTER_ADDRESS_TEST = "0x9Ac64Cc6e4415144C455BD8E4837Fea55603e5c3"
 DEAD_WALLET = "0x000000000000000000000000000000000000dEaD"
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -22,18 +17,12 @@ DEAD_WALLET = "0x000000000000000000000000000000000000dEaD"
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ 
 
 # Tests to make sure users can buy OBURN with USDC with the Burn Swap contract.
-def test_user_can_buy_oburn(interface):
+def test_user_can_buy_oburn(mocks, burn_swap):
     # Arrange
     account = get_account()
     
-    burnSwapABI = BurnSwap.abi
-    burnSwap = Contract.from_abi("BurnSwap", BURNSWAP_ADDRESS_TEST, burnSwapABI)
-
-    tokenABI = MockToken.abi
-    usdc = Contract.from_abi("MockToken", MOCK_USDC_ADDRESS_TEST, tokenABI)
-    oburn = Contract.from_abi("MockToken", MOCK_OBURN_ADDRESS_TEST, tokenABI)
-
-    quickswapRouter = interface.IUniswapV2Router02(ROUTER_ADDRESS_TEST)
+    oburn, _, usdc, _, quickswapRouter = mocks
+    burnSwap, _ = burn_swap
 
     # Act
     amountUSDCIn = 1000
@@ -46,7 +35,7 @@ def test_user_can_buy_oburn(interface):
     amounts = quickswapRouter.getAmountsOut(amountUSDCIn, [usdc, oburn])
     amountOBURNOut = amounts[1]
 
-    usdc.approve(BURNSWAP_ADDRESS_TEST, amountUSDCIn, {"from": account})
+    usdc.approve(burnSwap.address, amountUSDCIn, {"from": account})
     burnSwap.purchaseOBURN(amountOBURNOut, amountUSDCIn, slippage, {"from": account})
 
     # Assert
@@ -61,23 +50,17 @@ def test_user_can_buy_oburn(interface):
 
     assert burnSwapUSDCBalance == initialBurnSwapUSDCBalance + (amountUSDCIn * buyFee / 100)
 
-    burnSwap.withdrawUSDC({"from": account})
+    burnSwap.withdrawBUSD({"from": account})
 
     assert usdc.balanceOf(account.address) == initialUSDCBalance + burnSwapUSDCBalance
 
 # Tests to make sure users can buy OBURN with USDC with the Burn Swap contract when only specifying USDC amount
-def test_user_can_buy_oburn_only_specify_usdc(interface):
+def test_user_can_buy_oburn_only_specify_usdc(mocks, burn_swap):
     # Arrange
     account = get_account()
     
-    burnSwapABI = BurnSwap.abi
-    burnSwap = Contract.from_abi("BurnSwap", BURNSWAP_ADDRESS_TEST, burnSwapABI)
-
-    tokenABI = MockToken.abi
-    usdc = Contract.from_abi("MockToken", MOCK_USDC_ADDRESS_TEST, tokenABI)
-    oburn = Contract.from_abi("MockToken", MOCK_OBURN_ADDRESS_TEST, tokenABI)
-
-    quickswapRouter = interface.IUniswapV2Router02(ROUTER_ADDRESS_TEST)
+    oburn, _, usdc, _, quickswapRouter = mocks
+    burnSwap, _ = burn_swap
 
     # Act
     amountUSDCIn = 1000
@@ -89,7 +72,7 @@ def test_user_can_buy_oburn_only_specify_usdc(interface):
     amounts = quickswapRouter.getAmountsOut(amountUSDCIn, [usdc, oburn])
     amountOBURNOut = amounts[1]
 
-    usdc.approve(BURNSWAP_ADDRESS_TEST, amountUSDCIn, {"from": account})
+    usdc.approve(burnSwap.address, amountUSDCIn, {"from": account})
     burnSwap.purchaseOBURN(0, amountUSDCIn, slippage, {"from": account})
 
     # Assert
@@ -100,18 +83,12 @@ def test_user_can_buy_oburn_only_specify_usdc(interface):
     assert oburn.balanceOf(account.address) <= initialOBURNBalance + amountOBURNOut * ((100 - buyFee) / 100) + 1
 
 # Tests to make sure users can buy OBURN with USDC with the Burn Swap contract when only specifying OBURN output amount
-def test_user_can_buy_oburn_only_specify_oburn(interface):
+def test_user_can_buy_oburn_only_specify_oburn(mocks, burn_swap):
     # Arrange
     account = get_account()
     
-    burnSwapABI = BurnSwap.abi
-    burnSwap = Contract.from_abi("BurnSwap", BURNSWAP_ADDRESS_TEST, burnSwapABI)
-
-    tokenABI = MockToken.abi
-    usdc = Contract.from_abi("MockToken", MOCK_USDC_ADDRESS_TEST, tokenABI)
-    oburn = Contract.from_abi("MockToken", MOCK_OBURN_ADDRESS_TEST, tokenABI)
-
-    quickswapRouter = interface.IUniswapV2Router02(ROUTER_ADDRESS_TEST)
+    oburn, _, usdc, _, quickswapRouter = mocks
+    burnSwap, _ = burn_swap
 
     # Act
     amountUSDCIn = 1000
@@ -123,28 +100,22 @@ def test_user_can_buy_oburn_only_specify_oburn(interface):
     amounts = quickswapRouter.getAmountsOut(amountUSDCIn, [usdc, oburn])
     amountOBURNOut = amounts[1]
 
-    usdc.approve(BURNSWAP_ADDRESS_TEST, amountUSDCIn * ((100 + slippage) / 100), {"from": account})
+    usdc.approve(burnSwap.address, amountUSDCIn * ((100 + slippage) / 100), {"from": account})
     burnSwap.purchaseOBURN(amountOBURNOut, 0, slippage, {"from": account})
 
     # Assert
-    assert oburn.balanceOf(account.address) == initialOBURNBalance + amountOBURNOut * ((100 - buyFee) / 100)
+    assert oburn.balanceOf(account.address) == initialOBURNBalance + amountOBURNOut * (100 - buyFee) // 100
 
     assert usdc.balanceOf(account.address) >= initialUSDCBalance - amountUSDCIn * ((100 + slippage) / 100)
     assert usdc.balanceOf(account.address) <= initialUSDCBalance - (amountUSDCIn * 0.99)
 
 # Tests to make sure users can buy OBURN with USDC with the Burn Swap contract and they aren't taxed when excluded from fees.
-def test_user_can_buy_oburn_no_fee(interface):
+def test_user_can_buy_oburn_no_fee(mocks, burn_swap):
     # Arrange
     account = get_account()
     
-    burnSwapABI = BurnSwap.abi
-    burnSwap = Contract.from_abi("BurnSwap", BURNSWAP_ADDRESS_TEST, burnSwapABI)
-
-    tokenABI = MockToken.abi
-    usdc = Contract.from_abi("MockToken", MOCK_USDC_ADDRESS_TEST, tokenABI)
-    oburn = Contract.from_abi("MockToken", MOCK_OBURN_ADDRESS_TEST, tokenABI)
-
-    quickswapRouter = interface.IUniswapV2Router02(ROUTER_ADDRESS_TEST)
+    oburn, _, usdc, _, quickswapRouter = mocks
+    burnSwap, _ = burn_swap
 
     # Act
     amountUSDCIn = 1000
@@ -156,7 +127,7 @@ def test_user_can_buy_oburn_no_fee(interface):
     amounts = quickswapRouter.getAmountsOut(amountUSDCIn, [usdc, oburn])
     amountOBURNOut = amounts[1]
 
-    usdc.approve(BURNSWAP_ADDRESS_TEST, amountUSDCIn, {"from": account})
+    usdc.approve(burnSwap.address, amountUSDCIn, {"from": account})
     burnSwap.exemptAddressFromFees(account.address, True, {"from": account})
     burnSwap.purchaseOBURN(amountOBURNOut, amountUSDCIn, slippage, {"from": account})
     burnSwap.exemptAddressFromFees(account.address, False, {"from": account})
@@ -169,18 +140,12 @@ def test_user_can_buy_oburn_no_fee(interface):
     assert oburn.balanceOf(account.address) <= initialOBURNBalance + amountOBURNOut + 1 
 
 # Tests to make sure users can NOT buy OBURN with USDC with the Burn Swap contract under certain scenarios such as a blacklist or trading paused.
-def test_user_can_not_buy_oburn_certain_scenarios(interface):
+def test_user_can_not_buy_oburn_certain_scenarios(mocks, burn_swap):
     # Arrange
     account = get_account()
     
-    burnSwapABI = BurnSwap.abi
-    burnSwap = Contract.from_abi("BurnSwap", BURNSWAP_ADDRESS_TEST, burnSwapABI)
-
-    tokenABI = MockToken.abi
-    usdc = Contract.from_abi("MockToken", MOCK_USDC_ADDRESS_TEST, tokenABI)
-    oburn = Contract.from_abi("MockToken", MOCK_OBURN_ADDRESS_TEST, tokenABI)
-
-    quickswapRouter = interface.IUniswapV2Router02(ROUTER_ADDRESS_TEST)
+    oburn, _, usdc, _, quickswapRouter = mocks
+    burnSwap, _ = burn_swap
 
     # Act / Assert
     amountUSDCIn = 1000
@@ -193,11 +158,11 @@ def test_user_can_not_buy_oburn_certain_scenarios(interface):
     amounts = quickswapRouter.getAmountsOut(amountUSDCIn, [usdc, oburn])
     amountOBURNOut = amounts[1]
 
-    usdc.approve(BURNSWAP_ADDRESS_TEST, amountUSDCIn, {"from": account})
+    usdc.approve(burnSwap.address, amountUSDCIn, {"from": account})
 
     burnSwap.pauseExchange({"from": account})
 
-    with pytest.raises(ValueError) as ex:
+    with pytest.raises(exceptions.VirtualMachineError) as ex:
         burnSwap.purchaseOBURN(amountOBURNOut, amountUSDCIn, slippage, {"from": account})
     assert "Pausable: paused" in str(ex.value)  
 
@@ -205,15 +170,15 @@ def test_user_can_not_buy_oburn_certain_scenarios(interface):
 
     burnSwap.blacklistOrUnblacklistUser(account.address, True, {"from": account})   
 
-    with pytest.raises(ValueError) as ex:
+    with pytest.raises(exceptions.VirtualMachineError) as ex:
         burnSwap.purchaseOBURN(amountOBURNOut, amountUSDCIn, slippage, {"from": account})
     assert "You have been blacklisted from trading OBURN through this contract." in str(ex.value)  
 
     burnSwap.blacklistOrUnblacklistUser(account.address, False, {"from": account})  
 
-    usdc.approve(BURNSWAP_ADDRESS_TEST, 0, {"from": account}) 
+    usdc.approve(burnSwap.address, 0, {"from": account}) 
 
-    with pytest.raises(ValueError) as ex:
+    with pytest.raises(exceptions.VirtualMachineError) as ex:
         burnSwap.purchaseOBURN(amountOBURNOut, amountUSDCIn, slippage, {"from": account})
     assert "ERC20: insufficient allowance" in str(ex.value)      
 
@@ -238,18 +203,12 @@ def test_user_can_not_buy_oburn_certain_scenarios(interface):
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ 
 
 # Tests to make sure users can sell OBURN for USDC with the Burn Swap contract.
-def test_user_can_sell_oburn(interface):
+def test_user_can_sell_oburn(mocks, burn_swap):
     # Arrange
     account = get_account()
     
-    burnSwapABI = BurnSwap.abi
-    burnSwap = Contract.from_abi("BurnSwap", BURNSWAP_ADDRESS_TEST, burnSwapABI)
-
-    tokenABI = MockToken.abi
-    usdc = Contract.from_abi("MockToken", MOCK_USDC_ADDRESS_TEST, tokenABI)
-    oburn = Contract.from_abi("MockToken", MOCK_OBURN_ADDRESS_TEST, tokenABI)
-
-    quickswapRouter = interface.IUniswapV2Router02(ROUTER_ADDRESS_TEST)
+    oburn, _, usdc, _, quickswapRouter = mocks
+    burnSwap, _ = burn_swap
 
     # Act
     amountOBURNIn = 1000
@@ -263,7 +222,7 @@ def test_user_can_sell_oburn(interface):
 
     initialOBURNBurnt = burnSwap.OBURNBurnt()
     initialDeadWalletOBURNBalance = oburn.balanceOf(DEAD_WALLET)
-    oburn.approve(BURNSWAP_ADDRESS_TEST, amountOBURNIn, {"from": account})
+    oburn.approve(burnSwap.address, amountOBURNIn, {"from": account})
     burnSwap.sellOBURN(amountOBURNIn, amountUSDCOut, slippage, {"from": account})
 
     # Assert
@@ -275,18 +234,12 @@ def test_user_can_sell_oburn(interface):
     assert usdc.balanceOf(account.address) <= initialUSDCBalance + amountUSDCOut * ((100 - sellFee) / 100) + 1
 
 # Tests to make sure users can sell OBURN for USDC with the Burn Swap contract.
-def test_user_can_sell_oburn_only_specify_oburn(interface):
+def test_user_can_sell_oburn_only_specify_oburn(mocks, burn_swap):
     # Arrange
     account = get_account()
     
-    burnSwapABI = BurnSwap.abi
-    burnSwap = Contract.from_abi("BurnSwap", BURNSWAP_ADDRESS_TEST, burnSwapABI)
-
-    tokenABI = MockToken.abi
-    usdc = Contract.from_abi("MockToken", MOCK_USDC_ADDRESS_TEST, tokenABI)
-    oburn = Contract.from_abi("MockToken", MOCK_OBURN_ADDRESS_TEST, tokenABI)
-
-    quickswapRouter = interface.IUniswapV2Router02(ROUTER_ADDRESS_TEST)
+    oburn, _, usdc, _, quickswapRouter = mocks
+    burnSwap, _ = burn_swap
 
     # Act
     amountOBURNIn = 1000
@@ -300,7 +253,7 @@ def test_user_can_sell_oburn_only_specify_oburn(interface):
 
     initialOBURNBurnt = burnSwap.OBURNBurnt()
     initialDeadWalletOBURNBalance = oburn.balanceOf(DEAD_WALLET)
-    oburn.approve(BURNSWAP_ADDRESS_TEST, amountOBURNIn, {"from": account})
+    oburn.approve(burnSwap.address, amountOBURNIn, {"from": account})
     burnSwap.sellOBURN(amountOBURNIn, 0, slippage, {"from": account})
 
     # Assert
@@ -312,18 +265,12 @@ def test_user_can_sell_oburn_only_specify_oburn(interface):
     assert usdc.balanceOf(account.address) <= initialUSDCBalance + amountUSDCOut * ((100 - sellFee) / 100) + 1
 
 # Tests to make sure users can sell OBURN for USDC with the Burn Swap contract and only specifying USDC.
-def test_user_can_sell_oburn_only_specify_usdc(interface):
+def test_user_can_sell_oburn_only_specify_usdc(mocks, burn_swap):
     # Arrange
     account = get_account()
     
-    burnSwapABI = BurnSwap.abi
-    burnSwap = Contract.from_abi("BurnSwap", BURNSWAP_ADDRESS_TEST, burnSwapABI)
-
-    tokenABI = MockToken.abi
-    usdc = Contract.from_abi("MockToken", MOCK_USDC_ADDRESS_TEST, tokenABI)
-    oburn = Contract.from_abi("MockToken", MOCK_OBURN_ADDRESS_TEST, tokenABI)
-
-    quickswapRouter = interface.IUniswapV2Router02(ROUTER_ADDRESS_TEST)
+    oburn, _, usdc, _, quickswapRouter = mocks
+    burnSwap, _ = burn_swap
 
     # Act
     amountOBURNIn = 1000
@@ -337,11 +284,11 @@ def test_user_can_sell_oburn_only_specify_usdc(interface):
 
     initialOBURNBurnt = burnSwap.OBURNBurnt()
     initialDeadWalletOBURNBalance = oburn.balanceOf(DEAD_WALLET)
-    oburn.approve(BURNSWAP_ADDRESS_TEST, amountOBURNIn * ((100 + slippage) / 100), {"from": account})
+    oburn.approve(burnSwap.address, amountOBURNIn * ((100 + slippage) / 100), {"from": account})
     burnSwap.sellOBURN(0, amountUSDCOut, slippage, {"from": account})
 
     # Assert
-    assert usdc.balanceOf(account.address) == initialUSDCBalance + amountUSDCOut * ((100 - sellFee) / 100)
+    assert usdc.balanceOf(account.address) == initialUSDCBalance + amountUSDCOut * (100 - sellFee) // 100
     assert burnSwap.OBURNBurnt() == initialOBURNBurnt + (amountOBURNIn * sellFee / 100)
     assert oburn.balanceOf(DEAD_WALLET) == initialDeadWalletOBURNBalance + amountOBURNIn * (sellFee / 100)
 
@@ -349,18 +296,12 @@ def test_user_can_sell_oburn_only_specify_usdc(interface):
     assert oburn.balanceOf(account.address) <= initialOBURNBalance - (amountOBURNIn * 0.99)
 
 # Tests to make sure users can sell OBURN for USDC with the Burn Swap contract and have no fee taken when excluded from fees.
-def test_user_can_sell_oburn_no_fee(interface):
+def test_user_can_sell_oburn_no_fee(mocks, burn_swap):
     # Arrange
     account = get_account()
     
-    burnSwapABI = BurnSwap.abi
-    burnSwap = Contract.from_abi("BurnSwap", BURNSWAP_ADDRESS_TEST, burnSwapABI)
-
-    tokenABI = MockToken.abi
-    usdc = Contract.from_abi("MockToken", MOCK_USDC_ADDRESS_TEST, tokenABI)
-    oburn = Contract.from_abi("MockToken", MOCK_OBURN_ADDRESS_TEST, tokenABI)
-
-    quickswapRouter = interface.IUniswapV2Router02(ROUTER_ADDRESS_TEST)
+    oburn, _, usdc, _, quickswapRouter = mocks
+    burnSwap, _ = burn_swap
 
     # Act
     amountOBURNIn = 1000
@@ -374,7 +315,7 @@ def test_user_can_sell_oburn_no_fee(interface):
 
     initialOBURNBurnt = burnSwap.OBURNBurnt()
     initialDeadWalletOBURNBalance = oburn.balanceOf(DEAD_WALLET)
-    oburn.approve(BURNSWAP_ADDRESS_TEST, amountOBURNIn, {"from": account})
+    oburn.approve(burnSwap.address, amountOBURNIn, {"from": account})
     burnSwap.exemptAddressFromFees(account.address, True, {"from": account})
     burnSwap.sellOBURN(amountOBURNIn, amountUSDCOut, slippage, {"from": account})
     burnSwap.exemptAddressFromFees(account.address, False, {"from": account})
@@ -388,18 +329,12 @@ def test_user_can_sell_oburn_no_fee(interface):
     assert usdc.balanceOf(account.address) <= initialUSDCBalance + amountUSDCOut + 1    
 
 # Tests to make sure users can not sell OBURN for USDC with the Burn Swap contract under certain scenarios such as a blacklist or paused exchange.
-def test_user_can_not_sell_oburn_certain_scenarios(interface):
+def test_user_can_not_sell_oburn_certain_scenarios(mocks, burn_swap):
     # Arrange
     account = get_account()
     
-    burnSwapABI = BurnSwap.abi
-    burnSwap = Contract.from_abi("BurnSwap", BURNSWAP_ADDRESS_TEST, burnSwapABI)
-
-    tokenABI = MockToken.abi
-    usdc = Contract.from_abi("MockToken", MOCK_USDC_ADDRESS_TEST, tokenABI)
-    oburn = Contract.from_abi("MockToken", MOCK_OBURN_ADDRESS_TEST, tokenABI)
-
-    quickswapRouter = interface.IUniswapV2Router02(ROUTER_ADDRESS_TEST)
+    oburn, _, usdc, _, quickswapRouter = mocks
+    burnSwap, _ = burn_swap
 
     # Act / Assert
     amountOBURNIn = 1000
@@ -413,11 +348,11 @@ def test_user_can_not_sell_oburn_certain_scenarios(interface):
 
     initialOBURNBurnt = burnSwap.OBURNBurnt()
     initialDeadWalletOBURNBalance = oburn.balanceOf(DEAD_WALLET)
-    oburn.approve(BURNSWAP_ADDRESS_TEST, amountOBURNIn, {"from": account})
+    oburn.approve(burnSwap.address, amountOBURNIn, {"from": account})
 
     burnSwap.pauseExchange({"from": account})
 
-    with pytest.raises(ValueError) as ex:
+    with pytest.raises(exceptions.VirtualMachineError) as ex:
         burnSwap.sellOBURN(amountOBURNIn, amountUSDCOut, slippage, {"from": account})
     assert "Pausable: paused" in str(ex.value)  
 
@@ -425,15 +360,44 @@ def test_user_can_not_sell_oburn_certain_scenarios(interface):
 
     burnSwap.blacklistOrUnblacklistUser(account.address, True, {"from": account})   
 
-    with pytest.raises(ValueError) as ex:
+    with pytest.raises(exceptions.VirtualMachineError) as ex:
         burnSwap.sellOBURN(amountOBURNIn, amountUSDCOut, slippage, {"from": account})
     assert "You have been blacklisted from trading OBURN through this contract." in str(ex.value)  
 
     burnSwap.blacklistOrUnblacklistUser(account.address, False, {"from": account})  
 
-    oburn.approve(BURNSWAP_ADDRESS_TEST, 0, {"from": account}) 
+    oburn.approve(burnSwap.address, 0, {"from": account}) 
 
-    with pytest.raises(ValueError) as ex:
+    with pytest.raises(exceptions.VirtualMachineError) as ex:
         burnSwap.sellOBURN(amountOBURNIn, amountUSDCOut, slippage, {"from": account})
     assert "ERC20: insufficient allowance" in str(ex.value)          
-    
\ No newline at end of file
+    
+# Tests to make sure users can sell OBURN with a permit instead of an approve transaction, even if the permit was
+# already submitted by someone else.
+def test_user_can_sell_oburn_with_permit(mocks, burn_swap):
+    # Arrange
+    account = get_account()
+    account2 = get_account(2)
+
+    oburn, _, usdc, _, _ = mocks
+    burnSwap, _ = burn_swap
+
+    amountOBURNIn = Web3.toWei(100, "ether")
+    oburn.transfer(account2.address, amountOBURNIn * 2, {"from": account})
+    deadline = chain.time() + 3600
+
+    # Act
+    v, r, s = sign_permit(oburn, account2, burnSwap.address, amountOBURNIn, deadline)
+    burnSwap.sellOBURNWithPermit(amountOBURNIn, 0, 5, amountOBURNIn, deadline, v, r, s, {"from": account2})
+    firstSellBUSD = usdc.balanceOf(account2.address)
+
+    v, r, s = sign_permit(oburn, account2, burnSwap.address, amountOBURNIn, deadline)
+    oburn.permit(account2.address, burnSwap.address, amountOBURNIn, deadline, v, r, s, {"from": account})
+    burnSwap.sellOBURNWithPermit(amountOBURNIn, 0, 5, amountOBURNIn, deadline, v, r, s, {"from": account2})
+
+    # Assert
+    assert oburn.balanceOf(account2.address) == 0
+    assert oburn.allowance(account2.address, burnSwap.address) == 0
+    assert oburn.nonces(account2.address) == 2
+    assert firstSellBUSD > 0
+    assert usdc.balanceOf(account2.address) > firstSellBUSD
@@ -0,0 +1,25 @@
+from scripts.helpers import get_account
+from scripts.deploy_all import deploy_all, load_manifest, DEPLOYMENTS
+from brownie import network, accounts, exceptions, chain, OnlyBurns
+from web3 import Web3
+import pytest
+
+# Tests to make sure a full environment is deployed in one run and a rerun reuses every unchanged contract.
+def test_deploy_all_is_idempotent(tmp_path):
+    # Arrange
+    manifestPath = tmp_path / "development.json"
+
+    # Act
+    addresses, deployedNames = deploy_all(manifestPath)
+    rerunAddresses, rerunDeployedNames = deploy_all(manifestPath)
+
+    # Assert
+    deployableNames = [name for name, spec in DEPLOYMENTS.items() if "container" in spec]
+    assert sorted(deployedNames) == sorted(deployableNames)
+    assert rerunDeployedNames == []
+    assert rerunAddresses == addresses
+
+    manifest = load_manifest(manifestPath)
+    for name in deployableNames:
+        assert manifest[name]["address"] == addresses[name]
+    assert OnlyBurns.at(addresses["OnlyBurns"]).quickSwapPair() == addresses["pair"]
@@ -0,0 +1,131 @@
+from scripts.helpers import get_account
+from scripts.event_indexer import EventIndexer
+from scripts.rebuild_fee_totals import rebuild_fee_totals
+from brownie import network, accounts, exceptions, chain
+from web3 import Web3
+import pytest
+
+SLIPPAGE = 5
+
+# Tests to make sure trades are indexed with the right amounts and fees, and later runs only pick up new blocks.
+def test_indexer_tracks_burn_swap_trades(mocks, burn_swap, tmp_path):
+    # Arrange
+    account = get_account()
+    account2 = get_account(2)
+
+    OBURN, _, BUSD, _, _ = mocks
+    burnSwap, _ = burn_swap
+
+    BUSD.transfer(account2.address, Web3.toWei(1000, "ether"), {"from": account})
+    BUSD.approve(burnSwap.address, Web3.toWei(1000, "ether"), {"from": account2})
+    OBURN.approve(burnSwap.address, Web3.toWei(1000, "ether"), {"from": account2})
+    startBlock = chain.height
+
+    buyTx = burnSwap.purchaseOBURN(0, Web3.toWei(200, "ether"), SLIPPAGE, {"from": account2})
+    indexer = EventIndexer(
+        tmp_path / "index.sqlite",
+        burnSwapAddress=burnSwap.address,
+        oburnAddress=OBURN.address,
+        busdAddress=BUSD.address,
+        deadWallet=burnSwap.deadWallet(),
+    )
+    indexer.index(startBlock=startBlock, confirmations=0)
+    firstCursor = indexer.get_cursor("burnSwap")
+
+    sellTx = burnSwap.sellOBURN(Web3.toWei(100, "ether"), 0, SLIPPAGE, {"from": account2})
+
+    # Act
+    indexer.index(startBlock=startBlock, confirmations=0)
+    summary = indexer.get_address_summary(account2.address)
+
+    # Assert
+    assert firstCursor == buyTx.block_number
+    assert indexer.get_cursor("burnSwap") == sellTx.block_number
+    assert summary["buys"] == 1
+    assert summary["sells"] == 1
+    assert summary["busdSpent"] == Web3.toWei(200, "ether")
+    assert summary["oburnBought"] == buyTx.events["Transfer"][-1]["value"]
+    assert summary["busdFees"] == burnSwap.addressToBUSDCollected(account2.address)
+    assert summary["oburnSold"] == Web3.toWei(100, "ether")
+    assert summary["oburnBurnt"] == burnSwap.addressToOBURNBurnt(account2.address)
+    assert summary["busdReceived"] == sellTx.events["Transfer"][-1]["value"]
+    assert buyTx.events["oburnBuy"]["oburnAmount"] == summary["oburnBought"]
+    assert sellTx.events["oburnSell"]["busdAmount"] == summary["busdReceived"]
+    assert indexer.get_traders() == [account2.address]
+
+    indexer.close()
+
+# Tests to make sure presale purchases are indexed per beneficiary.
+def test_indexer_tracks_presale_purchases(mocks, presale_and_exchange, tmp_path):
+    # Arrange
+    account = get_account()
+    account2 = get_account(2)
+
+    _, OBURN, USDC, _, _ = mocks
+    oburnTokenPresale, _ = presale_and_exchange
+
+    USDCAmount = 1000000
+    OBURN.transfer(oburnTokenPresale.address, Web3.toWei(1000000000000000, "ether"), {"from": account})
+    USDC.transfer(account2.address, USDCAmount, {"from": account})
+
+    oburnTokenPresale.lockSaleParameters({"from": account})
+    oburnTokenPresale.setWhitelistSaleActive(True, {"from": account})
+    oburnTokenPresale.addAddressToWhitelist(account2.address, {"from": account})
+    startBlock = chain.height
+
+    USDC.approve(oburnTokenPresale.address, USDCAmount, {"from": account2})
+    oburnTokenPresale.buyTokens(account2.address, USDCAmount, {"from": account2})
+
+    # Act
+    indexer = EventIndexer(tmp_path / "index.sqlite", presaleAddress=oburnTokenPresale.address)
+    indexer.index(startBlock=startBlock, confirmations=0)
+    summary = indexer.get_address_summary(account2.address)
+
+    # Assert
+    assert summary["presaleUSDC"] == USDCAmount
+    assert summary["presaleOBURN"] == OBURN.balanceOf(account2.address)
+    assert summary["buys"] == 0
+
+    indexer.close()
+
+# Tests to make sure per-address fee totals are rebuilt from the trade events when BurnSwap only keeps the totals.
+def test_fee_totals_rebuilt_without_per_user_accounting(mocks, burn_swap, tmp_path):
+    # Arrange
+    account = get_account()
+    account2 = get_account(2)
+    account3 = get_account(3)
+
+    OBURN, _, BUSD, _, _ = mocks
+    burnSwap, _ = burn_swap
+
+    burnSwap.setPerUserFeeAccounting(False, {"from": account})
+    for trader in [account2, account3]:
+        BUSD.transfer(trader.address, Web3.toWei(1000, "ether"), {"from": account})
+        BUSD.approve(burnSwap.address, Web3.toWei(1000, "ether"), {"from": trader})
+        OBURN.approve(burnSwap.address, Web3.toWei(1000, "ether"), {"from": trader})
+    startBlock = chain.height
+
+    buyTx = burnSwap.purchaseOBURN(0, Web3.toWei(300, "ether"), SLIPPAGE, {"from": account2})
+    burnSwap.purchaseOBURN(0, Web3.toWei(100, "ether"), SLIPPAGE, {"from": account3})
+    sellTx = burnSwap.sellOBURN(Web3.toWei(50, "ether"), 0, SLIPPAGE, {"from": account3})
+    indexer = EventIndexer(
+        tmp_path / "index.sqlite",
+        burnSwapAddress=burnSwap.address,
+        oburnAddress=OBURN.address,
+        busdAddress=BUSD.address,
+        deadWallet=burnSwap.deadWallet(),
+    )
+
+    # Act
+    totals, drift = rebuild_fee_totals(burnSwap, indexer, startBlock=startBlock, confirmations=0)
+
+    # Assert
+    assert burnSwap.addressToBUSDCollected(account2.address) == 0
+    assert burnSwap.addressToOBURNBurnt(account3.address) == 0
+    assert totals[account2.address] == {"busdCollected": buyTx.events["oburnBuy"]["busdFee"], "oburnBurnt": 0}
+    assert totals[account3.address]["busdCollected"] == Web3.toWei(10, "ether")
+    assert totals[account3.address]["oburnBurnt"] == sellTx.events["oburnSell"]["oburnBurnt"]
+    assert drift == {"busdCollected": 0, "oburnBurnt": 0}
+
+    indexer.close()
+
@@ -1,19 +1,18 @@
-from scripts.helpers import get_account
-from scripts.deploy import deploy_presale_and_exchange
-from scripts.deploy_mocks import deploy_mocks
+from scripts.helpers import get_account, sign_permit
+from scripts.batch_exchange import batch_exchange
 from brownie import network, accounts, exceptions, chain
 from web3 import Web3
 import pytest
 import time
 
 # Tests to make sure users can exchange TBURN for OBURN.
-def test_users_can_exchange():
+def test_users_can_exchange(mocks, presale_and_exchange):
     # Arrange
     account = get_account()
     account2 = get_account(2)
 
-    TBURN, OBURN, USDC, _, _ = deploy_mocks()
-    oburnTokenPresale, oburnExchange = deploy_presale_and_exchange(TBURN.address, OBURN.address, account2.address, USDC.address)
+    TBURN, OBURN, USDC, _, _ = mocks
+    oburnTokenPresale, oburnExchange = presale_and_exchange
 
     tburnAmount = Web3.toWei(100, "ether")
     OBURN.transfer(oburnExchange.address, tburnAmount, {"from": account})
@@ -30,13 +29,13 @@ def test_users_can_exchange():
     assert OBURN.balanceOf(oburnExchange.address) == 0
 
 # Tests to make sure the owner can withdraw TBURN and OBURN from the contract.
-def test_owner_can_withdraw_tburn_and_oburn():
+def test_owner_can_withdraw_tburn_and_oburn(mocks, presale_and_exchange):
     # Arrange
     account = get_account()
     account2 = get_account(2)
 
-    TBURN, OBURN, USDC, _, _ = deploy_mocks()
-    oburnTokenPresale, oburnExchange = deploy_presale_and_exchange(TBURN.address, OBURN.address, account2.address, USDC.address)
+    TBURN, OBURN, USDC, _, _ = mocks
+    oburnTokenPresale, oburnExchange = presale_and_exchange
 
     tburnAmount = Web3.toWei(100, "ether")
     OBURN.transfer(oburnExchange.address, tburnAmount * 3, {"from": account})
@@ -59,13 +58,13 @@ def test_owner_can_withdraw_tburn_and_oburn():
     assert OBURN.balanceOf(account.address) == initialOBURNBalance + tburnAmount * 2
 
 # Tests to make sure the owner can rescue any tokens.
-def test_owner_can_rescue_tokens():
+def test_owner_can_rescue_tokens(mocks, presale_and_exchange):
     # Arrange
     account = get_account()
     account2 = get_account(2)
 
-    TBURN, OBURN, USDC, _, _ = deploy_mocks()
-    oburnTokenPresale, oburnExchange = deploy_presale_and_exchange(TBURN.address, OBURN.address, account2.address, USDC.address)
+    TBURN, OBURN, USDC, _, _ = mocks
+    oburnTokenPresale, oburnExchange = presale_and_exchange
 
     usdcAmount = Web3.toWei(100, "ether")
     USDC.transfer(account2.address, usdcAmount, {"from": account})
@@ -81,13 +80,13 @@ def test_owner_can_rescue_tokens():
     assert USDC.balanceOf(account.address) == initialUSDCBalance + usdcAmount
     
 # Tests to make sure the owner can pause and unpause exchanging.
-def test_owner_can_pause_and_unpause_exchange():
+def test_owner_can_pause_and_unpause_exchange(mocks, presale_and_exchange):
     # Arrange
     account = get_account()
     account2 = get_account(2)
 
-    TBURN, OBURN, USDC, _, _ = deploy_mocks()
-    oburnTokenPresale, oburnExchange = deploy_presale_and_exchange(TBURN.address, OBURN.address, account2.address, USDC.address)
+    TBURN, OBURN, USDC, _, _ = mocks
+    oburnTokenPresale, oburnExchange = presale_and_exchange
 
     tburnAmount = Web3.toWei(655, "ether")
     OBURN.transfer(oburnExchange.address, tburnAmount, {"from": account})
@@ -113,13 +112,13 @@ def test_owner_can_pause_and_unpause_exchange():
     assert OBURN.balanceOf(oburnExchange.address) == 0
 
 # Tests to make sure users need to approve the exchange contract to spend TBURN before exchanging for OBURN.
-def test_users_must_approve_tburn():
+def test_users_must_approve_tburn(mocks, presale_and_exchange):
     # Arrange
     account = get_account()
     account2 = get_account(2)
 
-    TBURN, OBURN, USDC, _, _ = deploy_mocks()
-    oburnTokenPresale, oburnExchange = deploy_presale_and_exchange(TBURN.address, OBURN.address, account2.address, USDC.address)
+    TBURN, OBURN, USDC, _, _ = mocks
+    oburnTokenPresale, oburnExchange = presale_and_exchange
 
     tburnAmount = Web3.toWei(100, "ether")
     OBURN.transfer(oburnExchange.address, tburnAmount, {"from": account})
@@ -129,4 +128,67 @@ def test_users_must_approve_tburn():
     
     with pytest.raises(exceptions.VirtualMachineError) as ex:
         oburnExchange.OBURNExchange(tburnAmount, {"from": account2})
-    assert "You must first approve this contract to spend your TBURN to exchange it for OBURN." in str(ex.value)    
\ No newline at end of file
+    assert "You must first approve this contract to spend your TBURN to exchange it for OBURN." in str(ex.value)
+
+# Tests to make sure users can exchange TBURN for OBURN with a permit instead of an approve transaction.
+def test_users_can_exchange_with_permit(mocks, presale_and_exchange):
+    # Arrange
+    account = get_account()
+    account2 = get_account(2)
+
+    TBURN, OBURN, USDC, _, _ = mocks
+    oburnTokenPresale, oburnExchange = presale_and_exchange
+
+    tburnAmount = Web3.toWei(100, "ether")
+    OBURN.transfer(oburnExchange.address, tburnAmount, {"from": account})
+    TBURN.transfer(account2.address, tburnAmount, {"from": account})
+    deadline = chain.time() + 3600
+
+    # Act
+    v, r, s = sign_permit(TBURN, account2, oburnExchange.address, tburnAmount, deadline)
+    oburnExchange.OBURNExchangeWithPermit(tburnAmount, deadline, v, r, s, {"from": account2})
+
+    # Assert
+    assert TBURN.balanceOf(account2.address) == 0
+    assert TBURN.balanceOf(oburnExchange.address) == tburnAmount
+    assert OBURN.balanceOf(account2.address) == tburnAmount
+    assert TBURN.allowance(account2.address, oburnExchange.address) == 0
+
+# Tests to make sure an operator can exchange for many holders at once, skipping holders that can't be served.
+def test_operator_can_batch_exchange(mocks, presale_and_exchange):
+    # Arrange
+    account = get_account()
+    operator = get_account(2)
+    approvedHolder = get_account(3)
+    unapprovedHolder = get_account(4)
+    permitHolder = get_account(5)
+
+    TBURN, OBURN, USDC, _, _ = mocks
+    oburnTokenPresale, oburnExchange = presale_and_exchange
+
+    tburnAmount = Web3.toWei(100, "ether")
+    OBURN.transfer(oburnExchange.address, tburnAmount * 3, {"from": account})
+    for holder in [approvedHolder, unapprovedHolder, permitHolder]:
+        TBURN.transfer(holder.address, tburnAmount, {"from": account})
+    TBURN.approve(oburnExchange.address, tburnAmount, {"from": approvedHolder})
+    deadline = chain.time() + 3600
+    permit = sign_permit(TBURN, permitHolder, oburnExchange.address, tburnAmount, deadline)
+
+    with pytest.raises(exceptions.VirtualMachineError) as ex:
+        oburnExchange.batchExchange([approvedHolder.address], [tburnAmount], {"from": operator})
+    assert "Caller is not an operator." in str(ex.value)
+
+    oburnExchange.setOperator(operator.address, True, {"from": account})
+    holderBalances = {holder.address: tburnAmount for holder in [approvedHolder, unapprovedHolder, permitHolder]}
+
+    # Act
+    exchanged, skipped = batch_exchange(oburnExchange, holderBalances, {permitHolder.address: (deadline, *permit)}, operator)
+
+    # Assert
+    assert exchanged == {approvedHolder.address: tburnAmount, permitHolder.address: tburnAmount}
+    assert skipped == {unapprovedHolder.address: "not enough allowance"}
+    assert OBURN.balanceOf(approvedHolder.address) == tburnAmount
+    assert OBURN.balanceOf(permitHolder.address) == tburnAmount
+    assert OBURN.balanceOf(unapprovedHolder.address) == 0
+    assert TBURN.balanceOf(unapprovedHolder.address) == tburnAmount
+    assert TBURN.balanceOf(oburnExchange.address) == tburnAmount * 2
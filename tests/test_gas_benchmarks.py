@@ -0,0 +1,225 @@
+from scripts.helpers import get_account
+from brownie import network, accounts, exceptions, chain
+from pathlib import Path
+from web3 import Web3
+import json
+import os
+import pytest
+
+# Checked-in gas baseline - scenario name to gas used.
+GAS_BASELINE_PATH = Path(__file__).parent / "gas_baseline.json"
+
+# A scenario fails when it uses more than this fraction of gas over its baseline (0.02 is 2%).
+GAS_REGRESSION_THRESHOLD = 0.02
+
+# Run with UPDATE_GAS_BASELINE=1 to write the measured gas to the baseline instead of checking against it.
+UPDATE_GAS_BASELINE = os.environ.get("UPDATE_GAS_BASELINE") == "1"
+
+BURN_SWAP_AMOUNT = Web3.toWei(100, "ether")
+SLIPPAGE = 5
+
+# Records the gas used by each scenario and checks it against the baseline. A scenario without a baseline entry fails,
+# so a new scenario can't go unchecked. With UPDATE_GAS_BASELINE=1 the measured values are merged into the baseline
+# file instead.
+@pytest.fixture(scope="module")
+def gas_recorder():
+    baseline = json.loads(GAS_BASELINE_PATH.read_text()) if GAS_BASELINE_PATH.exists() else {}
+    measured = {}
+
+    def record(name, tx):
+        measured[name] = tx.gas_used
+        if UPDATE_GAS_BASELINE:
+            return
+
+        assert name in baseline, f"{name} has no gas baseline - run the benchmarks with UPDATE_GAS_BASELINE=1 and commit {GAS_BASELINE_PATH.name}"
+
+        maxGas = baseline[name] * (1 + GAS_REGRESSION_THRESHOLD)
+        assert tx.gas_used <= maxGas, (
+            f"{name} used {tx.gas_used} gas, more than {GAS_REGRESSION_THRESHOLD:.0%} over its baseline of {baseline[name]}"
+        )
+
+    yield record
+
+    print("\nGas used:")
+    for name, gasUsed in measured.items():
+        change = f" ({gasUsed - baseline[name]:+d} vs baseline)" if name in baseline else " (no baseline)"
+        print(f"  {name}: {gasUsed}{change}")
+
+    # BurnSwap scenarios run both through the router and directly on the pair, so compare the two routes side by side
+    routeComparisons = [
+        (name, measured[name.replace("-pair]", "]")], gasUsed)
+        for name, gasUsed in measured.items() if name.endswith("-pair]") and name.replace("-pair]", "]") in measured
+    ]
+    if routeComparisons:
+        print("\nDirect pair swaps vs the router:")
+        for name, routerGas, pairGas in routeComparisons:
+            print(f"  {name.replace('-pair]', ']')}: router {routerGas}, pair {pairGas} ({pairGas - routerGas:+d})")
+
+    if UPDATE_GAS_BASELINE and measured:
+        # Re-read the file so that modules updating the baseline one after another don't drop each other's entries.
+        baseline = json.loads(GAS_BASELINE_PATH.read_text()) if GAS_BASELINE_PATH.exists() else {}
+        baseline.update(measured)
+        GAS_BASELINE_PATH.write_text(json.dumps(dict(sorted(baseline.items())), indent=4) + "\n")
+
+# Amount modes for BurnSwap buys and sells: exact input with a minimum output, input only, and exact output only.
+AMOUNT_MODES = ["exactInput", "inputOnly", "exactOutput"]
+
+# BurnSwap trades through the router, or directly on the pair (setDirectPairSwaps). Pair scenarios are recorded with
+# a "-pair" suffix next to the router ones.
+BURN_SWAP_ROUTES = ["router", "pair"]
+
+# Gas used by BurnSwap.purchaseOBURN in every amount mode and route for fee paying and fee exempt callers.
+@pytest.mark.parametrize("exempt", [False, True], ids=["fee", "exempt"])
+@pytest.mark.parametrize("mode", AMOUNT_MODES)
+@pytest.mark.parametrize("route", BURN_SWAP_ROUTES)
+def test_burn_swap_purchase_gas(mocks, burn_swap, gas_recorder, mode, exempt, route):
+    # Arrange
+    account = get_account()
+    account2 = get_account(2)
+
+    OBURN, _, BUSD, _, mockUniswapV2Router02 = mocks
+    burnSwap, _ = burn_swap
+
+    BUSD.transfer(account2.address, BURN_SWAP_AMOUNT * 2, {"from": account})
+    BUSD.approve(burnSwap.address, BURN_SWAP_AMOUNT * 2, {"from": account2})
+    if exempt:
+        burnSwap.exemptAddressFromFees(account2.address, True, {"from": account})
+    if route == "pair":
+        burnSwap.setDirectPairSwaps(True, 30, {"from": account})
+
+    amountOBURNOut = mockUniswapV2Router02.getAmountsOut(BURN_SWAP_AMOUNT, [BUSD.address, OBURN.address])[1]
+    amountOBURN, amountBUSD = {
+        "exactInput": (amountOBURNOut, BURN_SWAP_AMOUNT),
+        "inputOnly": (0, BURN_SWAP_AMOUNT),
+        "exactOutput": (amountOBURNOut, 0),
+    }[mode]
+
+    # Act
+    tx = burnSwap.purchaseOBURN(amountOBURN, amountBUSD, SLIPPAGE, {"from": account2})
+
+    # Assert
+    gas_recorder(f"BurnSwap.purchaseOBURN[{mode}-{'exempt' if exempt else 'fee'}{'-pair' if route == 'pair' else ''}]", tx)
+
+# Gas used by BurnSwap.sellOBURN in every amount mode and route for fee paying and fee exempt callers.
+@pytest.mark.parametrize("exempt", [False, True], ids=["fee", "exempt"])
+@pytest.mark.parametrize("mode", AMOUNT_MODES)
+@pytest.mark.parametrize("route", BURN_SWAP_ROUTES)
+def test_burn_swap_sell_gas(mocks, burn_swap, gas_recorder, mode, exempt, route):
+    # Arrange
+    account = get_account()
+    account2 = get_account(2)
+
+    OBURN, _, BUSD, _, mockUniswapV2Router02 = mocks
+    burnSwap, _ = burn_swap
+
+    OBURN.transfer(account2.address, BURN_SWAP_AMOUNT * 2, {"from": account})
+    OBURN.approve(burnSwap.address, BURN_SWAP_AMOUNT * 2, {"from": account2})
+    if exempt:
+        burnSwap.exemptAddressFromFees(account2.address, True, {"from": account})
+    if route == "pair":
+        burnSwap.setDirectPairSwaps(True, 30, {"from": account})
+
+    amountBUSDOut = mockUniswapV2Router02.getAmountsOut(BURN_SWAP_AMOUNT, [OBURN.address, BUSD.address])[1]
+    amountOBURN, amountBUSD = {
+        "exactInput": (BURN_SWAP_AMOUNT, amountBUSDOut),
+        "inputOnly": (BURN_SWAP_AMOUNT, 0),
+        "exactOutput": (0, amountBUSDOut),
+    }[mode]
+
+    # Act
+    tx = burnSwap.sellOBURN(amountOBURN, amountBUSD, SLIPPAGE, {"from": account2})
+
+    # Assert
+    gas_recorder(f"BurnSwap.sellOBURN[{mode}-{'exempt' if exempt else 'fee'}{'-pair' if route == 'pair' else ''}]", tx)
+
+# Gas used by OburnTokenPresale.buyTokens in the whitelist and public sale phases.
+@pytest.mark.parametrize("phase", ["whitelist", "public"])
+def test_presale_buy_tokens_gas(mocks, presale_and_exchange, gas_recorder, phase):
+    # Arrange
+    account = get_account()
+    account2 = get_account(2)
+
+    TBURN, OBURN, USDC, _, _ = mocks
+    oburnTokenPresale, oburnExchange = presale_and_exchange
+
+    USDCAmount = 1000000
+    OBURN.transfer(oburnTokenPresale.address, Web3.toWei(1000000000000000, "ether"), {"from": account})
+    USDC.transfer(account2.address, USDCAmount, {"from": account})
+
+    oburnTokenPresale.lockSaleParameters({"from": account})
+    oburnTokenPresale.setWhitelistSaleActive(True, {"from": account})
+    if phase == "whitelist":
+        oburnTokenPresale.addAddressToWhitelist(account2.address, {"from": account})
+    else:
+        oburnTokenPresale.setPublicSaleActive(True, {"from": account})
+
+    USDC.approve(oburnTokenPresale.address, USDCAmount, {"from": account2})
+
+    # Act
+    tx = oburnTokenPresale.buyTokens(account2.address, USDCAmount, {"from": account2})
+
+    # Assert
+    gas_recorder(f"OburnTokenPresale.buyTokens[{phase}]", tx)
+
+# Gas used by OburnExchange.OBURNExchange.
+def test_exchange_gas(mocks, presale_and_exchange, gas_recorder):
+    # Arrange
+    account = get_account()
+    account2 = get_account(2)
+
+    TBURN, OBURN, USDC, _, _ = mocks
+    oburnTokenPresale, oburnExchange = presale_and_exchange
+
+    tburnAmount = Web3.toWei(100, "ether")
+    OBURN.transfer(oburnExchange.address, tburnAmount, {"from": account})
+    TBURN.transfer(account2.address, tburnAmount, {"from": account})
+    TBURN.approve(oburnExchange.address, tburnAmount, {"from": account2})
+
+    # Act
+    tx = oburnExchange.OBURNExchange(tburnAmount, {"from": account2})
+
+    # Assert
+    gas_recorder("OburnExchange.OBURNExchange", tx)
+
+# Gas used by OnlyBurns transfers between wallets, buys (from a DEX swap address), sells (to a DEX swap address), sells
+# from a fee exempt wallet and buys during the anti-snipe window. An EOA is registered as the DEX swap address so only
+# the token's own transfer logic is measured.
+@pytest.mark.parametrize("path", ["plain", "buy", "sell", "exempt", "antiSnipe"])
+def test_oburn_transfer_gas(oburn_token, gas_recorder, path):
+    # Arrange
+    account = get_account()
+    account3 = get_account(3)
+    dexSwapAccount = get_account(4)
+    account5 = get_account(5)
+
+    oburn = oburn_token
+    transferAmount = Web3.toWei(1000, "ether")
+
+    oburn.transfer(account3.address, transferAmount, {"from": account})
+    oburn.transfer(dexSwapAccount.address, transferAmount, {"from": account})
+    oburn.transfer(account5.address, transferAmount, {"from": account})
+    oburn.addDexSwapAddress(dexSwapAccount.address, True, {"from": account})
+    oburn.enableOrDisableDEXTrading(True, {"from": account})
+    if path == "exempt":
+        oburn.exemptAddressFromFees(account3.address, True, {"from": account})
+    oburn.enableTrading({"from": account})
+
+    # Outside the anti-snipe scenario, skip past the blocks right after trading is enabled. The first transfer after
+    # that latches the launched phase (a one-off storage write), so it is done before the measured transfer.
+    if path != "antiSnipe":
+        chain.mine(4)
+        oburn.transfer(account3.address, transferAmount / 100, {"from": account5})
+
+    sender, recipient = {
+        "plain": (account3, account5),
+        "buy": (dexSwapAccount, account3),
+        "sell": (account3, dexSwapAccount),
+        "exempt": (account3, dexSwapAccount),
+        "antiSnipe": (dexSwapAccount, account3),
+    }[path]
+
+    # Act
+    tx = oburn.transfer(recipient.address, transferAmount / 10, {"from": sender})
+
+    # Assert
+    gas_recorder(f"OnlyBurns.transfer[{path}]", tx)
@@ -0,0 +1,63 @@
+from scripts.holders import parse_wei, aggregate_holders, write_holder_snapshot, HolderSnapshot
+from web3 import Web3
+import pytest
+
+# Tests to make sure holder balances are converted to wei exactly, including values a float can't represent.
+def test_balances_are_parsed_exactly():
+    # Act / Assert
+    assert parse_wei("384622930.8") == 384622930800000000000000000
+    assert parse_wei("3000000000") == 3000000000 * 10**18
+    assert parse_wei("0.000000000000000001") == 1
+    assert parse_wei("1.5e-05") == 15000000000000
+
+    for invalid in ["", "-1", "abc", "1.0000000000000000001"]:
+        with pytest.raises(ValueError):
+            parse_wei(invalid)
+
+# Tests to make sure a binary snapshot holds the same balances as the holder files and can be looked up by address.
+def test_holder_snapshot_round_trip(tmp_path):
+    # Arrange
+    holderBalances = aggregate_holders()
+
+    # Act
+    write_holder_snapshot(tmp_path / "holders.bin", holderBalances)
+    snapshot = HolderSnapshot(tmp_path / "holders.bin")
+
+    # Assert
+    assert len(snapshot) == len(holderBalances)
+    assert snapshot.totalAmount == sum(holderBalances.values())
+    assert dict(snapshot) == holderBalances
+    for address, amount in holderBalances.items():
+        assert snapshot.get_balance(address) == amount
+    assert snapshot.get_balance("0x000000000000000000000000000000000000dEaD") == 0
+
+    snapshot.close()
+
+# Tests to make sure an address listed in several holder files (or twice in one), with any checksum casing, is summed
+# into a single balance and counted in the summary.
+def test_holders_are_merged_across_files(tmp_path, capsys):
+    # Arrange
+    sharedAddress = "0x006b7cb21bfa70e6a1f7b557da16fc24e5f965ea"
+    otherAddress = "0xd5c08681719445a5fdce2bda98b341a49050d821"
+    (tmp_path / "TBURNHolders.csv").write_text(
+        f"HolderAddress,Balance\n{sharedAddress},3000000000\n{otherAddress},1.5\n"
+    )
+    (tmp_path / "OBURNHolders.csv").write_text(
+        f"HolderAddress,Balance\n{Web3.toChecksumAddress(sharedAddress)},0.25\n{sharedAddress.upper().replace('0X', '0x')},1\n"
+    )
+
+    # Act
+    holderBalances = aggregate_holders(["TBURN", "OBURN"], tmp_path)
+    summary = capsys.readouterr().out
+
+    # Assert
+    assert holderBalances == {
+        Web3.toChecksumAddress(sharedAddress): parse_wei("3000000001.25"),
+        Web3.toChecksumAddress(otherAddress): parse_wei("1.5"),
+    }
+    assert "TBURN rows: 2" in summary
+    assert "OBURN rows: 2" in summary
+    assert "Total rows: 4" in summary
+    assert "Unique holders: 2" in summary
+    assert "Duplicate rows merged: 2 (across 1 addresses)" in summary
+    assert f"{Web3.toChecksumAddress(sharedAddress)}: 3 rows, 3000000001.25 total" in summary
@@ -0,0 +1,94 @@
+from scripts.helpers import get_account
+from scripts.deploy_merkle_distributor import deploy_merkle_distributor
+from scripts.merkle import ClaimTree
+from brownie import network, accounts, exceptions, chain
+from web3 import Web3
+import pytest
+
+# Tests to make sure holders can claim their balance with a Merkle proof built by scripts/merkle.py.
+def test_holders_can_claim(mocks):
+    # Arrange
+    account = get_account()
+    holders = [get_account(2), get_account(3), get_account(4)]
+    balances = {holder.address: Web3.toWei(100 * (i + 1), "ether") for i, holder in enumerate(holders)}
+    tree = ClaimTree(balances)
+
+    OBURN, _, _, _, _ = mocks
+    merkleDistributor = deploy_merkle_distributor(OBURN.address, "0x" + tree.root.hex())
+    OBURN.transfer(merkleDistributor.address, sum(balances.values()), {"from": account})
+
+    # Act
+    for holder in holders:
+        claim = tree.get_claim(holder.address)
+        merkleDistributor.claim(holder.address, claim["amount"], claim["proof"], {"from": holder})
+
+    # Assert
+    for holder in holders:
+        assert OBURN.balanceOf(holder.address) == balances[holder.address]
+        assert merkleDistributor.isClaimed(holder.address, balances[holder.address])
+    assert OBURN.balanceOf(merkleDistributor.address) == 0
+
+# Tests to make sure claims can't be made twice, for the wrong amount, or while paused.
+def test_invalid_claims_revert(mocks):
+    # Arrange
+    account = get_account()
+    holder = get_account(2)
+    balances = {holder.address: Web3.toWei(100, "ether"), get_account(3).address: Web3.toWei(50, "ether")}
+    tree = ClaimTree(balances)
+    claim = tree.get_claim(holder.address)
+
+    OBURN, _, _, _, _ = mocks
+    merkleDistributor = deploy_merkle_distributor(OBURN.address, "0x" + tree.root.hex())
+    OBURN.transfer(merkleDistributor.address, sum(balances.values()), {"from": account})
+
+    # Act / Assert
+    with pytest.raises(exceptions.VirtualMachineError) as ex:
+        merkleDistributor.claim(holder.address, claim["amount"] * 2, claim["proof"], {"from": holder})
+    assert "Invalid Merkle proof." in str(ex.value)
+
+    merkleDistributor.pauseClaims({"from": account})
+
+    with pytest.raises(exceptions.VirtualMachineError) as ex:
+        merkleDistributor.claim(holder.address, claim["amount"], claim["proof"], {"from": holder})
+    assert "Pausable: paused" in str(ex.value)
+
+    merkleDistributor.unpauseClaims({"from": account})
+    merkleDistributor.claim(holder.address, claim["amount"], claim["proof"], {"from": holder})
+
+    with pytest.raises(exceptions.VirtualMachineError) as ex:
+        merkleDistributor.claim(holder.address, claim["amount"], claim["proof"], {"from": holder})
+    assert "Tokens have already been claimed for this account." in str(ex.value)
+
+    assert OBURN.balanceOf(holder.address) == balances[holder.address]
+
+# Tests to make sure a holder who claimed under one root can't claim again under a new root, and only receives the
+# difference when the new root gives them more.
+def test_claims_are_tracked_across_roots(mocks):
+    # Arrange
+    account = get_account()
+    holder = get_account(2)
+    otherHolder = get_account(3)
+    firstTree = ClaimTree({holder.address: Web3.toWei(100, "ether")})
+    secondTree = ClaimTree({holder.address: Web3.toWei(100, "ether"), otherHolder.address: Web3.toWei(50, "ether")})
+    thirdTree = ClaimTree({holder.address: Web3.toWei(150, "ether"), otherHolder.address: Web3.toWei(50, "ether")})
+
+    OBURN, _, _, _, _ = mocks
+    merkleDistributor = deploy_merkle_distributor(OBURN.address, "0x" + firstTree.root.hex())
+    OBURN.transfer(merkleDistributor.address, Web3.toWei(1000, "ether"), {"from": account})
+
+    claim = firstTree.get_claim(holder.address)
+    merkleDistributor.claim(holder.address, claim["amount"], claim["proof"], {"from": holder})
+
+    # Act / Assert
+    merkleDistributor.setMerkleRoot("0x" + secondTree.root.hex(), {"from": account})
+    claim = secondTree.get_claim(holder.address)
+    with pytest.raises(exceptions.VirtualMachineError) as ex:
+        merkleDistributor.claim(holder.address, claim["amount"], claim["proof"], {"from": holder})
+    assert "Tokens have already been claimed for this account." in str(ex.value)
+
+    merkleDistributor.setMerkleRoot("0x" + thirdTree.root.hex(), {"from": account})
+    claim = thirdTree.get_claim(holder.address)
+    merkleDistributor.claim(holder.address, claim["amount"], claim["proof"], {"from": holder})
+
+    assert OBURN.balanceOf(holder.address) == Web3.toWei(150, "ether")
+    assert merkleDistributor.claimedAmount(holder.address) == Web3.toWei(150, "ether")
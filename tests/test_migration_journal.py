@@ -0,0 +1,86 @@
+from scripts.helpers import get_account
+from scripts.migration_journal import MigrationJournal
+from scripts.tx_pipeline import TransactionPipeline
+from brownie import network, accounts, exceptions, chain
+from web3 import Web3
+import pytest
+
+# Tests to make sure a restarted migration only sends the rows that never landed on chain.
+def test_journal_resumes_without_double_paying(mocks, tmp_path):
+    # Arrange
+    account = get_account()
+    recipient1 = get_account(2).address
+    recipient2 = get_account(3).address
+    recipient3 = get_account(4).address
+    balances = {recipient1: 100, recipient2: 200, recipient3: 300}
+
+    OBURN, _, _, _, _ = mocks
+
+    journal = MigrationJournal(tmp_path / "journal.jsonl", account.address)
+    journal.planned(balances)
+
+    pipeline = TransactionPipeline(
+        account,
+        onSending=journal.submitting,
+        onSent=journal.submitted,
+        onConfirmed=journal.confirmed,
+        onReverted=journal.failed,
+    )
+    pipeline.submit(OBURN.transfer, recipient1, balances[recipient1], label=[recipient1])
+    pipeline.flush()
+
+    # Simulate a crash after the second transfer was mined but before its receipt was journaled...
+    journal.submitting([recipient2], account.nonce)
+    tx = OBURN.transfer(recipient2, balances[recipient2], {"from": account})
+    journal.submitted([recipient2], tx.nonce, tx.txid)
+
+    # ...and after the third transfer was journaled but before it was broadcast
+    journal.submitting([recipient3], account.nonce)
+    journal.close()
+
+    # Act
+    resumedJournal = MigrationJournal(tmp_path / "journal.jsonl", account.address)
+    pendingBalances = resumedJournal.reconcile(balances)
+
+    # Assert
+    assert pendingBalances == {recipient3: balances[recipient3]}
+    assert resumedJournal.rows[recipient1]["state"] == "confirmed"
+    assert resumedJournal.rows[recipient2]["state"] == "confirmed"
+    assert OBURN.balanceOf(recipient2) == balances[recipient2]
+
+    with pytest.raises(ValueError):
+        resumedJournal.reconcile({**balances, recipient1: 101})
+
+# Tests to make sure a row whose resend was broadcast but never journaled isn't sent again.
+def test_journal_holds_rows_with_unjournaled_resends(mocks, tmp_path):
+    # Arrange
+    account = get_account()
+    recipient = get_account(2).address
+    otherRecipient = get_account(3).address
+    balances = {recipient: 100}
+
+    OBURN, _, _, _, _ = mocks
+
+    journal = MigrationJournal(tmp_path / "journal.jsonl", account.address)
+    journal.planned(balances)
+
+    # The first send is dropped and its nonce is taken by another transaction...
+    droppedNonce = account.nonce
+    journal.submitting([recipient], droppedNonce)
+    journal.submitted([recipient], droppedNonce, "0x" + "ab" * 32)
+    OBURN.transfer(otherRecipient, 1, {"from": account})
+
+    # ...then the resend is broadcast and mined, but the run crashes before its hash is journaled
+    journal.submitting([recipient], account.nonce)
+    OBURN.transfer(recipient, balances[recipient], {"from": account})
+    journal.close()
+
+    # Act
+    resumedJournal = MigrationJournal(tmp_path / "journal.jsonl", account.address)
+    pendingBalances = resumedJournal.reconcile(balances)
+
+    # Assert
+    assert pendingBalances == {}
+    assert resumedJournal.rows[recipient]["state"] == "unknown"
+    assert resumedJournal.rows[recipient]["nonces"] == [droppedNonce, droppedNonce + 1]
+    assert OBURN.balanceOf(recipient) == balances[recipient]
@@ -0,0 +1,62 @@
+from scripts.helpers import get_account
+from scripts.deploy_multicall import deploy_multicall
+from scripts.multicall import MulticallReader, read_holder_states
+from brownie import network, accounts, exceptions, chain
+from web3 import Web3
+import pytest
+
+# Tests to make sure holder balances and flags are read in bulk and match the individual getters.
+def test_reader_reads_holder_states(oburn_token):
+    # Arrange
+    account = get_account()
+    account3 = get_account(3)
+    account4 = get_account(4)
+
+    oburn = oburn_token
+    multicall = deploy_multicall()
+
+    oburn.transfer(account3.address, Web3.toWei(100, "ether"), {"from": account})
+    oburn.transfer(account4.address, Web3.toWei(200, "ether"), {"from": account})
+    oburn.blacklistOrUnblacklistUser(account4.address, True, {"from": account})
+    holders = [account.address, account3.address, account4.address]
+
+    # Act
+    reader = MulticallReader(multicall, batchSize=4)
+    states = read_holder_states(reader, oburn, holders)
+
+    # Assert
+    for holder in holders:
+        assert states[holder]["balance"] == oburn.balanceOf(holder)
+        assert states[holder]["oburnBlacklisted"] == oburn.getAddressBlacklisted(holder)
+        assert states[holder]["oburnExempt"] == oburn.getAddressExemptFromFees(holder)
+    assert states[account4.address]["oburnBlacklisted"]
+    assert states[account.address]["oburnExempt"]
+
+    # 9 calls in batches of 4
+    assert reader.callCount == 3
+
+# Tests to make sure reads are pinned to a block and a reverting call only fails itself, without splitting the batch.
+def test_reader_keeps_batches_with_reverting_calls(oburn_token):
+    # Arrange
+    account = get_account()
+    account3 = get_account(3)
+
+    oburn = oburn_token
+    multicall = deploy_multicall()
+
+    oburn.transfer(account3.address, Web3.toWei(100, "ether"), {"from": account})
+    snapshotBlock = chain.height
+    oburn.transfer(account3.address, Web3.toWei(100, "ether"), {"from": account})
+
+    # getDexSwapAddress is owner only, so it reverts when called through the multicall contract
+    calls = [(oburn.balanceOf, [account3.address]) for _ in range(7)] + [(oburn.getDexSwapAddress, [account3.address])]
+
+    # Act
+    reader = MulticallReader(multicall, batchSize=8)
+    results = reader.read(calls, block_identifier=snapshotBlock)
+
+    # Assert
+    assert results[:7] == [Web3.toWei(100, "ether")] * 7
+    assert results[7] is None
+    assert reader.batchSize == 8
+    assert reader.callCount == 1
@@ -0,0 +1,65 @@
+from scripts.helpers import get_account
+from scripts.deploy_batch_sender import deploy_batch_sender
+from scripts.plan_migration import plan_migration
+from brownie import network, accounts, exceptions, chain
+from web3 import Web3
+import pytest
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+# Tests to make sure the migration planner estimates gas for good rows and flags rows that would revert.
+def test_planner_flags_reverting_rows(oburn_token):
+    # Arrange
+    account = get_account()
+    account2 = get_account(2)
+    account3 = get_account(3)
+    account4 = get_account(4)
+
+    oburn = oburn_token
+    oburn.blacklistOrUnblacklistUser(account4.address, True, {"from": account})
+
+    holderBalances = {
+        account3.address: Web3.toWei(100, "ether"),
+        account4.address: Web3.toWei(200, "ether"),
+        ZERO_ADDRESS: Web3.toWei(300, "ether"),
+    }
+
+    # Act
+    plan = plan_migration(oburn, account, holderBalances, gasPriceGwei=5)
+
+    # Assert
+    failedRecipients = {result["recipient"]: result["error"] for result in plan["failedRows"]}
+    assert len(plan["failedRows"]) == 2
+    assert "Recipient is blacklisted from trading." in failedRecipients[account4.address]
+    assert failedRecipients[ZERO_ADDRESS] == "Transfer to the zero address"
+
+    assert plan["totalGas"] > 21000
+    assert plan["totalAmount"] == Web3.toWei(100, "ether")
+    assert plan["totalCost"] == plan["totalGas"] * Web3.toWei(5, "gwei")
+    assert plan["batchSize"] == 1
+    assert plan["batchEstimate"] == "transfer"
+    assert oburn.balanceOf(account3.address) == 0
+
+# Tests to make sure batches are sized from BatchSender.batchTransfer estimates once the batch sender is approved.
+def test_planner_sizes_batches_with_batch_sender(oburn_token):
+    # Arrange
+    account = get_account()
+    recipients = [get_account(2).address, get_account(3).address, get_account(4).address]
+    holderBalances = {recipient: Web3.toWei(100, "ether") for recipient in recipients}
+
+    oburn = oburn_token
+    batchSender = deploy_batch_sender()
+    oburn.approve(batchSender.address, sum(holderBalances.values()), {"from": account})
+
+    oneRecipientGas = batchSender.batchTransfer.estimate_gas(oburn, recipients[:1], [Web3.toWei(100, "ether")], {"from": account})
+    twoRecipientGas = batchSender.batchTransfer.estimate_gas(oburn, recipients[:2], [Web3.toWei(100, "ether")] * 2, {"from": account})
+    gasPerRecipient = twoRecipientGas - oneRecipientGas
+
+    # Act
+    plan = plan_migration(oburn, account, holderBalances, gasPriceGwei=5, batchSender=batchSender)
+
+    # Assert
+    assert plan["batchEstimate"] == "batchTransfer"
+    assert plan["batchSize"] == 3
+    assert plan["batchCount"] == 1
+    assert plan["batchedGas"] == oneRecipientGas - gasPerRecipient + 3 * gasPerRecipient
@@ -1,20 +1,19 @@
 from scripts.helpers import get_account
-from scripts.deploy import deploy_presale_and_exchange
-from scripts.deploy_mocks import deploy_mocks
+from scripts.whitelist_merkle import build_whitelist_tree, set_whitelist_root
 from brownie import network, accounts, exceptions, chain
 from web3 import Web3
 import pytest
 import time
 
 # Tests to make sure the presale and OBURN exchange contracts can be deployed successfully.
-def test_deployments():
+def test_deployments(mocks, presale_and_exchange):
     # Arrange
     account = get_account()
     account2 = get_account(2)
 
     # Act
-    TBURN, OBURN, USDC, _, _ = deploy_mocks()
-    oburnTokenPresale, oburnExchange = deploy_presale_and_exchange(TBURN.address, OBURN.address, account2.address, USDC.address)
+    TBURN, OBURN, USDC, _, _ = mocks
+    oburnTokenPresale, oburnExchange = presale_and_exchange
 
     # Assert
     assert oburnTokenPresale.token() == OBURN.address
@@ -22,13 +21,13 @@ def test_deployments():
     assert oburnExchange._oburn() == OBURN.address
 
 # Tests to make sure users can purchase OBURN in the presale with USDC during the whitelist sale.
-def test_user_can_purchase_OBURN_in_whitelist_presale():
+def test_user_can_purchase_OBURN_in_whitelist_presale(mocks, presale_and_exchange):
     # Arrange
     account = get_account()
     account2 = get_account(2)
 
-    TBURN, OBURN, USDC, _, _ = deploy_mocks()
-    oburnTokenPresale, oburnExchange = deploy_presale_and_exchange(TBURN.address, OBURN.address, account.address, USDC.address)
+    TBURN, OBURN, USDC, _, _ = mocks
+    oburnTokenPresale, oburnExchange = presale_and_exchange
 
     presaleOburnAmount = Web3.toWei(1000000000000000, "ether")
     USDCAmount = 1000000
@@ -53,13 +52,13 @@ def test_user_can_purchase_OBURN_in_whitelist_presale():
     assert oburnTokenPresale.usdcRaised() == USDCAmount
 
 # Tests to make sure users can purchase OBURN in the presale with USDC during the public sale.
-def test_user_can_purchase_OBURN_in_public_presale():
+def test_user_can_purchase_OBURN_in_public_presale(mocks, presale_and_exchange):
     # Arrange
     account = get_account()
     account2 = get_account(2)
 
-    TBURN, OBURN, USDC, _, _ = deploy_mocks()
-    oburnTokenPresale, oburnExchange = deploy_presale_and_exchange(TBURN.address, OBURN.address, account.address, USDC.address)
+    TBURN, OBURN, USDC, _, _ = mocks
+    oburnTokenPresale, oburnExchange = presale_and_exchange
 
     presaleOburnAmount = Web3.toWei(1000000000000000, "ether")
     USDCAmount = 3000000
@@ -84,14 +83,14 @@ def test_user_can_purchase_OBURN_in_public_presale():
     assert oburnTokenPresale.usdcRaised() == USDCAmount
 
 # Tests to make sure the owner can change parameters before starting the presale.
-def test_owner_can_update_parameters_for_presale():
+def test_owner_can_update_parameters_for_presale(mocks, presale_and_exchange):
     # Arrange
     account = get_account()
     account2 = get_account(2)
     account3 = get_account(3)
 
-    TBURN, OBURN, USDC, _, _ = deploy_mocks()
-    oburnTokenPresale, oburnExchange = deploy_presale_and_exchange(TBURN.address, OBURN.address, account.address, USDC.address)
+    TBURN, OBURN, USDC, _, _ = mocks
+    oburnTokenPresale, oburnExchange = presale_and_exchange
 
     presaleOburnAmount = Web3.toWei(1000000000000000, "ether")
     USDCAmount = 10000000
@@ -138,13 +137,13 @@ def test_owner_can_update_parameters_for_presale():
     assert USDC.balanceOf(account3.address) == 0
 
 # Tests to make sure the owner can end the sale and users cant purchase OBURN afterwards.
-def test_owner_can_end_sale():
+def test_owner_can_end_sale(mocks, presale_and_exchange):
     # Arrange
     account = get_account()
     account2 = get_account(2)
 
-    TBURN, OBURN, USDC, _, _ = deploy_mocks()
-    oburnTokenPresale, oburnExchange = deploy_presale_and_exchange(TBURN.address, OBURN.address, account.address, USDC.address)
+    TBURN, OBURN, USDC, _, _ = mocks
+    oburnTokenPresale, oburnExchange = presale_and_exchange
 
     presaleOburnAmount = Web3.toWei(1000000000000000, "ether")
     USDCAmount = 1000000
@@ -173,13 +172,13 @@ def test_owner_can_end_sale():
     assert "Whitelist sale and public sale are both not active" in str(ex.value)
 
 # Tests to make sure users have to approve the contract to spend USDC before purchasing OBURN in the presale.
-def test_user_must_approve_usdc():
+def test_user_must_approve_usdc(mocks, presale_and_exchange):
     # Arrange
     account = get_account()
     account2 = get_account(2)
 
-    TBURN, OBURN, USDC, _, _ = deploy_mocks()
-    oburnTokenPresale, oburnExchange = deploy_presale_and_exchange(TBURN.address, OBURN.address, account.address, USDC.address)
+    TBURN, OBURN, USDC, _, _ = mocks
+    oburnTokenPresale, oburnExchange = presale_and_exchange
 
     presaleOburnAmount = Web3.toWei(1000000000000000, "ether")
     USDCAmount = 1000000
@@ -196,13 +195,13 @@ def test_user_must_approve_usdc():
     assert "Sender hasn't allowed this contract to spend enough USDC for this presale purchase." in str(ex.value)    
 
 # Tests to make sure users can't purchase above the purchase caps.
-def test_user_cant_purchase_above_cap():
+def test_user_cant_purchase_above_cap(mocks, presale_and_exchange):
     # Arrange
     account = get_account()
     account2 = get_account(2)
 
-    TBURN, OBURN, USDC, _, _ = deploy_mocks()
-    oburnTokenPresale, oburnExchange = deploy_presale_and_exchange(TBURN.address, OBURN.address, account.address, USDC.address)
+    TBURN, OBURN, USDC, _, _ = mocks
+    oburnTokenPresale, oburnExchange = presale_and_exchange
 
     presaleOburnAmount = Web3.toWei(1000000000000000, "ether")
     USDCAmount = Web3.toWei(1000000000000, "ether")
@@ -233,14 +232,14 @@ def test_user_cant_purchase_above_cap():
     assert "Exceeds maximum tokens per address" in str(ex.value)    
 
 # Tests to make sure the owner cant change parameters after starting the presale.
-def test_owner_cant_update_parameters_after_presale_starts():
+def test_owner_cant_update_parameters_after_presale_starts(mocks, presale_and_exchange):
     # Arrange
     account = get_account()
     account2 = get_account(2)
     account3 = get_account(3)
 
-    TBURN, OBURN, USDC, _, _ = deploy_mocks()
-    oburnTokenPresale, oburnExchange = deploy_presale_and_exchange(TBURN.address, OBURN.address, account.address, USDC.address)
+    TBURN, OBURN, USDC, _, _ = mocks
+    oburnTokenPresale, oburnExchange = presale_and_exchange
 
     presaleOburnAmount = Web3.toWei(1000000000000000, "ether")
     USDCAmount = 10000000
@@ -287,3 +286,45 @@ def test_owner_cant_update_parameters_after_presale_starts():
     with pytest.raises(exceptions.VirtualMachineError) as ex:
         oburnTokenPresale.setPublicSaleOburnCap(presaleOburnAmount, {"from": account})
     assert "Sale parameters are locked" in str(ex.value)                
+
+# Tests to make sure addresses in the whitelist Merkle tree can buy with a proof and everyone else is turned away.
+def test_user_can_purchase_OBURN_with_whitelist_proof(mocks, presale_and_exchange, tmp_path):
+    # Arrange
+    account = get_account()
+    account2 = get_account(2)
+    account3 = get_account(3)
+
+    TBURN, OBURN, USDC, _, _ = mocks
+    oburnTokenPresale, oburnExchange = presale_and_exchange
+
+    whitelistFile = tmp_path / "whitelist.csv"
+    whitelistFile.write_text("Address\n" + "\n".join([account2.address.lower(), get_account(4).address, get_account(5).address]) + "\n")
+    tree = build_whitelist_tree(whitelistFile, tmp_path / "whitelist.json")
+
+    USDCAmount = 1000000
+    OBURN.transfer(oburnTokenPresale.address, Web3.toWei(1000000000000000, "ether"), {"from": account})
+    for buyer in [account2, account3]:
+        USDC.transfer(buyer.address, USDCAmount, {"from": account})
+        USDC.approve(oburnTokenPresale.address, USDCAmount, {"from": buyer})
+
+    oburnTokenPresale.lockSaleParameters({"from": account})
+    oburnTokenPresale.setWhitelistSaleActive(True, {"from": account})
+    set_whitelist_root(oburnTokenPresale, tree)
+
+    # Act
+    proof = tree.get_proof(account2.address)
+    oburnTokenPresale.buyTokens(account2.address, USDCAmount, proof, {"from": account2})
+
+    # Assert
+    assert oburnTokenPresale.getWhitelistMerkleRoot() == "0x" + tree.root.hex()
+    assert oburnTokenPresale.singleAddressCheckWhitelistProof(proof, {"from": account2})
+    assert OBURN.balanceOf(account2.address) == USDCAmount * 500000 * pow(10, 12)
+    assert tree.get_proof(account3.address) is None
+
+    with pytest.raises(exceptions.VirtualMachineError) as ex:
+        oburnTokenPresale.buyTokens(account3.address, USDCAmount, proof, {"from": account3})
+    assert "Beneficiary address is not whitelisted" in str(ex.value)
+
+    with pytest.raises(exceptions.VirtualMachineError) as ex:
+        oburnTokenPresale.buyTokens(account3.address, USDCAmount, {"from": account3})
+    assert "Beneficiary address is not whitelisted" in str(ex.value)
@@ -0,0 +1,118 @@
+from scripts.helpers import get_account
+from scripts.quote_engine import BurnSwapQuoter
+from brownie import network, accounts, exceptions, chain
+from web3 import Web3
+import pytest
+
+SLIPPAGE = 5
+
+# Pair swap fee (in basis points) BurnSwap is set to in direct mode - above the mock pair's 0.3%, so the swaps go
+# through and the quotes have to use BurnSwap's fee rather than the router's.
+DIRECT_SWAP_FEE = 50
+
+# Amount arguments for each BurnSwap amount mode: exact input with a minimum output, input only, and output only.
+def get_amount_modes(amountIn, quotedOut):
+    return [(quotedOut, amountIn), (0, amountIn), (quotedOut, 0)]
+
+# Tests to make sure buy quotes match what BurnSwap.purchaseOBURN actually does in every amount mode, through the
+# router and directly on the pair.
+@pytest.mark.parametrize("exempt", [False, True])
+@pytest.mark.parametrize("mode", [0, 1, 2])
+@pytest.mark.parametrize("direct", [False, True], ids=["router", "pair"])
+def test_buy_quotes_match_burn_swap(mocks, burn_swap, mode, exempt, direct):
+    # Arrange
+    account = get_account()
+    account2 = get_account(2)
+
+    OBURN, _, BUSD, _, mockUniswapV2Router02 = mocks
+    burnSwap, _ = burn_swap
+
+    amountBUSDIn = Web3.toWei(250, "ether")
+    BUSD.transfer(account2.address, amountBUSDIn * 2, {"from": account})
+    BUSD.approve(burnSwap.address, amountBUSDIn * 2, {"from": account2})
+    if exempt:
+        burnSwap.exemptAddressFromFees(account2.address, True, {"from": account})
+    if direct:
+        burnSwap.setDirectPairSwaps(True, DIRECT_SWAP_FEE, {"from": account})
+
+    quoter = BurnSwapQuoter(burnSwap, OBURN.address, BUSD.address)
+    quoter.sync_to_block()
+    amountOBURNOut = mockUniswapV2Router02.getAmountsOut(amountBUSDIn, [BUSD.address, OBURN.address])[1]
+    amountOBURN, amountBUSD = get_amount_modes(amountBUSDIn, amountOBURNOut)[mode]
+
+    # Act
+    quote = quoter.quote_buy_for(account2.address, amountOBURN, amountBUSD, SLIPPAGE)
+    initialBUSDBalance = BUSD.balanceOf(account2.address)
+    initialBurnSwapBUSDBalance = BUSD.balanceOf(burnSwap.address)
+    burnSwap.purchaseOBURN(amountOBURN, amountBUSD, SLIPPAGE, {"from": account2})
+
+    # Assert
+    assert OBURN.balanceOf(account2.address) == quote["oburnOut"]
+    assert BUSD.balanceOf(account2.address) == initialBUSDBalance - quote["busdIn"] + quote["busdRefund"]
+    assert BUSD.balanceOf(burnSwap.address) == initialBurnSwapBUSDBalance + quote["busdFee"]
+
+# Tests to make sure sell quotes match what BurnSwap.sellOBURN actually does in every amount mode, through the
+# router and directly on the pair.
+@pytest.mark.parametrize("exempt", [False, True])
+@pytest.mark.parametrize("mode", [0, 1, 2])
+@pytest.mark.parametrize("direct", [False, True], ids=["router", "pair"])
+def test_sell_quotes_match_burn_swap(mocks, burn_swap, mode, exempt, direct):
+    # Arrange
+    account = get_account()
+    account2 = get_account(2)
+
+    OBURN, _, BUSD, _, mockUniswapV2Router02 = mocks
+    burnSwap, _ = burn_swap
+
+    amountOBURNIn = Web3.toWei(250, "ether")
+    OBURN.transfer(account2.address, amountOBURNIn * 2, {"from": account})
+    OBURN.approve(burnSwap.address, amountOBURNIn * 2, {"from": account2})
+    if exempt:
+        burnSwap.exemptAddressFromFees(account2.address, True, {"from": account})
+    if direct:
+        burnSwap.setDirectPairSwaps(True, DIRECT_SWAP_FEE, {"from": account})
+
+    quoter = BurnSwapQuoter(burnSwap, OBURN.address, BUSD.address)
+    quoter.sync_to_block()
+    amountBUSDOut = mockUniswapV2Router02.getAmountsOut(amountOBURNIn, [OBURN.address, BUSD.address])[1]
+    amountBUSD, amountOBURN = get_amount_modes(amountOBURNIn, amountBUSDOut)[mode]
+
+    # Act
+    quote = quoter.quote_sell_for(account2.address, amountOBURN, amountBUSD, SLIPPAGE)
+    initialOBURNBalance = OBURN.balanceOf(account2.address)
+    initialOBURNBurnt = burnSwap.OBURNBurnt()
+    burnSwap.sellOBURN(amountOBURN, amountBUSD, SLIPPAGE, {"from": account2})
+
+    # Assert
+    assert BUSD.balanceOf(account2.address) == quote["busdOut"]
+    assert OBURN.balanceOf(account2.address) == initialOBURNBalance - quote["oburnIn"] + quote["oburnRefund"]
+    assert burnSwap.OBURNBurnt() == initialOBURNBurnt + quote["oburnBurnt"]
+
+# Tests to make sure the quoter only reloads reserves once per block, and that quotes that would revert raise instead.
+def test_quoter_refreshes_once_per_block(mocks, burn_swap):
+    # Arrange
+    account = get_account()
+
+    OBURN, _, BUSD, _, _ = mocks
+    burnSwap, pair = burn_swap
+
+    quoter = BurnSwapQuoter(burnSwap, OBURN.address, BUSD.address)
+
+    # Act / Assert
+    assert quoter.sync_to_block()
+    assert not quoter.sync_to_block()
+    initialReserveBUSD = quoter.reserveBUSD
+
+    BUSD.transfer(pair.address, Web3.toWei(1000, "ether"), {"from": account})
+    pair.sync({"from": account})
+
+    assert quoter.sync_to_block()
+    assert quoter.reserveBUSD == initialReserveBUSD + Web3.toWei(1000, "ether")
+
+    with pytest.raises(ValueError) as ex:
+        quoter.quote_buy(0, 1000, 100)
+    assert "Slippage must be less than 100." in str(ex.value)
+
+    with pytest.raises(ValueError) as ex:
+        quoter.quote_buy(Web3.toWei(1000, "ether"), 1000, SLIPPAGE)
+    assert "INSUFFICIENT_OUTPUT_AMOUNT" in str(ex.value)
@@ -0,0 +1,86 @@
+from scripts.helpers import get_account
+from scripts.deploy_multicall import deploy_multicall
+from scripts.multicall import MulticallReader
+from scripts.reconcile_migration import reconcile_migration
+from brownie import network, accounts, exceptions, chain
+from web3 import Web3
+import pytest
+
+# Tests to make sure the reconciliation report finds mismatched, missing and extra recipients.
+def test_reconciliation_reports_differences(oburn_token):
+    # Arrange
+    account = get_account()
+    account3 = get_account(3)
+    account4 = get_account(4)
+    account5 = get_account(5)
+    account6 = get_account(6)
+
+    oburn = oburn_token
+    reader = MulticallReader(deploy_multicall())
+
+    holderBalances = {
+        account3.address: Web3.toWei("384622930.8", "ether"),
+        account4.address: Web3.toWei(200, "ether"),
+        account5.address: Web3.toWei(300, "ether"),
+    }
+
+    fromBlock = chain.height + 1
+    oburn.transfer(account3.address, holderBalances[account3.address], {"from": account})
+    oburn.transfer(account4.address, holderBalances[account4.address] - 1, {"from": account})
+    oburn.transfer(account6.address, Web3.toWei(50, "ether"), {"from": account})
+
+    # Act
+    report = reconcile_migration(oburn, account.address, reader, holderBalances, fromBlock=fromBlock)
+
+    # Assert
+    assert report["matching"] == 1
+    assert report["mismatches"] == [
+        {"address": account4.address, "expected": Web3.toWei(200, "ether"), "actual": Web3.toWei(200, "ether") - 1}
+    ]
+    assert report["missing"] == [{"address": account5.address, "expected": Web3.toWei(300, "ether"), "actual": 0}]
+    assert report["unreadable"] == []
+    assert report["extra"] == [{"address": account6.address, "received": Web3.toWei(50, "ether")}]
+    assert report["holderDrift"] == -Web3.toWei(300, "ether") - 1
+    assert report["totalSupply"] == oburn.totalSupply()
+    assert report["supplyDrift"] == Web3.toWei(50, "ether")
+
+# Stand-in for a MulticallReader whose balanceOf call for one holder reverted, which the reader returns as None.
+class FailingReader:
+    def __init__(self, reader, failedIndex):
+        self.reader = reader
+        self.failedIndex = failedIndex
+
+    def read(self, calls, block_identifier=None):
+        results = self.reader.read(calls, block_identifier=block_identifier)
+        results[self.failedIndex] = None
+        return results
+
+# Tests to make sure balances that couldn't be read are reported and left out of the totals, and that reconciling
+# without the migration start block fails.
+def test_reconciliation_reports_unreadable_balances(oburn_token):
+    # Arrange
+    account = get_account()
+    account3 = get_account(3)
+    account4 = get_account(4)
+
+    oburn = oburn_token
+    reader = FailingReader(MulticallReader(deploy_multicall()), 1)
+
+    holderBalances = {account3.address: Web3.toWei(100, "ether"), account4.address: Web3.toWei(200, "ether")}
+
+    fromBlock = chain.height + 1
+    for holder, amount in holderBalances.items():
+        oburn.transfer(holder, amount, {"from": account})
+
+    # Act
+    report = reconcile_migration(oburn, account.address, reader, holderBalances, fromBlock=fromBlock)
+
+    # Assert
+    assert report["matching"] == 1
+    assert report["unreadable"] == [{"address": account4.address, "expected": Web3.toWei(200, "ether")}]
+    assert report["totalHeld"] == Web3.toWei(100, "ether")
+    assert report["holderDrift"] == 0
+
+    with pytest.raises(Exception) as ex:
+        reconcile_migration(oburn, account.address, reader, holderBalances, fromBlock=None)
+    assert "MIGRATION_START_BLOCK" in str(ex.value)
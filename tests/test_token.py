@@ -1,20 +1,18 @@
 from scripts.helpers import get_account
-from scripts.deploy_token import deploy_oburn_token
-from scripts.deploy_mocks import deploy_mocks
-from brownie import network, accounts, exceptions, chain
+from brownie import network, accounts, exceptions, chain, MockUniswapV2Pair
 from web3 import Web3
 import pytest
 import time
 
 # Tests to make sure users can transfer oburn
-def test_users_can_transfer_oburn():
+def test_users_can_transfer_oburn(mocks, oburn_token):
     # Arrange
     account = get_account()
     account2 = get_account(2)
     account3 = get_account(3)
 
-    _, _, USDC, mockUniswapV2Factory, mockUniswapV2Router02 = deploy_mocks()
-    oburn = deploy_oburn_token(mockUniswapV2Router02.address, account2.address, USDC.address)
+    _, _, USDC, mockUniswapV2Factory, mockUniswapV2Router02 = mocks
+    oburn = oburn_token
 
     # Act
     transferAmount = 10000000000
@@ -27,14 +25,14 @@ def test_users_can_transfer_oburn():
     assert oburn.balanceOf(account3.address) == transferAmount / 2
 
 # Tests to make sure owner can blacklist users from trading
-def test_owner_can_blacklist_users():
+def test_owner_can_blacklist_users(mocks, oburn_token):
     # Arrange
     account = get_account()
     account2 = get_account(2)
     account3 = get_account(3)
 
-    _, _, USDC, mockUniswapV2Factory, mockUniswapV2Router02 = deploy_mocks()
-    oburn = deploy_oburn_token(mockUniswapV2Router02.address, account2.address, USDC.address)
+    _, _, USDC, mockUniswapV2Factory, mockUniswapV2Router02 = mocks
+    oburn = oburn_token
 
     # Act / Assert
     transferAmount = 10000000000
@@ -60,37 +58,143 @@ def test_owner_can_blacklist_users():
     assert oburn.balanceOf(account3.address) == transferAmount / 2    
 
 # Tests to make sure owner can disable  and enable DEX trading
-def test_owner_can_disable_and_enable_dex_trading():
+def test_owner_can_disable_and_enable_dex_trading(mocks, oburn_token):
     # Arrange
     account = get_account()
     account2 = get_account(2)
     account3 = get_account(3)
 
-    _, _, USDC, mockUniswapV2Factory, mockUniswapV2Router02 = deploy_mocks()
-    oburn = deploy_oburn_token(mockUniswapV2Router02.address, account2.address, USDC.address)
+    _, _, USDC, mockUniswapV2Factory, mockUniswapV2Router02 = mocks
+    oburn = oburn_token
+    pair = MockUniswapV2Pair.at(oburn.quickSwapPair())
 
     # Act / Assert
     transferAmount = 1000000000000000
     oburn.transfer(account3.address, transferAmount, {"from": account})
+    USDC.transfer(account3.address, transferAmount, {"from": account})
     oburn.enableTrading({"from": account})
 
-    # Factory is also the pair for testing purposes
     with pytest.raises(exceptions.VirtualMachineError) as ex:
-        oburn.transfer(mockUniswapV2Factory.address, transferAmount / 4, {"from": account3})
+        oburn.transfer(pair.address, transferAmount / 4, {"from": account3})
     assert "DEX Trading is currently disabled. You must trade directly through the Only Burns DApp." in str(ex.value)  
 
     # Someone excluded from fees like the owner can still trade on the DEX
-    oburn.transfer(mockUniswapV2Factory.address, transferAmount, {"from": account})
+    oburn.transfer(pair.address, transferAmount, {"from": account})
+    USDC.transfer(pair.address, transferAmount, {"from": account})
+    pair.sync({"from": account})
 
+    # Buying through the pair sends OBURN from the pair to the buyer
+    USDC.approve(mockUniswapV2Router02.address, transferAmount / 4, {"from": account3})
     with pytest.raises(exceptions.VirtualMachineError) as ex:
-        oburn.transfer(account3.address, transferAmount / 4, {"from": mockUniswapV2Factory})
+        mockUniswapV2Router02.swapExactTokensForTokens(
+            transferAmount / 4, 0, [USDC.address, oburn.address], account3.address, chain.time() + 60, {"from": account3}
+        )
     assert "DEX Trading is currently disabled. You must trade directly through the Only Burns DApp." in str(ex.value)      
 
     oburn.enableOrDisableDEXTrading(True, {"from": account})
 
-    oburn.transfer(mockUniswapV2Factory.address, transferAmount / 2, {"from": account3})  
+    oburn.transfer(pair.address, transferAmount / 2, {"from": account3})  
 
     sellFee = (transferAmount / 2 * 10) / pow(10, 10)
     assert oburn.balanceOf(account.address) == oburn.totalSupply() - transferAmount * 2 + sellFee
     assert oburn.balanceOf(account3.address) == transferAmount / 2
-    assert oburn.balanceOf(mockUniswapV2Factory.address) == transferAmount * 3 / 2 - sellFee
\ No newline at end of file
+    assert oburn.balanceOf(pair.address) == transferAmount * 3 / 2 - sellFee
+
+# Tests to make sure the blacklist, fee exemption and DEX flags of an address are set and cleared independently.
+def test_address_flags_are_independent(mocks, oburn_token):
+    # Arrange
+    account = get_account()
+    account3 = get_account(3)
+
+    oburn = oburn_token
+
+    # Act
+    oburn.addDexSwapAddress(account3.address, True, {"from": account})
+    oburn.exemptAddressFromFees(account3.address, True, {"from": account})
+    oburn.blacklistOrUnblacklistUser(account3.address, True, {"from": account})
+    oburn.exemptAddressFromFees(account3.address, False, {"from": account})
+
+    # Assert
+    assert oburn._dexSwapAddresses(account3.address)
+    assert oburn.getDexSwapAddress(account3.address, {"from": account})
+    assert oburn.getAddressBlacklisted(account3.address)
+    assert not oburn.getAddressExemptFromFees(account3.address)
+    assert oburn._dexSwapAddresses(oburn.quickSwapPair())
+    assert oburn.getAddressExemptFromFees(account.address)
+
+    with pytest.raises(exceptions.VirtualMachineError) as ex:
+        oburn.blacklistOrUnblacklistUser(account3.address, True, {"from": account})
+    assert "Already set to this value." in str(ex.value)
+
+# Tests to make sure buys in the first blocks after trading is enabled pay the anti-snipe fee without changing the
+# configured fees, and pay the normal fee once the window has passed.
+def test_anti_snipe_fee_applies_only_in_first_blocks(mocks, oburn_token):
+    # Arrange
+    account = get_account()
+    account3 = get_account(3)
+    account4 = get_account(4)
+
+    oburn = oburn_token
+
+    transferAmount = 10000000000
+    oburn.addDexSwapAddress(account4.address, True, {"from": account})
+    oburn.transfer(account4.address, transferAmount * 2, {"from": account})
+    oburn.updateBuyFee(5, {"from": account})
+
+    # Act
+    oburn.enableTrading({"from": account})
+    oburn.transfer(account3.address, transferAmount, {"from": account4})
+    antiSnipeBalance = oburn.balanceOf(account3.address)
+    chain.mine(4)
+    oburn.transfer(account3.address, transferAmount, {"from": account4})
+
+    # Assert
+    assert antiSnipeBalance == transferAmount - transferAmount * 99 // 10**10
+    assert oburn.balanceOf(account3.address) == antiSnipeBalance + transferAmount - transferAmount * 5 // 10**10
+    assert oburn.buyFee() == 5
+    assert oburn.sellFee() == 10
+
+# Tests to make sure buy and sell fees are held by the token contract until they're swept to the Service Wallet and
+# the Dead Wallet.
+def test_fees_accrue_until_swept(mocks, oburn_token):
+    # Arrange
+    account = get_account()
+    account2 = get_account(2)
+    account3 = get_account(3)
+    account4 = get_account(4)
+
+    oburn = oburn_token
+    deadWallet = "0x000000000000000000000000000000000000dEaD"
+
+    transferAmount = Web3.toWei(100, "ether")
+    fee = transferAmount * 10 // 10**10
+    oburn.addDexSwapAddress(account4.address, True, {"from": account})
+    oburn.transfer(account4.address, transferAmount, {"from": account})
+    oburn.transfer(account3.address, transferAmount, {"from": account})
+    oburn.enableOrDisableDEXTrading(True, {"from": account})
+    oburn.enableTrading({"from": account})
+    chain.mine(4)
+    initialServiceWalletBalance = oburn.balanceOf(account2.address)
+    initialTotalSupply = oburn.totalSupply()
+
+    # Act
+    buyTx = oburn.transfer(account3.address, transferAmount, {"from": account4})
+    oburn.transfer(account4.address, transferAmount, {"from": account3})
+    pendingFees = oburn.pendingFees()
+    pendingBalance = oburn.balanceOf(oburn.address)
+    pendingTotalSupply = oburn.totalSupply()
+    oburn.sweepFees({"from": account3})
+
+    # Assert
+    assert len(buyTx.events["Transfer"]) == 2
+    assert buyTx.events["Transfer"][1]["to"] == oburn.address
+    assert pendingFees == (fee, fee)
+    assert pendingBalance == fee * 2
+    assert pendingTotalSupply == initialTotalSupply - fee
+    assert oburn.balanceOf(account3.address) == transferAmount * 2 - fee - transferAmount
+    assert oburn.balanceOf(account4.address) == transferAmount - fee
+    assert oburn.pendingFees() == (0, 0)
+    assert oburn.balanceOf(oburn.address) == 0
+    assert oburn.balanceOf(account2.address) == initialServiceWalletBalance + fee
+    assert oburn.balanceOf(deadWallet) == fee
+    assert oburn.totalSupply() == pendingTotalSupply
@@ -0,0 +1,87 @@
+from scripts.helpers import get_account
+from brownie import network, accounts, exceptions, chain
+from web3 import Web3
+import pytest
+
+# The simulator needs NumPy (see requirements.txt), which brownie doesn't install
+pytest.importorskip("numpy")
+
+from scripts.quote_engine import ROUTER_SWAP_FEE
+from scripts.tokenomics_sim import (
+    ExactSimulator,
+    generate_order_flow,
+    get_max_relative_error,
+    get_path_orders,
+    replay_burn_swap_orders,
+    replay_onlyburns_fees,
+    simulate_vectorized,
+)
+
+# Pair swap fee (in basis points) BurnSwap is set to in direct mode. The mock pair charges 0.3%, so anything at or
+# above 30 swaps successfully, and a fee other than the router's checks the simulators use it.
+DIRECT_SWAP_FEE = 50
+
+# Tests to make sure the simulators match BurnSwap trades replayed on chain, through the router and directly on the
+# pair, and that the vectorized simulator matches the exact one.
+@pytest.mark.parametrize("exempt", [False, True])
+@pytest.mark.parametrize("direct", [False, True], ids=["router", "pair"])
+def test_simulator_matches_burn_swap(mocks, burn_swap, exempt, direct):
+    # Arrange
+    account = get_account()
+    account2 = get_account(2)
+
+    OBURN, _, BUSD, _, _ = mocks
+    burnSwap, pair = burn_swap
+
+    OBURN.transfer(account2.address, Web3.toWei(100000, "ether"), {"from": account})
+    BUSD.transfer(account2.address, Web3.toWei(100000, "ether"), {"from": account})
+    OBURN.approve(burnSwap.address, Web3.toWei(100000, "ether"), {"from": account2})
+    BUSD.approve(burnSwap.address, Web3.toWei(100000, "ether"), {"from": account2})
+    if exempt:
+        burnSwap.exemptAddressFromFees(account2.address, True, {"from": account})
+    if direct:
+        burnSwap.setDirectPairSwaps(True, DIRECT_SWAP_FEE, {"from": account})
+
+    orders = generate_order_flow(20, 4, seed=1, burnSwapShare=1.0, exemptShare=1.0 if exempt else 0.0)
+    reserve0, reserve1, _ = pair.getReserves()
+    reserveOBURN, reserveBUSD = (reserve0, reserve1) if pair.token0() == OBURN.address else (reserve1, reserve0)
+    swapFee = DIRECT_SWAP_FEE if direct else ROUTER_SWAP_FEE
+
+    # Act
+    mismatches = replay_burn_swap_orders(burnSwap, pair, OBURN, BUSD, account2, get_path_orders(orders))
+    vectorizedTotals = simulate_vectorized(orders, reserveOBURN, reserveBUSD, OBURN.buyFee(), OBURN.sellFee(), swapFee)
+    exactSimulator = ExactSimulator(reserveOBURN, reserveBUSD, OBURN.buyFee(), OBURN.sellFee(), swapFee)
+    exactSimulator.run(get_path_orders(orders))
+
+    # Assert
+    assert mismatches == []
+    assert exactSimulator.reserveBUSD == BUSD.balanceOf(pair.address)
+    assert exactSimulator.serviceBUSD == burnSwap.BUSDCollected()
+    assert exactSimulator.burntOBURN == burnSwap.OBURNBurnt()
+    assert get_max_relative_error(vectorizedTotals, exactSimulator.totals()) < 1e-9
+
+# Tests to make sure the simulator's OnlyBurns fees match the fees OnlyBurns takes from transfers to and from a DEX
+# swap address.
+def test_simulator_matches_onlyburns_fees(mocks, oburn_token):
+    # Arrange
+    account = get_account()
+    account3 = get_account(3)
+    account4 = get_account(4)
+
+    oburn = oburn_token
+    oburn.addDexSwapAddress(account4.address, True, {"from": account})
+    oburn.transfer(account4.address, Web3.toWei(100000, "ether"), {"from": account})
+    oburn.transfer(account3.address, Web3.toWei(100000, "ether"), {"from": account})
+    oburn.enableOrDisableDEXTrading(True, {"from": account})
+    oburn.enableTrading({"from": account})
+    chain.mine(4)
+
+    amounts = [Web3.toWei(100, "ether"), 123456789123456789, 9999999999, 1, Web3.toWei(5000, "ether")]
+    isBuy = [True, False, True, False, False]
+
+    # Act
+    mismatches = replay_onlyburns_fees(oburn, account4, account3, amounts, isBuy)
+
+    # Assert
+    assert mismatches == []
+    assert oburn.pendingFees()[1] > 0
@@ -0,0 +1,97 @@
+from scripts.helpers import get_account
+from scripts.tx_pipeline import RESEND_GAS_PRICE_BUMP, TransactionPipeline, TransactionReverted
+from brownie import network, accounts, exceptions, chain
+from brownie.network.transaction import Status
+from web3 import Web3
+import pytest
+
+# Tests to make sure the pipeline sends every transaction with sequential nonces and collects all receipts.
+def test_pipeline_sends_all_transactions(mocks):
+    # Arrange
+    account = get_account()
+    recipients = [get_account(2).address, get_account(3).address, get_account(4).address]
+    amount = Web3.toWei(10, "ether")
+
+    OBURN, _, _, _, _ = mocks
+    startingNonce = account.nonce
+
+    # Act
+    pipeline = TransactionPipeline(account, maxInFlight=2)
+    for recipient in recipients * 2:
+        pipeline.submit(OBURN.transfer, recipient, amount)
+    receipts = pipeline.flush()
+
+    # Assert
+    assert len(receipts) == len(recipients) * 2
+    assert sorted(tx.nonce for tx in receipts) == list(range(startingNonce, startingNonce + len(recipients) * 2))
+    assert account.nonce == startingNonce + len(recipients) * 2
+    for recipient in recipients:
+        assert OBURN.balanceOf(recipient) == amount * 2
+
+# Tests to make sure the pipeline stops accepting transactions after the first revert.
+def test_pipeline_stops_on_revert(mocks):
+    # Arrange
+    account = get_account()
+    account2 = get_account(2)
+    recipient = get_account(3).address
+
+    OBURN, _, _, _, _ = mocks
+    OBURN.transfer(account2.address, 100, {"from": account})
+
+    # Act / Assert
+    pipeline = TransactionPipeline(account2)
+    pipeline.submit(OBURN.transfer, recipient, 100)
+
+    # The revert is reported either while sending or once the receipt is collected
+    with pytest.raises(TransactionReverted):
+        pipeline.submit(OBURN.transfer, recipient, 100)
+        pipeline.flush()
+
+    with pytest.raises(TransactionReverted):
+        pipeline.submit(OBURN.transfer, recipient, 1)
+
+    assert len(pipeline.receipts) == 1
+    assert OBURN.balanceOf(recipient) == 100
+
+# Stand-in for a contract function whose transactions never get mined, recording the parameters of every send.
+class DroppedFunction:
+    def __init__(self, gasPrice):
+        self.gasPrice = gasPrice
+        self.sent = []
+
+    def __call__(self, *args):
+        txParams = args[-1]
+        self.sent.append(txParams)
+        return type("DroppedTx", (), {
+            "txid": f"0x{len(self.sent):064x}",
+            "gas_price": txParams.get("gas_price", self.gasPrice),
+            "status": Status.Pending,
+        })()
+
+# Tests to make sure a transaction dropped from the mempool is resent with the same nonce and a higher gas price, and
+# that the pipeline stops once it has been resent maxRetries times.
+def test_pipeline_resends_dropped_transactions():
+    # Arrange
+    account = get_account()
+    droppedFunction = DroppedFunction(Web3.toWei(10, "gwei"))
+    pipeline = TransactionPipeline(account, maxRetries=2)
+    pipeline._is_dropped_from_mempool = lambda entry: True
+    nonce = account.nonce
+
+    # Act
+    pipeline.submit(droppedFunction, "holder")
+    pipeline._collect()
+
+    with pytest.raises(TransactionReverted) as ex:
+        pipeline._collect()
+
+    # Assert
+    assert "was dropped 2 times" in str(ex.value)
+    assert [txParams["nonce"] for txParams in droppedFunction.sent] == [nonce] * 3
+    assert "gas_price" not in droppedFunction.sent[0]
+    assert droppedFunction.sent[1]["gas_price"] == int(Web3.toWei(10, "gwei") * (1 + RESEND_GAS_PRICE_BUMP)) + 1
+    assert droppedFunction.sent[2]["gas_price"] == int(droppedFunction.sent[1]["gas_price"] * (1 + RESEND_GAS_PRICE_BUMP)) + 1
+
+    with pytest.raises(TransactionReverted) as ex:
+        pipeline.submit(droppedFunction, "holder")
+    assert "Pipeline is stopped" in str(ex.value)